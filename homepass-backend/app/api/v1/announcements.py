@@ -1,24 +1,41 @@
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
 from datetime import datetime, timezone, timedelta
-from typing import List, Optional
+from pathlib import Path
+from typing import List, Literal, Optional
 
-from fastapi import APIRouter, Body, Depends, HTTPException, Query
+import httpx
+
+from fastapi import APIRouter, BackgroundTasks, Body, Depends, HTTPException, Query
+from fastapi.responses import PlainTextResponse, StreamingResponse
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
+from app.config import settings
 from app.database import get_db
-from app.models import Announcement, User
+from app.dependencies.auth import get_current_user
+from app.models import Announcement, CommuteTime, User
 from app.schemas import (
     AnnouncementDetailSchema,
     AnnouncementListResponse,
     AnnouncementSchema,
     AnnouncementScrapeRequest,
+    ScrapeJobSchema,
+    ScrapeScheduleSchema,
+    ScrapeStatusResponse,
 )
 from app.schemas.place import CommuteInfoResponse
-from app.services.scraper_runner import scraper_runner
-from app.services.naver_maps import get_naver_maps_service, NaverMapsService
+from app.services.commute_matrix import base_matches, is_commute_matrix_running, run_commute_matrix_job
+from app.services import scrape_jobs
+from app.services.scrape_scheduler import scrape_scheduler
+from app.services.scraper_runner import DEFAULT_SCRAPER_DIR, scraper_runner
+from app.services.user_location import get_user_coords, stored_commute_base_coords
+from app.services.naver_maps import get_naver_maps_service, NaverApiError, NaverMapsService, upstream_error
+from app.utils.geo import within_radius
+from app.utils.polyline import format_route_path
 
 logger = logging.getLogger(__name__)
 
@@ -113,6 +130,15 @@ def get_announcements(
     within_days: int | None = Query(None, ge=0, description="N일 이내 마감 공고만 (application_end_date <= now + N days)"),
     order_by: str | None = Query(None, description="정렬 기준: post_date|scraped_at|application_end_date|title"),
     order: str = Query("asc", description="정렬 방향: asc|desc"),
+    near_lat: float | None = Query(None, description="반경 필터 중심 위도 (near_lng, radius_m과 함께 사용)"),
+    near_lng: float | None = Query(None, description="반경 필터 중심 경도"),
+    radius_m: float | None = Query(None, gt=0, description="반경 (미터) - 좌표 없는 공고는 제외"),
+    max_commute_minutes: int | None = Query(
+        None, ge=1, description="출퇴근 시간 상한 (분) - 출퇴근 시간 행렬에 결과가 없는 공고는 제외"
+    ),
+    changed_since: datetime | None = Query(
+        None, description="이 시각 이후 내용이 새로 생기거나 바뀐 공고만 (content_changed_at 기준, 알림용)"
+    ),
     db: Session = Depends(get_db),
 ) -> AnnouncementListResponse:
     stmt = select(Announcement).order_by(Announcement.application_end_date.asc())
@@ -133,6 +159,13 @@ def get_announcements(
                 if (end_at := _ensure_aware(ann.application_end_date)) is not None and end_at <= bound
             ]
 
+    if changed_since is not None:
+        since = _ensure_aware(changed_since)
+        announcements = [
+            ann for ann in announcements
+            if (changed_at := _ensure_aware(ann.content_changed_at)) is not None and changed_at >= since
+        ]
+
     if region:
         region_lower = region.lower()
         announcements = [
@@ -145,6 +178,43 @@ def get_announcements(
             ann for ann in announcements if (ann.housing_type or "").lower().find(housing_lower) != -1
         ]
 
+    if near_lat is not None and near_lng is not None and radius_m is not None:
+        located = [
+            ann for ann in announcements if ann.latitude is not None and ann.longitude is not None
+        ]
+        if located:
+            idx, _ = within_radius(
+                near_lat,
+                near_lng,
+                [float(ann.latitude) for ann in located],
+                [float(ann.longitude) for ann in located],
+                radius_m,
+            )
+            # 거리 필터만 적용하고 기존 순서는 유지
+            inside = set(idx.tolist())
+            announcements = [ann for i, ann in enumerate(located) if i in inside]
+        else:
+            announcements = []
+
+    if max_commute_minutes is not None:
+        # 배치 작업(app.services.commute_matrix)이 미리 계산한 결과만 사용 - 외부 API 호출 없음
+        # 사용자는 이 필터를 쓸 때만 조회 (공개 목록 조회에 사용자 조회/404가 끼지 않도록)
+        current_user = get_current_user(db)
+        # 현재 기준지 좌표로 계산된 결과만 (주소 변경 후 다음 배치 전까지 이전 위치 결과가 섞이지 않도록)
+        base = stored_commute_base_coords(current_user)
+        reachable = set()
+        if base is not None:
+            reachable = set(
+                db.scalars(
+                    select(CommuteTime.announcement_id).where(
+                        CommuteTime.user_id == current_user.user_id,
+                        CommuteTime.duration_ms <= max_commute_minutes * 60000,
+                        base_matches(base),
+                    )
+                )
+            )
+        announcements = [ann for ann in announcements if ann.announcement_id in reachable]
+
     # 정렬 처리 (server-side)
     if order_by:
         order_lower = (order or "asc").lower()
@@ -193,12 +263,10 @@ def trigger_announcements_scrape(
     
     try:
         logger.info("📞 scraper_runner.start() 호출 중...")
-        scraper_runner.start(payload.start_board_id, payload.days_limit)
+        job = scraper_runner.start(payload.start_board_id, payload.days_limit)
         logger.info("✅ scraper_runner.start() 호출 성공")
-        return {"status": "started"}
-    except RuntimeError as exc:
-        logger.warning(f"⚠️ 스크래퍼 이미 실행 중: {exc}")
-        raise HTTPException(status_code=409, detail=str(exc)) from exc
+        # 다른 실행이 진행 중이면 queued 상태로 대기 (이미 대기 중인 작업이 있으면 그 작업)
+        return {"status": job.status, "job_id": job.job_id}
     except FileNotFoundError as exc:
         logger.error(f"❌ 파일을 찾을 수 없음: {exc}")
         raise HTTPException(status_code=500, detail=str(exc)) from exc
@@ -207,6 +275,141 @@ def trigger_announcements_scrape(
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
 
+@router.get("/scrape/status", response_model=ScrapeStatusResponse)
+def get_scrape_status(
+    tail: int = Query(0, ge=0, le=500, description="함께 반환할 최근 출력 라인 수"),
+) -> ScrapeStatusResponse:
+    """현재(또는 마지막) 스크래핑 실행의 단계, 경과 시간, 수집/추출 건수"""
+    if scraper_runner.is_running():
+        status = scraper_runner.get_status()
+        logs = scraper_runner.get_logs(limit=tail) if tail else []
+        return ScrapeStatusResponse(**status, logs=logs)
+
+    # 이 워커가 실행 중이 아니면 DB의 최근 작업 기준 (다른 워커/호스트가 실행 중일 수 있음)
+    job = scrape_jobs.latest_job()
+    if job is None:
+        return ScrapeStatusResponse(**scraper_runner.get_status())
+    status = scrape_jobs.job_to_status(job)
+    local = scraper_runner.get_status()
+    logs = scraper_runner.get_logs(limit=tail) if tail and local["job_id"] == job.job_id else []
+    return ScrapeStatusResponse(**status, logs=logs)
+
+
+@router.get("/scrape/jobs", response_model=List[ScrapeJobSchema])
+def list_scrape_jobs(
+    limit: int = Query(20, ge=1, le=200),
+) -> List[ScrapeJobSchema]:
+    """스크래핑 작업 기록 (최신순)"""
+    return [ScrapeJobSchema.model_validate(job) for job in scrape_jobs.list_jobs(limit)]
+
+
+@router.get("/scrape/schedule", response_model=ScrapeScheduleSchema)
+def get_scrape_schedule() -> ScrapeScheduleSchema:
+    """주기 스크래핑 스케줄 (다음 실행 시각, 백오프 단계, 마지막 체크포인트)"""
+    schedule = scrape_scheduler.get_state()
+    if schedule is None:
+        return ScrapeScheduleSchema(enabled=settings.SCRAPE_SCHEDULER_ENABLED)
+    return ScrapeScheduleSchema(**scrape_scheduler.describe(schedule))
+
+
+@router.get("/scrape/jobs/{job_id}", response_model=ScrapeJobSchema)
+def get_scrape_job(job_id: int) -> ScrapeJobSchema:
+    job = scrape_jobs.get_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="스크래핑 작업을 찾을 수 없습니다.")
+    return ScrapeJobSchema.model_validate(job)
+
+
+@router.post("/scrape/{job_id}/cancel", response_model=ScrapeJobSchema, status_code=202)
+def cancel_scrape_job(job_id: int) -> ScrapeJobSchema:
+    """
+    스크래핑 작업 취소
+
+    대기 중이면 즉시 cancelled, 실행 중이면 스파이더/추출기 프로세스 그룹을 종료합니다.
+    """
+    job = scraper_runner.cancel(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="스크래핑 작업을 찾을 수 없습니다.")
+    if job.status in scrape_jobs.FINISHED_STATES and not job.cancel_requested:
+        raise HTTPException(status_code=409, detail=f"이미 종료된 작업입니다 ({job.status}).")
+    return ScrapeJobSchema.model_validate(job)
+
+
+@router.get("/scrape/logs")
+async def stream_scrape_logs(
+    after_seq: int = Query(0, ge=0, description="이 번호 이후의 라인부터 전송 (재연결 시 마지막 id)"),
+):
+    """
+    스크래퍼 출력 실시간 tail (Server-Sent Events)
+
+    각 라인은 `id: <seq>` / `data: <json>` 이벤트로 전송되며,
+    실행이 끝나면 `event: end` 이벤트(최종 상태 포함)를 보내고 연결을 닫습니다.
+    """
+
+    async def event_stream():
+        last_seq = after_seq
+        while True:
+            for entry in scraper_runner.get_logs(after_seq=last_seq):
+                last_seq = entry["seq"]
+                yield f"id: {last_seq}\ndata: {json.dumps(entry, ensure_ascii=False)}\n\n"
+            if not scraper_runner.is_running():
+                # 종료 직전 출력까지 모두 보낸 뒤 종료
+                for entry in scraper_runner.get_logs(after_seq=last_seq):
+                    last_seq = entry["seq"]
+                    yield f"id: {last_seq}\ndata: {json.dumps(entry, ensure_ascii=False)}\n\n"
+                status = scraper_runner.get_status()
+                yield f"event: end\ndata: {json.dumps(status, ensure_ascii=False)}\n\n"
+                return
+            await asyncio.sleep(0.5)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@router.get("/scrape/metrics", response_class=PlainTextResponse)
+async def get_scrape_metrics() -> PlainTextResponse:
+    """
+    스크래퍼 수집 지표 (Prometheus 텍스트 형식, homepass_scraper/metrics.py)
+
+    SCRAPER_METRICS_URL이 있으면 스크래퍼 HTTP 엔드포인트를 프록시하고,
+    없으면 스크래퍼가 주기적으로 갱신하는 파일(SCRAPER_METRICS_FILE)을 그대로 반환합니다.
+    """
+    if settings.SCRAPER_METRICS_URL:
+        try:
+            async with httpx.AsyncClient(timeout=5.0) as client:
+                response = await client.get(settings.SCRAPER_METRICS_URL)
+            response.raise_for_status()
+        except httpx.HTTPError as exc:
+            logger.warning(f"⚠️ 스크래퍼 지표 조회 실패 ({settings.SCRAPER_METRICS_URL}): {exc}")
+            raise HTTPException(status_code=502, detail="스크래퍼 지표를 가져오지 못했습니다.")
+        return PlainTextResponse(response.text, media_type=PROMETHEUS_CONTENT_TYPE)
+
+    path = Path(
+        settings.SCRAPER_METRICS_FILE
+        or Path(settings.SCRAPER_DIR or DEFAULT_SCRAPER_DIR) / ".metrics" / "homepass_crawl.prom"
+    )
+    try:
+        text = await asyncio.to_thread(path.read_text, encoding="utf-8")
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="아직 수집 지표가 없습니다 (스크래퍼 실행 전).")
+    return PlainTextResponse(text, media_type=PROMETHEUS_CONTENT_TYPE)
+
+
+@router.post("/commute-matrix", status_code=202)
+def trigger_commute_matrix(background_tasks: BackgroundTasks):
+    """출퇴근 시간 행렬을 백그라운드에서 다시 계산합니다."""
+    if is_commute_matrix_running():
+        raise HTTPException(status_code=409, detail="출퇴근 시간 행렬 작업이 이미 실행 중입니다.")
+    background_tasks.add_task(run_commute_matrix_job)
+    return {"status": "started"}
+
+
 @router.get("/{announcement_id}", response_model=AnnouncementDetailSchema)
 def get_announcement_detail(
     announcement_id: int,
@@ -224,6 +427,9 @@ def get_announcement_detail(
 @router.get("/{announcement_id}/commute", response_model=CommuteInfoResponse)
 async def get_commute_info(
     announcement_id: int,
+    simplify: bool = Query(True, description="경로 단순화 여부 (Douglas-Peucker)"),
+    zoom: float | None = Query(None, ge=0, le=21, description="지도 zoom 레벨 (단순화 허용 오차 기준)"),
+    path_format: Literal["coords", "polyline"] = Query("coords", description="경로 형식: coords|polyline"),
     db: Session = Depends(get_db),
     naver_maps: NaverMapsService = Depends(get_naver_maps_service),
 ) -> CommuteInfoResponse:
@@ -251,33 +457,45 @@ async def get_commute_info(
     if not user or not user.address:
         raise HTTPException(status_code=400, detail="유저 주소 정보가 없습니다.")
 
-    # 4. 도착지 주소를 좌표로 변환 (Geocoding)
-    geocode_result = await naver_maps.geocode(user.address)
-    if not geocode_result:
+    # 4. 도착지 좌표 (주소 저장 시 변환해 둔 좌표, 없으면 변환 후 저장)
+    try:
+        end_coords = await get_user_coords(db, user, naver_maps)
+    except NaverApiError as exc:
+        raise upstream_error(exc) from exc
+    if not end_coords:
         raise HTTPException(status_code=400, detail="유저 주소를 좌표로 변환할 수 없습니다.")
 
-    end_lat = geocode_result["lat"]
-    end_lng = geocode_result["lng"]
+    end_lat, end_lng = end_coords
     end_address = user.address
 
     # 5. 경로 탐색 (Direction API)
-    directions_result = await naver_maps.get_directions(
-        start_lat=start_lat,
-        start_lng=start_lng,
-        end_lat=end_lat,
-        end_lng=end_lng,
-        option="trafast"  # 실시간 빠른 길
-    )
+    try:
+        directions_result = await naver_maps.get_directions(
+            start_lat=start_lat,
+            start_lng=start_lng,
+            end_lat=end_lat,
+            end_lng=end_lng,
+            option="trafast"  # 실시간 빠른 길
+        )
+    except NaverApiError as exc:
+        raise upstream_error(exc) from exc
 
     if not directions_result:
         raise HTTPException(status_code=400, detail="경로를 찾을 수 없습니다.")
 
-    # 6. 응답 반환
+    # 6. 응답 반환 (경로 단순화 / 인코딩)
+    shaped = format_route_path(
+        directions_result["path"],
+        simplify=simplify,
+        zoom=zoom,
+        path_format=path_format,
+        default_zoom=settings.DIRECTIONS_DEFAULT_ZOOM,
+    )
     return CommuteInfoResponse(
         start_address=start_address,
         end_address=end_address,
         distance=directions_result["distance"],
         duration=directions_result["duration"],
         duration_minutes=directions_result["duration"] // 60000,  # 밀리초를 분으로 변환
-        path=directions_result["path"]
+        **shaped,
     )
@@ -2,7 +2,12 @@ from fastapi import APIRouter, Depends, Query, HTTPException
 from sqlalchemy.orm import Session
 from app.database import get_db
 from app.config import settings
-from app.services.naver_maps import get_naver_maps_service, NaverMapsService
+from app.services.naver_maps import (
+    get_naver_maps_service,
+    NaverApiError,
+    NaverMapsService,
+    upstream_error,
+)
 from app.schemas.place import (
     NearbyPlacesResponse,
     GeocodeRequest,
@@ -11,6 +16,7 @@ from app.schemas.place import (
     DirectionsRequest,
     DirectionsResponse,
 )
+from app.utils.polyline import format_route_path
 
 router = APIRouter(prefix="/places", tags=["places"])
 
@@ -42,6 +48,8 @@ async def get_nearby_places(
             category=category,
             places=places
         )
+    except NaverApiError as e:
+        raise upstream_error(e)
     except ValueError as e:
         raise HTTPException(status_code=500, detail=str(e))
     except Exception as e:
@@ -94,6 +102,8 @@ async def get_nearby_places_by_address(
         )
     except HTTPException:
         raise
+    except NaverApiError as e:
+        raise upstream_error(e)
     except ValueError as e:
         raise HTTPException(status_code=500, detail=str(e))
     except Exception as e:
@@ -123,6 +133,8 @@ async def geocode_address(
             )
 
         return GeocodeResponse(**result)
+    except NaverApiError as e:
+        raise upstream_error(e)
     except ValueError as e:
         raise HTTPException(status_code=500, detail=str(e))
     except HTTPException:
@@ -155,6 +167,8 @@ async def reverse_geocode_location(
             )
 
         return ReverseGeocodeResponse(**result)
+    except NaverApiError as e:
+        raise upstream_error(e)
     except ValueError as e:
         raise HTTPException(status_code=500, detail=str(e))
     except HTTPException:
@@ -177,6 +191,9 @@ async def get_directions(
     - start_lat, start_lng: 출발지 좌표
     - end_lat, end_lng: 도착지 좌표
     - option: 경로 옵션 (trafast: 실시간 빠른길, tracomfort: 편안한길, traoptimal: 최적)
+    - simplify: 경로 단순화 여부 (기본 true, zoom 기준 1px 이하 굴곡 제거)
+    - zoom: 클라이언트 지도 zoom 레벨 (미지정 시 DIRECTIONS_DEFAULT_ZOOM)
+    - path_format: coords([[lat, lng], ...]) 또는 polyline(encoded_path 문자열)
     """
     try:
         result = await naver_maps.get_directions(
@@ -193,7 +210,20 @@ async def get_directions(
                 detail="경로를 찾을 수 없습니다."
             )
 
-        return DirectionsResponse(**result)
+        shaped = format_route_path(
+            result["path"],
+            simplify=request.simplify,
+            zoom=request.zoom,
+            path_format=request.path_format,
+            default_zoom=settings.DIRECTIONS_DEFAULT_ZOOM,
+        )
+        return DirectionsResponse(
+            distance=result["distance"],
+            duration=result["duration"],
+            **shaped,
+        )
+    except NaverApiError as e:
+        raise upstream_error(e)
     except ValueError as e:
         raise HTTPException(status_code=500, detail=str(e))
     except HTTPException:
@@ -204,3 +234,19 @@ async def get_directions(
             detail=f"경로 탐색 중 오류가 발생했습니다: {str(e)}"
         )
 
+
+
+@router.get("/metrics")
+def get_naver_maps_metrics(
+    naver_maps: NaverMapsService = Depends(get_naver_maps_service),
+):
+    """
+    네이버 API 호출 지표 조회
+
+    - singleflight.upstream_calls: 실제로 네이버에 전송된 요청 수
+    - singleflight.coalesced_calls: 진행 중인 동일 요청에 합쳐진 호출 수
+    - rate_limiters: API 계열별(maps/search) QPS 제한 대기 시간
+    - circuit_breakers: API 계열별 서킷 브레이커 상태 (closed/open/half_open)
+    - fallback: 장애 시 캐시된 응답으로 대체한 횟수
+    """
+    return naver_maps.get_metrics()
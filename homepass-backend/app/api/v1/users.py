@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import logging
+from typing import Optional
+
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy import select
 from sqlalchemy.orm import Session
@@ -20,6 +23,10 @@ from app.schemas import (
     UserProfileResponse,
     UserSchema,
 )
+from app.services.naver_maps import NaverMapsService, get_naver_maps_service
+from app.services.user_location import set_commute_base_address, set_user_address
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/users", tags=["users"])
 
@@ -35,6 +42,15 @@ def _get_primary_user(db: Session) -> User:
     return user
 
 
+def _optional_naver_maps() -> Optional[NaverMapsService]:
+    """키 미설정 시에도 주소 저장은 되도록 (좌표는 비워 두고 나중에 변환)"""
+    try:
+        return get_naver_maps_service()
+    except ValueError as exc:
+        logger.warning("네이버 Maps 서비스를 사용할 수 없어 좌표 변환을 건너뜁니다: %s", exc)
+        return None
+
+
 @router.get("/me", response_model=UserProfileResponse)
 def get_current_user_profile(
     current_user: User = Depends(get_current_user),
@@ -71,9 +87,10 @@ def get_current_user_profile(
     "/me/personal-info",
     response_model=PersonalInfoResponse,
 )
-def update_personal_info(
+async def update_personal_info(
     payload: PersonalInfoUpdatePayload,
     db: Session = Depends(get_db),
+    naver_maps: Optional[NaverMapsService] = Depends(_optional_naver_maps),
 ) -> PersonalInfoResponse:
     user = _get_primary_user(db)
 
@@ -94,7 +111,8 @@ def update_personal_info(
     if payload.phone_number is not None:
         user.phone_number = payload.phone_number
     if payload.address is not None:
-        user.address = payload.address
+        # 주소가 바뀌면 저장된 좌표를 초기화하고 다시 변환
+        await set_user_address(db, user, payload.address, naver_maps)
 
     db.add(user)
     db.commit()
@@ -134,9 +152,10 @@ def update_subscription_info(
     "/me/preferences",
     response_model=PreferenceSchema,
 )
-def update_preferences(
+async def update_preferences(
     payload: PreferencePayload,
     db: Session = Depends(get_db),
+    naver_maps: Optional[NaverMapsService] = Depends(_optional_naver_maps),
 ) -> PreferenceSchema:
     user = _get_primary_user(db)
 
@@ -144,7 +163,12 @@ def update_preferences(
     if not preference:
         preference = Preference(user_id=user.user_id)
 
-    for field, value in payload.model_dump(exclude_unset=True).items():
+    updates = payload.model_dump(exclude_unset=True)
+    if "commute_base_address" in updates:
+        # 기준지가 바뀌면 저장된 좌표를 초기화하고 다시 변환
+        await set_commute_base_address(db, preference, updates.pop("commute_base_address"), naver_maps)
+
+    for field, value in updates.items():
         setattr(preference, field, value)
 
     db.add(preference)
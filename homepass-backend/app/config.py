@@ -27,6 +27,33 @@ class Settings(BaseSettings):
     # 네이버 개발자센터 (Search API - 주변 시설 검색)
     NAVER_SEARCH_CLIENT_ID: str = ""
     NAVER_SEARCH_CLIENT_SECRET: str = ""
+
+    # 네이버 API 엔드포인트 (로컬 대체 서버 사용 시 변경, 예: http://localhost:9100)
+    NAVER_MAPS_BASE_URL: str = "https://maps.apigw.ntruss.com"
+    NAVER_SEARCH_BASE_URL: str = "https://openapi.naver.com/v1"
+
+    # 네이버 API 클라이언트 측 쿼터 보호 (QPS 제한 / 재시도 / 서킷 브레이커)
+    NAVER_MAPS_QPS: float = 10.0
+    NAVER_SEARCH_QPS: float = 10.0
+    NAVER_RETRY_MAX_ATTEMPTS: int = 3
+    NAVER_RETRY_BASE_DELAY: float = 0.2  # 초
+    NAVER_RETRY_MAX_DELAY: float = 2.0  # 초
+    NAVER_BREAKER_FAILURE_THRESHOLD: int = 5
+    NAVER_BREAKER_RESET_SECONDS: float = 30.0
+    NAVER_FALLBACK_CACHE_SIZE: int = 1024
+
+    # 공고 좌표 일괄 변환 (스크래핑 후 자동 실행)
+    ANNOUNCEMENT_GEOCODE_CONCURRENCY: int = 4
+    ANNOUNCEMENT_GEOCODE_BATCH_SIZE: int = 500  # 실행 1회당 최대 공고 수
+    ANNOUNCEMENT_GEOCODE_RETRY_HOURS: float = 24.0  # 변환 실패한 공고를 다시 시도하기까지 대기 시간
+
+    # 출퇴근 시간 행렬 배치 (GET /announcements?max_commute_minutes=...)
+    COMMUTE_MATRIX_CONCURRENCY: int = 4  # 동시 Direction 호출 수
+    COMMUTE_MATRIX_CALL_BUDGET: int = 500  # 실행 1회당 Direction 호출 상한 (음수면 무제한)
+    COMMUTE_MATRIX_TTL_HOURS: float = 24 * 7  # 이 시간이 지난 결과는 다시 계산
+
+    # 경로 응답 단순화 기본 zoom 레벨 (zoom 미지정 요청에 적용)
+    DIRECTIONS_DEFAULT_ZOOM: float = 16
     
     # 로깅 설정
     LOG_LEVEL: str = "INFO"
@@ -40,6 +67,29 @@ class Settings(BaseSettings):
     SCRAPER_VENV_PYTHON: str | None = None
     SCRAPER_START_BOARD_ID: int = 7000
     SCRAPER_DAYS_LIMIT: int = 7
+    SCRAPER_LOG_BUFFER_LINES: int = 2000  # 상태 API / 로그 스트림용으로 보관할 최근 출력 라인 수
+    SCRAPER_LEASE_SECONDS: int = 60  # 실행 임대 유효 시간 (하트비트가 끊기면 이 시간 뒤 다른 워커가 가져감)
+    SCRAPER_HEARTBEAT_SECONDS: int = 10  # 임대 연장 / 진행 상황 저장 / 취소 확인 주기
+    SCRAPER_CANCEL_GRACE_SECONDS: int = 15  # 취소 시 SIGTERM 후 SIGKILL까지 대기
+    SCRAPER_EXTRACTOR_WORKERS: int = 2  # 스파이더와 동시에 extraction_queue를 소비하는 추출 워커 수
+    SCRAPER_EXTRACTOR_DRAIN_TIMEOUT_SECONDS: int = 1800  # 스파이더 종료 후 큐가 빌 때까지 기다리는 최대 시간
+    # 스크래퍼 수집 지표 (Prometheus 텍스트, GET /announcements/scrape/metrics 로 전달)
+    # URL이 있으면 스크래퍼의 METRICS_HTTP_PORT 엔드포인트를 프록시, 없으면 파일을 읽음
+    SCRAPER_METRICS_FILE: str | None = None  # 기본: <SCRAPER_DIR>/.metrics/homepass_crawl.prom
+    SCRAPER_METRICS_URL: str | None = None  # 예: http://127.0.0.1:9410/metrics
+
+    # 주기 스크래핑 스케줄러 (앱 내장, 증분 실행)
+    SCRAPE_SCHEDULER_ENABLED: bool = False
+    SCRAPE_SCHEDULER_INTERVAL_MINUTES: float = 60  # 기본 실행 간격
+    SCRAPE_SCHEDULER_MIN_INTERVAL_MINUTES: float = 10
+    SCRAPE_SCHEDULER_MAX_INTERVAL_MINUTES: float = 360  # 새 공고가 없을 때 늘어나는 간격의 상한
+    SCRAPE_SCHEDULER_BACKOFF_FACTOR: float = 1.5  # 새 공고 없이 끝날 때마다 간격에 곱함
+    SCRAPE_SCHEDULER_JITTER_RATIO: float = 0.1  # 간격의 ±10% 무작위 분산
+    SCRAPE_SCHEDULER_PEAK_HOURS: str = "9-12,14-18"  # 공고가 주로 올라오는 시간대 (현지 시각, 시작-끝 시)
+    SCRAPE_SCHEDULER_PEAK_INTERVAL_MINUTES: float = 15  # 게시 시간대에는 이 간격 이하로 실행
+    SCRAPE_SCHEDULER_PEAK_WEEKDAYS_ONLY: bool = True
+    SCRAPE_SCHEDULER_TIMEZONE: str = "Asia/Seoul"
+    SCRAPE_SCHEDULER_TICK_SECONDS: float = 30  # 다음 실행 시각 확인 주기
     
     class Config:
         env_file = ".env"
@@ -1,4 +1,4 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, inspect, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from app.config import settings
@@ -45,6 +45,7 @@ def init_db():
     from app import models  # noqa
 
     Base.metadata.create_all(bind=engine)
+    _ensure_columns()
 
     _seed_test_user()
     _seed_announcements()
@@ -52,6 +53,40 @@ def init_db():
     _seed_notifications()
 
 
+# create_all은 이미 있는 테이블에 컬럼을 추가하지 않으므로,
+# 기존 테이블에 나중에 추가된 컬럼은 여기서 직접 추가합니다. (테이블 → {컬럼: DDL})
+_ADDED_COLUMNS = {
+    "Users": {
+        "address_lat": "DECIMAL(10, 8) NULL",
+        "address_lng": "DECIMAL(11, 8) NULL",
+    },
+    "Preferences": {
+        "commute_base_lat": "DECIMAL(10, 8) NULL",
+        "commute_base_lng": "DECIMAL(11, 8) NULL",
+    },
+    "Announcements": {
+        "content_hash": "CHAR(64) NULL",
+        "content_changed_at": "DATETIME NULL",
+        "pdf_sha256": "CHAR(64) NULL",
+        "pdf_path": "VARCHAR(512) NULL",
+        "geocode_failed_at": "DATETIME NULL",
+    },
+}
+
+
+def _ensure_columns():
+    """누락된 컬럼을 ALTER TABLE ... ADD COLUMN으로 추가합니다. (여러 번 실행해도 안전)"""
+    inspector = inspect(engine)
+    with engine.begin() as conn:
+        for table, columns in _ADDED_COLUMNS.items():
+            if not inspector.has_table(table):
+                continue
+            existing = {column["name"] for column in inspector.get_columns(table)}
+            for name, ddl in columns.items():
+                if name not in existing:
+                    conn.execute(text(f"ALTER TABLE `{table}` ADD COLUMN `{name}` {ddl}"))
+
+
 def _seed_test_user():
     """기본 테스트 계정을 생성합니다."""
     from sqlalchemy import select
@@ -57,3 +57,24 @@ app.include_router(bookmarks.router, prefix="/api/v1")
 app.include_router(chatbot.router, prefix="/api/v1")
 app.include_router(places.router, prefix="/api/v1")
 
+
+@app.on_event("startup")
+def start_background_jobs():
+    from app.services.scraper_runner import scraper_runner
+
+    # 재시작 전에 대기열에 남은 스크래핑 작업을 이어서 처리 (다른 워커가 실행 중이면 바로 종료)
+    scraper_runner.ensure_dispatching()
+
+    # 주기 스크래핑 스케줄러 (여러 워커에서 켜져도 회차마다 한 워커만 실행을 등록)
+    if settings.SCRAPE_SCHEDULER_ENABLED:
+        from app.services.scrape_scheduler import scrape_scheduler
+
+        scrape_scheduler.start()
+
+
+@app.on_event("shutdown")
+def stop_background_jobs():
+    # 종료 / --reload 시 스케줄러 스레드 정리
+    from app.services.scrape_scheduler import scrape_scheduler
+
+    scrape_scheduler.stop()
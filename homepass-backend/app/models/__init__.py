@@ -6,3 +6,5 @@ from .announcement import Announcement
 from .application import Application
 from .notification import Notification
 from .user_interest import UserInterest
+from .commute_time import CommuteTime
+from .scrape_job import ScrapeJob, ScrapeSchedule, ScraperLease
@@ -30,11 +30,20 @@ class Announcement(Base):
     address_detail = Column(String(255), nullable=True)
     latitude = Column(Numeric(10, 8), nullable=True)
     longitude = Column(Numeric(11, 8), nullable=True)
+    # 마지막 좌표 변환 실패 시각 (성공하면 비움, ANNOUNCEMENT_GEOCODE_RETRY_HOURS 동안 다시 시도하지 않음)
+    geocode_failed_at = Column(DateTime, nullable=True)
     application_end_date = Column(DateTime, nullable=True)
     application_link = Column(String(2048), nullable=True)
     homepage_link = Column(String(2048), nullable=True)
     parsed_content = Column(Text, nullable=True)
     original_pdf_url = Column(String(2048), nullable=True)
+    listing_number = Column(Integer, nullable=True)  # SOCO 게시판 번호 (스파이더 체크포인트 기준)
+    # 스크래퍼가 계산한 내용 지문 / 내용이 실제로 바뀐 시각 (같은 내용 재수집 시에는 갱신되지 않음)
+    content_hash = Column(String(64), nullable=True)
+    content_changed_at = Column(DateTime, nullable=True)
+    # 스크래퍼가 수집 중에 받아 둔 PDF (내용 주소 저장소 기준 sha256 / 상대 경로)
+    pdf_sha256 = Column(String(64), nullable=True)
+    pdf_path = Column(String(512), nullable=True)
     scraped_at = Column(DateTime, nullable=True, server_default=func.current_timestamp())
     image_urls_json = Column("image_urls", JSON, nullable=True)
     schedules_json = Column("schedules", JSON, nullable=True)
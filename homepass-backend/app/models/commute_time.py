@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    Numeric,
+    UniqueConstraint,
+    func,
+)
+
+from app.database import Base
+
+
+class CommuteTime(Base):
+    """공고 위치 → 사용자 출퇴근 기준지 소요 시간 (배치 작업으로 미리 계산)"""
+
+    __tablename__ = "commute_times"
+    __table_args__ = (
+        UniqueConstraint("user_id", "announcement_id", name="uk_commute_user_announcement"),
+        # max_commute_minutes 필터: user_id 고정 후 duration_ms 범위 조회
+        Index("ix_commute_user_duration", "user_id", "duration_ms"),
+    )
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    user_id = Column(Integer, ForeignKey("Users.user_id"), nullable=False)
+    announcement_id = Column(Integer, ForeignKey("Announcements.announcement_id"), nullable=False)
+    duration_ms = Column(Integer, nullable=False)
+    distance_m = Column(Integer, nullable=True)
+    # 계산 당시 기준지 좌표 (기준지가 바뀌면 다시 계산)
+    base_lat = Column(Numeric(10, 8), nullable=True)
+    base_lng = Column(Numeric(11, 8), nullable=True)
+    computed_at = Column(DateTime, nullable=False, server_default=func.current_timestamp())
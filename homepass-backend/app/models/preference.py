@@ -10,6 +10,7 @@ from sqlalchemy import (
     ForeignKey,
     Integer,
     JSON,
+    Numeric,
     String,
     BigInteger,
     func,
@@ -37,6 +38,9 @@ class Preference(Base):
     max_deposit = Column(BigInteger, nullable=True)
     max_monthly_rent = Column(Integer, nullable=True)
     commute_base_address = Column(String(255), nullable=True)
+    # commute_base_address를 Geocoding한 좌표 (주소 변경 시 초기화 후 다시 계산)
+    commute_base_lat = Column(Numeric(10, 8), nullable=True)
+    commute_base_lng = Column(Numeric(11, 8), nullable=True)
     max_commute_time_minutes = Column(Integer, nullable=True)
     auto_apply_mode = Column(
         Enum(AutoApplyMode), nullable=True, default=AutoApplyMode.disabled
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from sqlalchemy import Boolean, Column, DateTime, Index, Integer, JSON, String, Text, func
+
+from app.database import Base
+
+
+class ScrapeJob(Base):
+    """스크래핑 실행 기록 (queued → running → succeeded | failed | cancelled)"""
+
+    __tablename__ = "scrape_jobs"
+    __table_args__ = (Index("ix_scrape_jobs_status_created", "status", "created_at"),)
+
+    job_id = Column(Integer, primary_key=True, autoincrement=True)
+    status = Column(String(20), nullable=False, default="queued")
+    trigger = Column(String(20), nullable=True)  # api | scheduler
+    start_board_id = Column(Integer, nullable=True)
+    days_limit = Column(Integer, nullable=True)
+    current_stage = Column(String(30), nullable=True)
+    stage_timings = Column(JSON, nullable=True)  # 단계 이름 → 소요 시간(초)
+    items_scraped = Column(Integer, nullable=False, default=0)
+    rows_extracted = Column(Integer, nullable=False, default=0)
+    error = Column(Text, nullable=True)
+    cancel_requested = Column(Boolean, nullable=False, default=False)
+    worker_id = Column(String(255), nullable=True)  # 실행 중인 프로세스 (host:pid)
+    heartbeat_at = Column(DateTime, nullable=True)
+    created_at = Column(DateTime, nullable=False, server_default=func.current_timestamp())
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+
+
+class ScraperLease(Base):
+    """
+    프로세스/호스트 간 스크래퍼 단일 실행 보장용 임대(lease)
+
+    holder가 expires_at 전까지 주기적으로 갱신하며, 만료된 임대는 다른 워커가 가져갈 수 있습니다.
+    """
+
+    __tablename__ = "scraper_leases"
+
+    name = Column(String(50), primary_key=True)
+    holder = Column(String(255), nullable=True)
+    job_id = Column(Integer, nullable=True)
+    expires_at = Column(DateTime, nullable=True)
+
+
+class ScrapeSchedule(Base):
+    """
+    주기 실행 스케줄 상태 (프로세스 재시작 / 여러 워커 간 공유)
+
+    next_run_at을 조건부 UPDATE로 옮긴 워커만 실행을 등록하므로 같은 회차가 중복 실행되지 않습니다.
+    """
+
+    __tablename__ = "scrape_schedules"
+
+    name = Column(String(50), primary_key=True)
+    next_run_at = Column(DateTime, nullable=False)
+    interval_seconds = Column(Integer, nullable=True)  # 마지막으로 계산된 실행 간격 (지터 제외)
+    idle_streak = Column(Integer, nullable=False, default=0)  # 새 공고 없이 끝난 연속 실행 수
+    pending_job_id = Column(Integer, nullable=True)  # 결과를 아직 반영하지 않은 작업
+    checkpoint_before = Column(Integer, nullable=True)  # 실행 전 최신 listing_number
+    last_checkpoint = Column(Integer, nullable=True)
+    last_job_id = Column(Integer, nullable=True)
+    last_run_at = Column(DateTime, nullable=True)
+    updated_at = Column(
+        DateTime, nullable=False, server_default=func.current_timestamp(), onupdate=func.current_timestamp()
+    )
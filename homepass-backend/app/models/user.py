@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from sqlalchemy import Column, DateTime, Integer, String, VARBINARY, func
+from sqlalchemy import Column, DateTime, Integer, Numeric, String, VARBINARY, func
 from sqlalchemy.orm import relationship
 
 from app.database import Base
@@ -17,6 +17,9 @@ class User(Base):
     rrn_key_encrypted = Column(VARBINARY(255), nullable=True)
     phone_number = Column(String(20), nullable=True)
     address = Column(String(255), nullable=True)
+    # address를 Geocoding한 좌표 (주소 변경 시 초기화 후 다시 계산)
+    address_lat = Column(Numeric(10, 8), nullable=True)
+    address_lng = Column(Numeric(11, 8), nullable=True)
     created_at = Column(
         DateTime, nullable=True, server_default=func.current_timestamp()
     )
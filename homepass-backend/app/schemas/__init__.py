@@ -21,6 +21,10 @@ from .announcement import (
     AnnouncementDetailSchema,
     AnnouncementListResponse,
     AnnouncementScrapeRequest,
+    ScrapeJobSchema,
+    ScrapeLogLineSchema,
+    ScrapeScheduleSchema,
+    ScrapeStatusResponse,
 )
 from .application import (
     ApplicationItemSchema,
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
@@ -61,3 +61,61 @@ class AnnouncementScrapeRequest(BaseModel):
     start_board_id: Optional[int] = Field(default=None, ge=1)
     days_limit: Optional[int] = Field(default=None, ge=1)
 
+
+
+class ScrapeLogLineSchema(BaseModel):
+    seq: int
+    time: str
+    source: str
+    stream: str
+    line: str
+
+
+class ScrapeStatusResponse(BaseModel):
+    job_id: Optional[int] = None
+    state: str = Field(description="idle | queued | running | succeeded | failed | cancelled")
+    is_running: bool
+    stage: Optional[str] = Field(None, description="spider | extractor | geocoding | commute_matrix")
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
+    elapsed_seconds: Optional[float] = None
+    stage_elapsed_seconds: Optional[float] = None
+    stage_timings: Dict[str, float] = Field(default_factory=dict)
+    items_scraped: int = 0
+    rows_extracted: int = 0
+    error: Optional[str] = None
+    last_log_seq: int = 0
+    logs: List[ScrapeLogLineSchema] = Field(default_factory=list)
+
+
+class ScrapeJobSchema(BaseModel):
+    job_id: int
+    status: str = Field(description="queued | running | succeeded | failed | cancelled")
+    trigger: Optional[str] = None
+    start_board_id: Optional[int] = None
+    days_limit: Optional[int] = None
+    current_stage: Optional[str] = None
+    stage_timings: Optional[Dict[str, float]] = None
+    items_scraped: int = 0
+    rows_extracted: int = 0
+    error: Optional[str] = None
+    cancel_requested: bool = False
+    worker_id: Optional[str] = None
+    heartbeat_at: Optional[datetime] = None
+    created_at: Optional[datetime] = None
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+
+class ScrapeScheduleSchema(BaseModel):
+    enabled: bool
+    next_run_at: Optional[datetime] = Field(None, description="다음 예약 실행 시각 (UTC)")
+    interval_seconds: Optional[int] = Field(None, description="마지막으로 계산된 실행 간격 (지터 제외)")
+    idle_streak: int = Field(0, description="새 공고 없이 끝난 연속 실행 수 (백오프 단계)")
+    pending_job_id: Optional[int] = None
+    last_job_id: Optional[int] = None
+    last_run_at: Optional[datetime] = None
+    last_checkpoint: Optional[int] = Field(None, description="마지막 실행 후 최신 listing_number")
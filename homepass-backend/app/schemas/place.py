@@ -1,7 +1,7 @@
 """주변 시설 관련 스키마"""
 
-from pydantic import BaseModel
-from typing import List, Optional
+from pydantic import BaseModel, Field
+from typing import List, Literal, Optional
 
 
 class PlaceSchema(BaseModel):
@@ -47,13 +47,18 @@ class DirectionsRequest(BaseModel):
     end_lat: float
     end_lng: float
     option: str = "trafast"  # trafast, tracomfort, traoptimal
+    simplify: bool = True  # Douglas-Peucker 경로 단순화 여부
+    zoom: Optional[float] = Field(None, ge=0, le=21, description="지도 zoom 레벨 (단순화 허용 오차 기준)")
+    path_format: Literal["coords", "polyline"] = "coords"  # polyline: encoded_path로 반환
 
 
 class DirectionsResponse(BaseModel):
     """경로 탐색 응답"""
     distance: int  # 미터
     duration: int  # 밀리초
-    path: List[List[float]]  # [[lat, lng], ...]
+    path: List[List[float]] = []  # [[lat, lng], ...] (path_format=polyline이면 비어 있음)
+    encoded_path: Optional[str] = None  # Encoded Polyline (precision 5)
+    original_point_count: Optional[int] = None  # 단순화 전 좌표 개수
 
 
 class CommuteInfoResponse(BaseModel):
@@ -63,4 +68,6 @@ class CommuteInfoResponse(BaseModel):
     distance: int  # 거리 (미터)
     duration: int  # 소요 시간 (밀리초)
     duration_minutes: int  # 소요 시간 (분)
-    path: List[List[float]]  # 경로 좌표 [[lat, lng], ...]
+    path: List[List[float]] = []  # 경로 좌표 [[lat, lng], ...]
+    encoded_path: Optional[str] = None  # Encoded Polyline (path_format=polyline)
+    original_point_count: Optional[int] = None  # 단순화 전 좌표 개수
@@ -0,0 +1,144 @@
+"""
+공고 좌표 일괄 변환 (Geocoding)
+
+SOCO 스크래퍼가 저장한 공고는 latitude/longitude가 비어 있고,
+new_extractor.py가 address_detail만 채웁니다.
+추출 단계 이후 주소는 있지만 좌표가 없는 공고를 모아 좌표를 채웁니다.
+
+- 같은 주소는 한 번만 변환 (공백 정규화 후 중복 제거)
+- 동시 호출 수 제한 (ANNOUNCEMENT_GEOCODE_CONCURRENCY) + 서비스의 QPS 제한
+- 결과는 기본 키 기준 bulk UPDATE 한 번으로 반영
+- 변환에 실패한 공고(API 오류, 결과 없음)는 geocode_failed_at을 기록하고
+  ANNOUNCEMENT_GEOCODE_RETRY_HOURS 동안 대상에서 제외 (매번 같은 공고에 호출 예산을 쓰지 않도록)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from collections import defaultdict
+from datetime import timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import func, or_, select, update
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models import Announcement
+from app.services.naver_maps import NaverApiError, NaverMapsService, get_naver_maps_service
+from app.services.user_location import normalize_address
+from app.utils.clock import utcnow
+
+logger = logging.getLogger(__name__)
+
+
+async def _geocode_addresses(
+    naver_maps: NaverMapsService, addresses: List[str], max_concurrency: int
+) -> Tuple[Dict[str, Tuple[float, float]], int]:
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    failures = 0
+
+    async def one(address: str) -> Optional[Tuple[float, float]]:
+        nonlocal failures
+        async with semaphore:
+            try:
+                result = await naver_maps.geocode(address)
+            except NaverApiError as exc:
+                failures += 1
+                logger.warning("공고 주소 좌표 변환 실패 (%s): %s", address, exc)
+                return None
+        return (result["lat"], result["lng"]) if result else None
+
+    coords = await asyncio.gather(*(one(a) for a in addresses))
+    return {a: c for a, c in zip(addresses, coords) if c is not None}, failures
+
+
+async def geocode_missing_announcements(
+    naver_maps: Optional[NaverMapsService] = None,
+    *,
+    max_concurrency: Optional[int] = None,
+    batch_size: Optional[int] = None,
+    retry_hours: Optional[float] = None,
+) -> Dict[str, Any]:
+    """
+    주소는 있고 좌표가 없는 공고의 좌표를 채웁니다.
+
+    Returns:
+        실행 요약 (대상 공고 수, 고유 주소 수, 갱신/미해결 수 등)
+    """
+    started = time.time()
+    naver_maps = naver_maps or get_naver_maps_service()
+    max_concurrency = max_concurrency or settings.ANNOUNCEMENT_GEOCODE_CONCURRENCY
+    batch_size = batch_size or settings.ANNOUNCEMENT_GEOCODE_BATCH_SIZE
+    retry_hours = settings.ANNOUNCEMENT_GEOCODE_RETRY_HOURS if retry_hours is None else retry_hours
+    now = utcnow()
+
+    db = SessionLocal()
+    try:
+        stmt = (
+            select(Announcement.announcement_id, Announcement.address_detail)
+            .where(
+                Announcement.address_detail.is_not(None),
+                func.length(func.trim(Announcement.address_detail)) > 0,
+                or_(Announcement.latitude.is_(None), Announcement.longitude.is_(None)),
+                or_(
+                    Announcement.geocode_failed_at.is_(None),
+                    Announcement.geocode_failed_at < now - timedelta(hours=retry_hours),
+                ),
+            )
+            .order_by(Announcement.announcement_id.desc())
+            .limit(batch_size)
+        )
+        by_address: Dict[str, List[int]] = defaultdict(list)
+        for announcement_id, address in db.execute(stmt):
+            by_address[normalize_address(address)].append(announcement_id)
+
+        pending = sum(len(ids) for ids in by_address.values())
+        coords, failures = await _geocode_addresses(naver_maps, list(by_address), max_concurrency)
+
+        rows = [
+            {"announcement_id": announcement_id, "latitude": lat, "longitude": lng, "geocode_failed_at": None}
+            for address, (lat, lng) in coords.items()
+            for announcement_id in by_address[address]
+        ]
+        failed_rows = [
+            {"announcement_id": announcement_id, "geocode_failed_at": now}
+            for address, ids in by_address.items()
+            if address not in coords
+            for announcement_id in ids
+        ]
+        # 기본 키가 포함된 목록 → executemany UPDATE ... WHERE announcement_id = ?
+        for batch in (rows, failed_rows):
+            if batch:
+                db.execute(update(Announcement), batch)
+        if rows or failed_rows:
+            db.commit()
+    finally:
+        db.close()
+
+    summary = {
+        "pending": pending,
+        "addresses": len(by_address),
+        "updated": len(rows),
+        "unresolved": pending - len(rows),
+        "failed": failures,
+        "elapsed_seconds": round(time.time() - started, 2),
+    }
+    logger.info("📍 공고 좌표 변환 완료: %s", summary)
+    return summary
+
+
+_job_lock = threading.Lock()
+
+
+def run_announcement_geocoding(**kwargs: Any) -> Optional[Dict[str, Any]]:
+    """동기 컨텍스트(스크래퍼 스레드)용 진입점. 이미 실행 중이면 None을 반환합니다."""
+    if not _job_lock.acquire(blocking=False):
+        logger.warning("⚠️ 공고 좌표 변환 작업이 이미 실행 중입니다.")
+        return None
+    try:
+        return asyncio.run(geocode_missing_announcements(**kwargs))
+    finally:
+        _job_lock.release()
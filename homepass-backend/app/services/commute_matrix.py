@@ -0,0 +1,299 @@
+"""
+출퇴근 시간 행렬 배치 작업
+
+활성 공고(좌표 있음, 마감 전) × 사용자 출퇴근 기준지 조합의 소요 시간을
+Direction API로 미리 계산해 commute_times 테이블에 저장합니다.
+GET /announcements?max_commute_minutes=... 는 이 테이블만 조회합니다.
+
+- 동시 호출 수 제한 (COMMUTE_MATRIX_CONCURRENCY)
+- 실행 1회당 Direction 호출 예산 (COMMUTE_MATRIX_CALL_BUDGET): 없는 조합 → 오래된 조합 순으로 사용
+- 기준지 좌표가 바뀌었거나 COMMUTE_MATRIX_TTL_HOURS가 지난 조합만 다시 계산
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import and_, func, or_, select
+from sqlalchemy.orm import Session, selectinload
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models import Announcement, CommuteTime, User
+from app.services.naver_maps import NaverApiError, NaverMapsService, get_naver_maps_service
+from app.services.user_location import (
+    commute_base_address,
+    geocode_address,
+    normalize_address,
+    store_commute_base_coords,
+    stored_commute_base_coords,
+)
+from app.utils.clock import utcnow
+
+logger = logging.getLogger(__name__)
+
+# 기준지 좌표 비교 정밀도 (소수 6자리 ≈ 0.1m)
+_COORD_DIGITS = 6
+
+
+@dataclass
+class _Pair:
+    user_id: int
+    announcement_id: int
+    start: Tuple[float, float]  # 공고 (lat, lng)
+    base: Tuple[float, float]  # 기준지 (lat, lng)
+    computed_at: Optional[datetime]  # 기존 결과 계산 시각 (없으면 None)
+
+
+def _same_coords(row: CommuteTime, base: Tuple[float, float]) -> bool:
+    if row.base_lat is None or row.base_lng is None:
+        return False
+    return (
+        round(float(row.base_lat), _COORD_DIGITS) == round(base[0], _COORD_DIGITS)
+        and round(float(row.base_lng), _COORD_DIGITS) == round(base[1], _COORD_DIGITS)
+    )
+
+
+def base_matches(base: Tuple[float, float]):
+    """CommuteTime 행이 이 기준지 좌표로 계산된 것인지 (SQL 조건, _same_coords와 같은 정밀도)"""
+    return and_(
+        func.round(CommuteTime.base_lat, _COORD_DIGITS) == round(base[0], _COORD_DIGITS),
+        func.round(CommuteTime.base_lng, _COORD_DIGITS) == round(base[1], _COORD_DIGITS),
+    )
+
+
+def _load_active_announcements(db: Session) -> List[Announcement]:
+    stmt = select(Announcement).where(
+        Announcement.latitude.is_not(None),
+        Announcement.longitude.is_not(None),
+        or_(
+            Announcement.application_end_date.is_(None),
+            Announcement.application_end_date >= utcnow(),
+        ),
+    )
+    return list(db.scalars(stmt))
+
+
+async def _load_commute_bases(
+    db: Session, naver_maps: NaverMapsService, max_concurrency: int
+) -> Tuple[int, Dict[int, Tuple[float, float]]]:
+    """
+    user_id → 출퇴근 기준지 좌표 (희망 조건의 기준지, 없으면 사용자 주소)
+
+    주소 저장 시 변환해 둔 좌표를 사용하고, 비어 있는 경우에만 변환 후 저장합니다.
+    좌표가 없는 사용자는 정규화한 주소로 묶어 같은 주소는 한 번만 (동시에) 변환합니다.
+
+    Returns:
+        (기준지 주소가 있는 사용자 수, 좌표 dict)
+    """
+    users = list(db.scalars(select(User).options(selectinload(User.preference))))
+    candidates = 0
+    coords: Dict[int, Tuple[float, float]] = {}
+    missing: Dict[str, List[User]] = defaultdict(list)
+    for user in users:
+        address = commute_base_address(user)
+        if not (address or "").strip():
+            continue
+        candidates += 1
+        base = stored_commute_base_coords(user)
+        if base:
+            coords[user.user_id] = base
+        else:
+            missing[normalize_address(address)].append(user)
+
+    if missing:
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def one(address: str) -> Optional[Tuple[float, float]]:
+            async with semaphore:
+                try:
+                    return await geocode_address(naver_maps, address)
+                except NaverApiError as exc:
+                    logger.warning("기준지 좌표 변환 실패 (%s): %s", address, exc)
+                    return None
+
+        addresses = list(missing)
+        for address, base in zip(addresses, await asyncio.gather(*(one(a) for a in addresses))):
+            if not base:
+                continue
+            for user in missing[address]:
+                store_commute_base_coords(db, user, base)
+                coords[user.user_id] = base
+        db.commit()
+    return candidates, coords
+
+
+def _plan_pairs(
+    db: Session,
+    announcements: List[Announcement],
+    base_coords: Dict[int, Tuple[float, float]],
+    ttl: timedelta,
+) -> Tuple[List[_Pair], int]:
+    """다시 계산할 조합 목록 (없는 조합 먼저, 그 다음 오래된 순)과 최신 상태인 조합 수"""
+    existing: Dict[Tuple[int, int], CommuteTime] = {}
+    if base_coords:
+        rows = db.scalars(select(CommuteTime).where(CommuteTime.user_id.in_(list(base_coords))))
+        existing = {(row.user_id, row.announcement_id): row for row in rows}
+
+    stale_before = utcnow() - ttl
+    pairs: List[_Pair] = []
+    fresh = 0
+    for user_id, base in base_coords.items():
+        for ann in announcements:
+            row = existing.get((user_id, ann.announcement_id))
+            if row is not None and _same_coords(row, base) and row.computed_at and row.computed_at >= stale_before:
+                fresh += 1
+                continue
+            pairs.append(
+                _Pair(
+                    user_id=user_id,
+                    announcement_id=ann.announcement_id,
+                    start=(float(ann.latitude), float(ann.longitude)),
+                    base=base,
+                    # 기준지가 바뀐 조합은 없는 조합과 같은 우선순위
+                    computed_at=row.computed_at if row is not None and _same_coords(row, base) else None,
+                )
+            )
+
+    pairs.sort(key=lambda p: (p.computed_at is not None, p.computed_at or datetime.min))
+    return pairs, fresh
+
+
+async def _compute_pairs(
+    naver_maps: NaverMapsService, pairs: List[_Pair], max_concurrency: int
+) -> Tuple[List[Tuple[_Pair, Dict[str, Any]]], int]:
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    failures = 0
+
+    async def one(pair: _Pair) -> Optional[Tuple[_Pair, Dict[str, Any]]]:
+        nonlocal failures
+        async with semaphore:
+            try:
+                result = await naver_maps.get_directions(
+                    start_lat=pair.start[0],
+                    start_lng=pair.start[1],
+                    end_lat=pair.base[0],
+                    end_lng=pair.base[1],
+                    option="trafast",
+                )
+            except NaverApiError as exc:
+                failures += 1
+                logger.warning(
+                    "출퇴근 시간 계산 실패 (user=%s, announcement=%s): %s",
+                    pair.user_id, pair.announcement_id, exc,
+                )
+                return None
+        if not result:
+            failures += 1
+            return None
+        return pair, result
+
+    results = await asyncio.gather(*(one(p) for p in pairs))
+    return [r for r in results if r is not None], failures
+
+
+def _store_results(db: Session, results: List[Tuple[_Pair, Dict[str, Any]]]) -> None:
+    if not results:
+        return
+
+    keys = {(pair.user_id, pair.announcement_id) for pair, _ in results}
+    user_ids = {uid for uid, _ in keys}
+    announcement_ids = {aid for _, aid in keys}
+    rows = db.scalars(
+        select(CommuteTime).where(
+            CommuteTime.user_id.in_(user_ids),
+            CommuteTime.announcement_id.in_(announcement_ids),
+        )
+    )
+    existing = {(row.user_id, row.announcement_id): row for row in rows}
+
+    now = utcnow()
+    for pair, result in results:
+        row = existing.get((pair.user_id, pair.announcement_id))
+        if row is None:
+            row = CommuteTime(user_id=pair.user_id, announcement_id=pair.announcement_id)
+            db.add(row)
+        row.duration_ms = int(result["duration"])
+        row.distance_m = int(result["distance"]) if result.get("distance") is not None else None
+        row.base_lat = pair.base[0]
+        row.base_lng = pair.base[1]
+        row.computed_at = now
+    db.commit()
+
+
+async def compute_commute_matrix(
+    naver_maps: Optional[NaverMapsService] = None,
+    *,
+    max_concurrency: Optional[int] = None,
+    call_budget: Optional[int] = None,
+    ttl_hours: Optional[float] = None,
+) -> Dict[str, Any]:
+    """
+    출퇴근 시간 행렬 갱신
+
+    Returns:
+        실행 요약 (계산/실패/예산 초과로 미룬 조합 수 등)
+    """
+    started = time.time()
+    naver_maps = naver_maps or get_naver_maps_service()
+    max_concurrency = max_concurrency or settings.COMMUTE_MATRIX_CONCURRENCY
+    call_budget = settings.COMMUTE_MATRIX_CALL_BUDGET if call_budget is None else call_budget
+    ttl = timedelta(hours=settings.COMMUTE_MATRIX_TTL_HOURS if ttl_hours is None else ttl_hours)
+
+    db = SessionLocal()
+    try:
+        announcements = _load_active_announcements(db)
+        users_with_base, base_coords = await _load_commute_bases(db, naver_maps, max_concurrency)
+        pairs, fresh = _plan_pairs(db, announcements, base_coords, ttl)
+
+        scheduled = pairs[:call_budget] if call_budget >= 0 else pairs
+        deferred = len(pairs) - len(scheduled)
+        if deferred:
+            logger.info("⏳ Direction 호출 예산 초과: %d개 조합은 다음 실행으로 미룹니다.", deferred)
+
+        results, failures = await _compute_pairs(naver_maps, scheduled, max_concurrency)
+        _store_results(db, results)
+    finally:
+        db.close()
+
+    summary = {
+        "announcements": len(announcements),
+        "users": users_with_base,
+        "users_geocoded": len(base_coords),
+        "fresh": fresh,
+        "computed": len(results),
+        "failed": failures,
+        "deferred": deferred,
+        "elapsed_seconds": round(time.time() - started, 2),
+    }
+    logger.info("🧭 출퇴근 시간 행렬 갱신 완료: %s", summary)
+    return summary
+
+
+_job_lock = threading.Lock()
+
+
+def is_commute_matrix_running() -> bool:
+    return _job_lock.locked()
+
+
+def run_commute_matrix_job(**kwargs: Any) -> Optional[Dict[str, Any]]:
+    """
+    동기 컨텍스트(스크래퍼 스레드, BackgroundTasks)에서 실행하는 진입점
+
+    이미 실행 중이면 건너뛰고 None을 반환합니다.
+    """
+    if not _job_lock.acquire(blocking=False):
+        logger.warning("⚠️ 출퇴근 시간 행렬 작업이 이미 실행 중입니다.")
+        return None
+    try:
+        return asyncio.run(compute_commute_matrix(**kwargs))
+    finally:
+        _job_lock.release()
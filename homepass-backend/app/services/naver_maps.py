@@ -7,9 +7,57 @@
 - Direction 5: 경로 탐색 및 거리/시간 계산
 """
 
+import asyncio
+import copy
+import logging
+from collections import OrderedDict
+
 import httpx
-from typing import Optional, List, Dict, Any
+import numpy as np
+from fastapi import HTTPException
+from typing import Optional, List, Dict, Any, Awaitable, Callable, Hashable
 from app.config import settings
+from app.utils.geo import (
+    NAVER_COORD_SCALE,
+    haversine_m,
+    normalize_place_name,
+    strip_html_bold,
+    within_radius,
+)
+from app.utils.resilience import CircuitBreaker, TokenBucket, backoff_delay
+from app.utils.singleflight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+# API 계열 (쿼터/장애가 서로 독립적)
+MAPS_API = "maps"
+SEARCH_API = "search"
+
+# 재시도 대상 상태 코드 (쿼터 초과 및 일시적 서버 오류)
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class NaverApiError(Exception):
+    """네이버 API 업스트림 오류 (재시도 후에도 429/5xx 또는 네트워크 오류)"""
+
+    def __init__(self, api: str, message: str, status_code: Optional[int] = None):
+        super().__init__(message)
+        self.api = api
+        self.status_code = status_code
+
+
+class NaverApiUnavailable(NaverApiError):
+    """서킷 브레이커가 열려 있어 업스트림 호출을 차단한 경우"""
+
+
+def upstream_error(exc: NaverApiError) -> HTTPException:
+    """네이버 API 장애를 503(차단 중) / 502(업스트림 오류)로 변환 (라우터 공용)"""
+    if isinstance(exc, NaverApiUnavailable):
+        return HTTPException(
+            status_code=503,
+            detail="네이버 API가 일시적으로 응답하지 않습니다. 잠시 후 다시 시도해주세요.",
+        )
+    return HTTPException(status_code=502, detail=f"네이버 API 호출에 실패했습니다: {str(exc)}")
 
 
 class NaverMapsService:
@@ -18,7 +66,14 @@ class NaverMapsService:
     BASE_URL = "https://maps.apigw.ntruss.com"  # Naver Cloud Maps API
     SEARCH_BASE_URL = "https://openapi.naver.com/v1"  # Naver Search API
 
+    # 로컬 대체 서버(test/naver_stub.py) 사용 시 키 대신 보내는 값
+    STUB_CREDENTIAL = "local-stub"
+
     def __init__(self):
+        # 설정으로 엔드포인트를 바꿀 수 있음 (로컬 대체 서버 / 벤치마크용)
+        self.base_url = (settings.NAVER_MAPS_BASE_URL or self.BASE_URL).rstrip("/")
+        self.search_base_url = (settings.NAVER_SEARCH_BASE_URL or self.SEARCH_BASE_URL).rstrip("/")
+
         # 네이버 클라우드 Maps API (Geocoding, Direction 등)
         self.cloud_client_id = settings.NAVER_CLOUD_CLIENT_ID
         self.cloud_client_secret = settings.NAVER_CLOUD_CLIENT_SECRET
@@ -27,9 +82,148 @@ class NaverMapsService:
         self.search_client_id = settings.NAVER_SEARCH_CLIENT_ID
         self.search_client_secret = settings.NAVER_SEARCH_CLIENT_SECRET
 
+        # 실제 네이버 대신 다른 서버를 가리키면 키 없이도 동작
+        if self.base_url != self.BASE_URL:
+            self.cloud_client_id = self.cloud_client_id or self.STUB_CREDENTIAL
+            self.cloud_client_secret = self.cloud_client_secret or self.STUB_CREDENTIAL
+        if self.search_base_url != self.SEARCH_BASE_URL:
+            self.search_client_id = self.search_client_id or self.STUB_CREDENTIAL
+            self.search_client_secret = self.search_client_secret or self.STUB_CREDENTIAL
+
         if not self.cloud_client_id or not self.cloud_client_secret:
             raise ValueError("네이버 클라우드 Maps API 키가 설정되지 않았습니다.")
 
+        # 동일 요청 동시 호출 병합 (공고 오픈 직후 트래픽 급증 대비)
+        self._singleflight = SingleFlight()
+
+        # API 계열별 QPS 제한 및 서킷 브레이커
+        self._limiters = {
+            MAPS_API: TokenBucket(settings.NAVER_MAPS_QPS),
+            SEARCH_API: TokenBucket(settings.NAVER_SEARCH_QPS),
+        }
+        self._breakers = {
+            api: CircuitBreaker(
+                failure_threshold=settings.NAVER_BREAKER_FAILURE_THRESHOLD,
+                reset_timeout=settings.NAVER_BREAKER_RESET_SECONDS,
+            )
+            for api in (MAPS_API, SEARCH_API)
+        }
+
+        # 업스트림 장애 시 사용할 마지막 정상 응답 (LRU)
+        self._fallback_cache: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._fallback_hits = 0
+        self._retries = {MAPS_API: 0, SEARCH_API: 0}
+
+    async def _coalesce(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        같은 키로 진행 중인 업스트림 호출이 있으면 그 결과를 공유합니다.
+        호출자 간 결과 객체 공유로 인한 부작용을 막기 위해 사본을 반환합니다.
+
+        업스트림이 실패하면 같은 키의 마지막 정상 응답으로 대체하고,
+        그마저 없으면 NaverApiError를 그대로 전달합니다.
+        """
+        try:
+            result = await self._singleflight.do(key, func)
+        except NaverApiError as exc:
+            if key in self._fallback_cache:
+                self._fallback_hits += 1
+                logger.warning("Naver %s API unavailable (%s); serving cached result for %s", exc.api, exc, key)
+                return copy.deepcopy(self._fallback_cache[key])
+            raise
+
+        if result is not None:
+            self._fallback_cache[key] = result
+            self._fallback_cache.move_to_end(key)
+            while len(self._fallback_cache) > settings.NAVER_FALLBACK_CACHE_SIZE:
+                self._fallback_cache.popitem(last=False)
+        return copy.deepcopy(result)
+
+    async def _get(
+        self,
+        api: str,
+        url: str,
+        params: Dict[str, Any],
+        headers: Dict[str, str],
+    ) -> httpx.Response:
+        """
+        QPS 제한, 재시도(지수 백오프 + jitter), 서킷 브레이커를 적용한 GET 요청
+
+        429/5xx 및 네트워크 오류만 재시도하며, 그 외 응답(200, 4xx)은 그대로 반환합니다.
+        """
+        breaker = self._breakers[api]
+        if not breaker.allow_request():
+            raise NaverApiUnavailable(api, f"Naver {api} API circuit is open")
+
+        limiter = self._limiters[api]
+        attempts = max(1, settings.NAVER_RETRY_MAX_ATTEMPTS)
+        last_error = ""
+        last_status: Optional[int] = None
+
+        # 어떤 경로로 끝나든(취소, 예상 밖의 예외 포함) 브레이커에 결과를 남기거나
+        # 반열림 시험 슬롯을 반환해야 브레이커가 반열림 상태에 묶이지 않습니다.
+        recorded = False
+        try:
+            for attempt in range(attempts):
+                await limiter.acquire()
+                retry_after: Optional[float] = None
+                try:
+                    async with httpx.AsyncClient() as client:
+                        response = await client.get(url, params=params, headers=headers, timeout=10.0)
+                except httpx.TransportError as exc:
+                    last_error = f"{type(exc).__name__}: {exc}"
+                    last_status = None
+                else:
+                    if response.status_code not in RETRYABLE_STATUS_CODES:
+                        recorded = True
+                        breaker.record_success()
+                        return response
+                    last_error = f"HTTP {response.status_code}"
+                    last_status = response.status_code
+                    retry_after = self._parse_retry_after(response)
+
+                if attempt + 1 < attempts:
+                    self._retries[api] += 1
+                    delay = backoff_delay(attempt, settings.NAVER_RETRY_BASE_DELAY, settings.NAVER_RETRY_MAX_DELAY)
+                    if retry_after is not None:
+                        delay = max(delay, min(retry_after, settings.NAVER_RETRY_MAX_DELAY))
+                    logger.info("Naver %s API %s; retrying in %.2fs (%d/%d)", api, last_error, delay, attempt + 1, attempts - 1)
+                    await asyncio.sleep(delay)
+
+            recorded = True
+            breaker.record_failure()
+            raise NaverApiError(api, f"Naver {api} API failed after {attempts} attempts: {last_error}", last_status)
+        except httpx.HTTPError as exc:
+            # 재시도 대상이 아닌 httpx 오류 (DecodingError, InvalidURL 등)
+            recorded = True
+            breaker.record_failure()
+            raise NaverApiError(api, f"Naver {api} API request failed: {type(exc).__name__}: {exc}") from exc
+        finally:
+            if not recorded:
+                breaker.release()
+
+    @staticmethod
+    def _parse_retry_after(response: httpx.Response) -> Optional[float]:
+        value = response.headers.get("Retry-After")
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            return None
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """업스트림 호출 / 병합된 호출 수, 리미터 대기 시간, 브레이커 상태 등 서비스 지표 반환"""
+        return {
+            "singleflight": self._singleflight.stats(),
+            "rate_limiters": {api: limiter.stats() for api, limiter in self._limiters.items()},
+            "circuit_breakers": {api: breaker.stats() for api, breaker in self._breakers.items()},
+            "retries": dict(self._retries),
+            "fallback": {
+                "cached_keys": len(self._fallback_cache),
+                "hits": self._fallback_hits,
+            },
+        }
+
     def _get_headers(self) -> Dict[str, str]:
         """네이버 클라우드 Maps API용 헤더"""
         return {
@@ -54,30 +248,30 @@ class NaverMapsService:
         Returns:
             {"lat": float, "lng": float, "address": str} 또는 None
         """
-        url = f"{self.BASE_URL}/map-geocode/v2/geocode"
+        return await self._coalesce(
+            ("geocode", address.strip()),
+            lambda: self._geocode_upstream(address),
+        )
+
+    async def _geocode_upstream(self, address: str) -> Optional[Dict[str, Any]]:
+        url = f"{self.base_url}/map-geocode/v2/geocode"
         params = {"query": address}
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                url,
-                params=params,
-                headers=self._get_headers(),
-                timeout=10.0
-            )
+        response = await self._get(MAPS_API, url, params, self._get_headers())
 
-            if response.status_code != 200:
-                return None
+        if response.status_code != 200:
+            return None
 
-            data = response.json()
-            if not data.get("addresses"):
-                return None
+        data = response.json()
+        if not data.get("addresses"):
+            return None
 
-            first_result = data["addresses"][0]
-            return {
-                "lat": float(first_result["y"]),
-                "lng": float(first_result["x"]),
-                "address": first_result.get("roadAddress") or first_result.get("jibunAddress"),
-            }
+        first_result = data["addresses"][0]
+        return {
+            "lat": float(first_result["y"]),
+            "lng": float(first_result["x"]),
+            "address": first_result.get("roadAddress") or first_result.get("jibunAddress"),
+        }
 
     async def reverse_geocode(self, lat: float, lng: float) -> Optional[Dict[str, Any]]:
         """
@@ -90,53 +284,48 @@ class NaverMapsService:
         Returns:
             {"address": str, "region": dict} 또는 None
         """
-        url = f"{self.BASE_URL}/map-reversegeocode/v2/gc"
+        return await self._coalesce(
+            ("reverse_geocode", lat, lng),
+            lambda: self._reverse_geocode_upstream(lat, lng),
+        )
+
+    async def _reverse_geocode_upstream(self, lat: float, lng: float) -> Optional[Dict[str, Any]]:
+        url = f"{self.base_url}/map-reversegeocode/v2/gc"
         params = {
             "coords": f"{lng},{lat}",
             "orders": "roadaddr,addr",
             "output": "json"
         }
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                url,
-                params=params,
-                headers=self._get_headers(),
-                timeout=10.0
-            )
+        response = await self._get(MAPS_API, url, params, self._get_headers())
+        logger.debug("Reverse geocode %s status=%s", params["coords"], response.status_code)
+
+        if response.status_code != 200:
+            return None
+
+        data = response.json()
+        results = data.get("results")
+        if not results:
+            return None
+
+        first_result = results[0]
+        region = first_result.get("region", {})
 
-            print(f"[DEBUG] Reverse Geocode URL: {url}")
-            print(f"[DEBUG] Params: {params}")
-            print(f"[DEBUG] Status: {response.status_code}")
-            print(f"[DEBUG] Response: {response.text}")
-
-            if response.status_code != 200:
-                return None
-
-            data = response.json()
-            results = data.get("results")
-            if not results:
-                return None
-
-            first_result = results[0]
-            region = first_result.get("region", {})
-            land = first_result.get("land", {})
-
-            # 도로명 주소 우선, 없으면 지번 주소
-            address = None
-            if "roadaddr" in first_result:
-                address = first_result["roadaddr"].get("roadAddress")
-            if not address and "addr" in first_result:
-                address = first_result["addr"].get("jibunAddress")
-
-            return {
-                "address": address,
-                "region": {
-                    "area1": region.get("area1", {}).get("name"),  # 시/도
-                    "area2": region.get("area2", {}).get("name"),  # 구/군
-                    "area3": region.get("area3", {}).get("name"),  # 동/읍/면
-                }
+        # 도로명 주소 우선, 없으면 지번 주소
+        address = None
+        if "roadaddr" in first_result:
+            address = first_result["roadaddr"].get("roadAddress")
+        if not address and "addr" in first_result:
+            address = first_result["addr"].get("jibunAddress")
+
+        return {
+            "address": address,
+            "region": {
+                "area1": region.get("area1", {}).get("name"),  # 시/도
+                "area2": region.get("area2", {}).get("name"),  # 구/군
+                "area3": region.get("area3", {}).get("name"),  # 동/읍/면
             }
+        }
 
     async def get_directions(
         self,
@@ -159,37 +348,31 @@ class NaverMapsService:
         Returns:
             {"distance": int (m), "duration": int (ms), "path": list} 또는 None
         """
-        url = f"{self.BASE_URL}/map-direction/v1/driving"
+        url = f"{self.base_url}/map-direction/v1/driving"
         params = {
             "start": f"{start_lng},{start_lat}",
             "goal": f"{end_lng},{end_lat}",
             "option": option
         }
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                url,
-                params=params,
-                headers=self._get_headers(),
-                timeout=10.0
-            )
+        response = await self._get(MAPS_API, url, params, self._get_headers())
 
-            if response.status_code != 200:
-                return None
+        if response.status_code != 200:
+            return None
 
-            data = response.json()
-            route = data.get("route", {}).get(option)
-            if not route or len(route) == 0:
-                return None
+        data = response.json()
+        route = data.get("route", {}).get(option)
+        if not route or len(route) == 0:
+            return None
 
-            summary = route[0]["summary"]
-            path = route[0]["path"]
+        summary = route[0]["summary"]
+        path = route[0]["path"]
 
-            return {
-                "distance": summary["distance"],  # 미터
-                "duration": summary["duration"],  # 밀리초
-                "path": [[p[1], p[0]] for p in path],  # [lat, lng] 형식으로 변환
-            }
+        return {
+            "distance": summary["distance"],  # 미터
+            "duration": summary["duration"],  # 밀리초
+            "path": [[p[1], p[0]] for p in path],  # [lat, lng] 형식으로 변환
+        }
 
     async def search_local(
         self,
@@ -211,9 +394,29 @@ class NaverMapsService:
 
         Returns:
             주변 시설 목록 [{"name": str, "address": str, "distance": str, ...}]
+
+        Raises:
+            NaverApiError: 재시도 후에도 검색 API가 실패하고 캐시된 결과도 없는 경우
         """
-        # 1. Reverse Geocoding으로 지역명 추출
-        location_info = await self.reverse_geocode(lat, lng)
+        return await self._coalesce(
+            ("search_local", query, lat, lng, radius, display),
+            lambda: self._search_local_upstream(query, lat, lng, radius, display),
+        )
+
+    async def _search_local_upstream(
+        self,
+        query: str,
+        lat: float,
+        lng: float,
+        radius: int,
+        display: int,
+    ) -> List[Dict[str, Any]]:
+        # 1. Reverse Geocoding으로 지역명 추출 (Maps API 장애 시 지역명 없이 검색)
+        try:
+            location_info = await self.reverse_geocode(lat, lng)
+        except NaverApiError as exc:
+            logger.warning("Reverse geocode skipped for local search: %s", exc)
+            location_info = None
         region_name = ""
         if location_info and location_info.get("region"):
             region = location_info["region"]
@@ -223,7 +426,7 @@ class NaverMapsService:
         # 검색 쿼리에 지역명 추가
         search_query = f"{region_name} {query}".strip() if region_name else query
 
-        url = f"{self.SEARCH_BASE_URL}/search/local.json"
+        url = f"{self.search_base_url}/search/local.json"
         params = {
             "query": search_query,
             "display": 20,  # 더 많이 가져와서 거리순 필터링
@@ -231,129 +434,63 @@ class NaverMapsService:
             "sort": "random"
         }
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                url,
-                params=params,
-                headers=self._get_search_headers(),
-                timeout=10.0
-            )
-
-            print(f"[DEBUG] Search Local URL: {url}")
-            print(f"[DEBUG] Query: {search_query}, Params: {params}")
-            print(f"[DEBUG] Status: {response.status_code}")
-            print(f"[DEBUG] Response: {response.text[:500]}")
-
-            if response.status_code != 200:
-                print(f"[ERROR] Search API failed with status {response.status_code}")
-                raise Exception(f"Search API returned {response.status_code}")
-
-            data = response.json()
-            items = data.get("items", [])
-
-            # 결과 가공 및 거리 계산
-            results = []
-            seen_places = set()  # 이미 추가된 장소의 정규화된 이름 추적
-
-            for item in items:
-                mapx = item.get("mapx", "")
-                mapy = item.get("mapy", "")
-
-                if not mapx or not mapy:
-                    continue
+        response = await self._get(SEARCH_API, url, params, self._get_search_headers())
+        logger.debug("Search local query=%r status=%s", search_query, response.status_code)
 
-                # 네이버 좌표를 WGS84로 변환 (간단 근사)
-                item_lng = float(mapx) / 10000000
-                item_lat = float(mapy) / 10000000
-
-                # 거리 계산 (Haversine formula - 단순 근사)
-                distance = self._calculate_distance(lat, lng, item_lat, item_lng)
+        if response.status_code != 200:
+            raise NaverApiError(
+                SEARCH_API,
+                f"Search API returned {response.status_code}",
+                response.status_code,
+            )
 
-                # 반경 내에 있는 것만 포함
-                if distance <= radius:
-                    # HTML 태그 제거
-                    name = item.get("title", "").replace("<b>", "").replace("</b>", "")
+        data = response.json()
+        items = [item for item in data.get("items", []) if item.get("mapx") and item.get("mapy")]
+        if not items:
+            return []
 
-                    # 중복 제거: 정규화된 이름으로 중복 체크
-                    normalized_name = self._normalize_place_name(name)
+        # 네이버 좌표를 WGS84로 변환 후 반경 내 후보만 거리순으로 한 번에 계산
+        lngs = np.array([float(item["mapx"]) for item in items]) / NAVER_COORD_SCALE
+        lats = np.array([float(item["mapy"]) for item in items]) / NAVER_COORD_SCALE
+        order, distances = within_radius(lat, lng, lats, lngs, radius)
 
-                    # 이미 추가된 장소는 스킵
-                    if normalized_name in seen_places:
-                        continue
+        results = []
+        seen_places = set()  # 이미 추가된 장소의 정규화된 이름 추적
 
-                    seen_places.add(normalized_name)
+        for idx, distance in zip(order.tolist(), distances.tolist()):
+            item = items[idx]
 
-                    address = item.get("roadAddress") or item.get("address", "")
+            # 중복 제거: 정규화된 이름으로 중복 체크 (가까운 장소 우선)
+            normalized_name = normalize_place_name(strip_html_bold(item.get("title", "")))
+            if normalized_name in seen_places:
+                continue
+            seen_places.add(normalized_name)
 
-                    results.append({
-                        "name": normalized_name,  # 정규화된 이름 사용
-                        "address": address,
-                        "category": item.get("category", ""),
-                        "telephone": item.get("telephone", ""),
-                        "mapx": mapx,
-                        "mapy": mapy,
-                        "link": item.get("link", ""),
-                        "distance": distance,
-                    })
+            results.append({
+                "name": normalized_name,  # 정규화된 이름 사용
+                "address": item.get("roadAddress") or item.get("address", ""),
+                "category": item.get("category", ""),
+                "telephone": item.get("telephone", ""),
+                "mapx": item["mapx"],
+                "mapy": item["mapy"],
+                "link": item.get("link", ""),
+                "distance": distance,
+            })
+            if len(results) >= display:
+                break
 
-            # 거리순 정렬 후 상위 N개만 반환
-            results.sort(key=lambda x: x["distance"])
-            return results[:display]
+        return results
 
     def _calculate_distance(self, lat1: float, lng1: float, lat2: float, lng2: float) -> float:
         """
         두 좌표 간 거리 계산 (미터 단위)
         Haversine formula 사용
         """
-        from math import radians, sin, cos, sqrt, atan2
-
-        R = 6371000  # 지구 반지름 (미터)
-
-        lat1_rad = radians(lat1)
-        lat2_rad = radians(lat2)
-        delta_lat = radians(lat2 - lat1)
-        delta_lng = radians(lng2 - lng1)
-
-        a = sin(delta_lat / 2) ** 2 + cos(lat1_rad) * cos(lat2_rad) * sin(delta_lng / 2) ** 2
-        c = 2 * atan2(sqrt(a), sqrt(1 - a))
-
-        return R * c
+        return haversine_m(lat1, lng1, lat2, lng2)
 
     def _normalize_place_name(self, name: str) -> str:
-        """
-        장소 이름을 정규화하여 중복 제거용 기본 이름 추출
-
-        예:
-        - "서울상봉초등학교체육관" → "서울상봉초등학교"
-        - "상봉역 경춘선" → "상봉역"
-        - "망우역 7호선" → "망우역"
-        - "망우공원 산책로" → "망우공원"
-        """
-        import re
-
-        # 지하철역: "역" 뒤의 노선 정보 제거
-        if "역" in name:
-            # "상봉역 경춘선" → "상봉역"
-            # "상봉역(경춘선)" → "상봉역"
-            name = re.sub(r"역\s+.+$", "역", name)
-            name = re.sub(r"역\(.+\)$", "역", name)
-
-        # 학교: 학교 이름 뒤의 세부 시설명 제거
-        for school_type in ["초등학교", "중학교", "고등학교", "대학교"]:
-            if school_type in name:
-                # "서울상봉초등학교체육관" → "서울상봉초등학교"
-                idx = name.find(school_type)
-                if idx >= 0:
-                    name = name[:idx + len(school_type)]
-                break
-
-        # 공원: 공원 이름 뒤의 세부 정보 제거
-        if "공원" in name and not name.endswith("공원"):
-            idx = name.find("공원")
-            if idx >= 0:
-                name = name[:idx + len("공원")]
-
-        return name.strip()
+        """장소 이름 정규화 (app.utils.geo.normalize_place_name 참고)"""
+        return normalize_place_name(name)
 
     async def get_nearby_places(
         self,
@@ -390,16 +527,23 @@ class NaverMapsService:
         if not self.search_client_id or not self.search_client_secret:
             raise ValueError("네이버 검색 API 키가 설정되지 않았습니다.")
 
-        # 실제 API 호출
-        places = await self.search_local(
-            query=keyword,
-            lat=lat,
-            lng=lng,
-            radius=10000,  # 10km로 확대 (서울 내 주변 시설 검색용)
-            display=5
-        )
-
-        print(f"[INFO] Search API returned {len(places)} items for category: {category}")
+        # 실제 API 호출 (업스트림 장애 시 캐시 → 더미 데이터 순으로 대체)
+        try:
+            places = await self.search_local(
+                query=keyword,
+                lat=lat,
+                lng=lng,
+                radius=10000,  # 10km로 확대 (서울 내 주변 시설 검색용)
+                display=5
+            )
+        except NaverApiError as exc:
+            # 인증 오류 등 업스트림 장애가 아닌 4xx는 그대로 전달
+            if exc.status_code is not None and exc.status_code not in RETRYABLE_STATUS_CODES:
+                raise
+            logger.warning("Search API unavailable for category %s: %s", category, exc)
+            return self._get_dummy_places(lat, lng, category)
+
+        logger.info("Search API returned %d items for category: %s", len(places), category)
         return places
 
     def _get_dummy_places(self, lat: float, lng: float, category: str) -> List[Dict[str, Any]]:
@@ -455,7 +599,7 @@ class NaverMapsService:
                 "link": "",
             })
 
-        print(f"[INFO] Using dummy data for category: {category} ({len(results)} items)")
+        logger.info("Using dummy data for category: %s (%d items)", category, len(results))
         return results
 
 
@@ -0,0 +1,297 @@
+"""
+스크래핑 작업 큐 / 실행 기록 / 임대(lease) 잠금 (DB 기반)
+
+uvicorn 워커가 여러 개이거나 호스트가 여러 대여도 스크래퍼는 한 번에 하나만 실행되도록
+scraper_leases 행 하나를 조건부 UPDATE로 잡고, 실행 중에는 주기적으로 갱신합니다.
+임대가 만료되면(프로세스 종료, 호스트 장애) 다른 워커가 가져가고,
+그 워커가 실행하던 작업은 실패로 정리됩니다.
+"""
+
+from __future__ import annotations
+
+import os
+import socket
+from datetime import timedelta
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import or_, select, update
+from sqlalchemy.exc import IntegrityError
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models import ScrapeJob, ScraperLease
+from app.utils.clock import utcnow
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+JOB_CANCELLED = "cancelled"
+FINISHED_STATES = (JOB_SUCCEEDED, JOB_FAILED, JOB_CANCELLED)
+
+LEASE_NAME = "scraper"
+
+# 이 프로세스의 식별자 (임대 holder / 작업 worker_id)
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}"
+
+
+def _lease_ttl() -> timedelta:
+    return timedelta(seconds=settings.SCRAPER_LEASE_SECONDS)
+
+
+# ---------------------------------------------------------------------- #
+# Lease
+# ---------------------------------------------------------------------- #
+def _ensure_lease_row(db) -> None:
+    if db.get(ScraperLease, LEASE_NAME) is not None:
+        return
+    db.add(ScraperLease(name=LEASE_NAME))
+    try:
+        db.commit()
+    except IntegrityError:
+        # 다른 워커가 먼저 만든 경우
+        db.rollback()
+
+
+def acquire_lease() -> bool:
+    """임대가 비어 있거나 만료되었으면 가져옴 (이미 이 프로세스가 가진 경우도 True)"""
+    db = SessionLocal()
+    try:
+        _ensure_lease_row(db)
+        now = utcnow()
+        result = db.execute(
+            update(ScraperLease)
+            .where(
+                ScraperLease.name == LEASE_NAME,
+                or_(
+                    ScraperLease.holder.is_(None),
+                    ScraperLease.expires_at.is_(None),
+                    ScraperLease.expires_at < now,
+                    ScraperLease.holder == WORKER_ID,
+                ),
+            )
+            .values(holder=WORKER_ID, expires_at=now + _lease_ttl())
+        )
+        db.commit()
+        return result.rowcount == 1
+    finally:
+        db.close()
+
+
+def renew_lease(job_id: Optional[int] = None) -> bool:
+    """임대 연장. 다른 워커에게 넘어갔으면 False"""
+    db = SessionLocal()
+    try:
+        result = db.execute(
+            update(ScraperLease)
+            .where(ScraperLease.name == LEASE_NAME, ScraperLease.holder == WORKER_ID)
+            .values(expires_at=utcnow() + _lease_ttl(), job_id=job_id)
+        )
+        db.commit()
+        return result.rowcount == 1
+    finally:
+        db.close()
+
+
+def release_lease() -> None:
+    db = SessionLocal()
+    try:
+        db.execute(
+            update(ScraperLease)
+            .where(ScraperLease.name == LEASE_NAME, ScraperLease.holder == WORKER_ID)
+            .values(holder=None, job_id=None, expires_at=None)
+        )
+        db.commit()
+    finally:
+        db.close()
+
+
+# ---------------------------------------------------------------------- #
+# Jobs
+# ---------------------------------------------------------------------- #
+def enqueue_job(start_board_id: int, days_limit: int, trigger: str = "api") -> ScrapeJob:
+    """
+    작업 등록. 이미 대기 중인 작업이 있으면 새로 만들지 않고 그 작업을 반환합니다.
+    (대기 중 작업은 실행 시점의 최신 상태를 수집하므로 중복 실행이 의미 없음)
+    """
+    db = SessionLocal()
+    try:
+        queued = db.scalars(
+            select(ScrapeJob).where(ScrapeJob.status == JOB_QUEUED).order_by(ScrapeJob.job_id.asc())
+        ).first()
+        if queued is not None:
+            return queued
+
+        job = ScrapeJob(
+            status=JOB_QUEUED,
+            trigger=trigger,
+            start_board_id=start_board_id,
+            days_limit=days_limit,
+            stage_timings={},
+            items_scraped=0,
+            rows_extracted=0,
+            cancel_requested=False,
+            created_at=utcnow(),
+        )
+        db.add(job)
+        db.commit()
+        db.refresh(job)
+        return job
+    finally:
+        db.close()
+
+
+def has_queued_jobs() -> bool:
+    db = SessionLocal()
+    try:
+        return db.scalars(select(ScrapeJob.job_id).where(ScrapeJob.status == JOB_QUEUED)).first() is not None
+    finally:
+        db.close()
+
+
+def claim_next_job() -> Optional[ScrapeJob]:
+    """가장 오래된 대기 작업을 running으로 전환 (임대를 가진 워커만 호출)"""
+    db = SessionLocal()
+    try:
+        while True:
+            job = db.scalars(
+                select(ScrapeJob).where(ScrapeJob.status == JOB_QUEUED).order_by(ScrapeJob.job_id.asc())
+            ).first()
+            if job is None:
+                return None
+            now = utcnow()
+            result = db.execute(
+                update(ScrapeJob)
+                .where(ScrapeJob.job_id == job.job_id, ScrapeJob.status == JOB_QUEUED)
+                .values(status=JOB_RUNNING, worker_id=WORKER_ID, started_at=now, heartbeat_at=now)
+            )
+            db.commit()
+            if result.rowcount == 1:
+                db.refresh(job)
+                return job
+            # 그 사이 취소된 경우 다음 작업 확인
+    finally:
+        db.close()
+
+
+def fail_orphaned_jobs() -> int:
+    """
+    임대를 새로 잡은 직후 호출: 하트비트가 끊긴 running 작업(이전 워커 장애)을 실패 처리
+    """
+    db = SessionLocal()
+    try:
+        stale_before = utcnow() - _lease_ttl()
+        result = db.execute(
+            update(ScrapeJob)
+            .where(
+                ScrapeJob.status == JOB_RUNNING,
+                ScrapeJob.worker_id != WORKER_ID,
+                or_(ScrapeJob.heartbeat_at.is_(None), ScrapeJob.heartbeat_at < stale_before),
+            )
+            .values(status=JOB_FAILED, error="worker lost (heartbeat expired)", finished_at=utcnow())
+        )
+        db.commit()
+        return result.rowcount
+    finally:
+        db.close()
+
+
+def heartbeat_job(job_id: int, progress: Dict[str, Any]) -> bool:
+    """진행 상황 저장 + 하트비트 갱신. 취소 요청 여부를 반환"""
+    db = SessionLocal()
+    try:
+        db.execute(
+            update(ScrapeJob)
+            .where(ScrapeJob.job_id == job_id)
+            .values(heartbeat_at=utcnow(), **progress)
+        )
+        db.commit()
+        cancel = db.scalars(select(ScrapeJob.cancel_requested).where(ScrapeJob.job_id == job_id)).first()
+        return bool(cancel)
+    finally:
+        db.close()
+
+
+def finish_job(job_id: int, status: str, progress: Dict[str, Any], error: Optional[str] = None) -> None:
+    db = SessionLocal()
+    try:
+        db.execute(
+            update(ScrapeJob)
+            .where(ScrapeJob.job_id == job_id)
+            .values(status=status, error=error, finished_at=utcnow(), heartbeat_at=utcnow(), **progress)
+        )
+        db.commit()
+    finally:
+        db.close()
+
+
+def request_cancel(job_id: int) -> Optional[ScrapeJob]:
+    """
+    작업 취소 요청
+
+    대기 중이면 즉시 cancelled, 실행 중이면 cancel_requested를 세워
+    실행 중인 워커가 하트비트에서 확인 후 프로세스 그룹을 종료합니다.
+    """
+    db = SessionLocal()
+    try:
+        job = db.get(ScrapeJob, job_id)
+        if job is None:
+            return None
+        db.execute(
+            update(ScrapeJob)
+            .where(ScrapeJob.job_id == job_id, ScrapeJob.status == JOB_QUEUED)
+            .values(status=JOB_CANCELLED, cancel_requested=True, finished_at=utcnow())
+        )
+        db.execute(
+            update(ScrapeJob)
+            .where(ScrapeJob.job_id == job_id, ScrapeJob.status == JOB_RUNNING)
+            .values(cancel_requested=True)
+        )
+        db.commit()
+        db.refresh(job)
+        return job
+    finally:
+        db.close()
+
+
+def get_job(job_id: int) -> Optional[ScrapeJob]:
+    db = SessionLocal()
+    try:
+        return db.get(ScrapeJob, job_id)
+    finally:
+        db.close()
+
+
+def list_jobs(limit: int = 20) -> List[ScrapeJob]:
+    db = SessionLocal()
+    try:
+        return list(db.scalars(select(ScrapeJob).order_by(ScrapeJob.job_id.desc()).limit(limit)))
+    finally:
+        db.close()
+
+
+def latest_job() -> Optional[ScrapeJob]:
+    jobs = list_jobs(limit=1)
+    return jobs[0] if jobs else None
+
+
+def job_to_status(job: ScrapeJob) -> Dict[str, Any]:
+    """DB 작업 행 → GET /announcements/scrape/status 응답 형식 (다른 워커가 실행 중인 경우)"""
+    now = utcnow()
+    running = job.status == JOB_RUNNING
+    end = job.finished_at or (now if running else None)
+    return {
+        "job_id": job.job_id,
+        "state": job.status,
+        "is_running": running,
+        "stage": job.current_stage,
+        "started_at": job.started_at.isoformat(timespec="seconds") if job.started_at else None,
+        "finished_at": job.finished_at.isoformat(timespec="seconds") if job.finished_at else None,
+        "elapsed_seconds": round((end - job.started_at).total_seconds(), 2) if job.started_at and end else None,
+        "stage_elapsed_seconds": None,
+        "stage_timings": dict(job.stage_timings or {}),
+        "items_scraped": job.items_scraped or 0,
+        "rows_extracted": job.rows_extracted or 0,
+        "error": job.error,
+        "last_log_seq": 0,
+    }
@@ -0,0 +1,271 @@
+"""
+주기 스크래핑 스케줄러 (앱 내장)
+
+POST /announcements/scrape 와 같은 작업 대기열(scrape_jobs)에 trigger="scheduler" 작업을 등록합니다.
+
+- 기본 간격(SCRAPE_SCHEDULER_INTERVAL_MINUTES)에 ±지터를 더해 실행 시각이 몰리지 않도록 분산
+- 실행 후 스파이더 체크포인트(최신 listing_number)가 그대로면 간격을 늘리고(백오프),
+  새 공고가 있으면 기본 간격으로 복귀
+- 공고 게시 시간대(SCRAPE_SCHEDULER_PEAK_HOURS)에는 짧은 간격으로, 그 밖에는 다음 게시 시간대
+  시작 시각보다 늦지 않게 실행
+- 다음 실행 시각은 scrape_schedules 테이블에 저장 → 재시작해도 유지되고,
+  여러 워커가 떠 있어도 조건부 UPDATE에 성공한 워커 하나만 실행을 등록
+"""
+
+from __future__ import annotations
+
+import logging
+import random
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+from sqlalchemy import func, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models import Announcement, ScrapeJob, ScrapeSchedule
+from app.services import scrape_jobs
+from app.services.scraper_runner import scraper_runner
+from app.utils.clock import utcnow
+
+logger = logging.getLogger(__name__)
+
+SCHEDULE_NAME = "soco_incremental"
+
+
+def _parse_peak_hours(spec: str) -> List[Tuple[int, int]]:
+    """ "9-12,14-18" → [(9, 12), (14, 18)] (끝 시각 미포함)"""
+    windows: List[Tuple[int, int]] = []
+    for part in spec.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        try:
+            start, end = (int(v) for v in part.split("-", 1))
+        except ValueError:
+            logger.warning("⚠️ 잘못된 게시 시간대 설정을 무시합니다: %s", part)
+            continue
+        if 0 <= start < end <= 24:
+            windows.append((start, end))
+    return windows
+
+
+def _is_peak_day(local: datetime) -> bool:
+    return not settings.SCRAPE_SCHEDULER_PEAK_WEEKDAYS_ONLY or local.weekday() < 5
+
+
+def _in_peak(local: datetime, windows: List[Tuple[int, int]]) -> bool:
+    return _is_peak_day(local) and any(start <= local.hour < end for start, end in windows)
+
+
+def _next_peak_start(local: datetime, windows: List[Tuple[int, int]]) -> Optional[datetime]:
+    """local 이후 가장 가까운 게시 시간대 시작 시각 (7일 이내)"""
+    if not windows:
+        return None
+    day = local.replace(hour=0, minute=0, second=0, microsecond=0)
+    for offset in range(8):
+        candidate_day = day + timedelta(days=offset)
+        if not _is_peak_day(candidate_day):
+            continue
+        for start, _ in sorted(windows):
+            candidate = candidate_day.replace(hour=start)
+            if candidate > local:
+                return candidate
+    return None
+
+
+def compute_next_run(
+    now: datetime, idle_streak: int, rng: Optional[random.Random] = None
+) -> Tuple[datetime, int]:
+    """
+    다음 실행 시각 계산
+
+    Args:
+        now: 기준 시각 (UTC, naive)
+        idle_streak: 새 공고 없이 끝난 연속 실행 수
+
+    Returns:
+        (다음 실행 시각 (UTC, naive), 지터 적용 전 간격(초))
+    """
+    rng = rng or random
+    min_seconds = settings.SCRAPE_SCHEDULER_MIN_INTERVAL_MINUTES * 60
+    max_seconds = max(min_seconds, settings.SCRAPE_SCHEDULER_MAX_INTERVAL_MINUTES * 60)
+    backoff = max(1.0, settings.SCRAPE_SCHEDULER_BACKOFF_FACTOR) ** max(0, idle_streak)
+    interval = min(max_seconds, settings.SCRAPE_SCHEDULER_INTERVAL_MINUTES * 60 * backoff)
+
+    tz = ZoneInfo(settings.SCRAPE_SCHEDULER_TIMEZONE)
+    local = now.replace(tzinfo=timezone.utc).astimezone(tz)
+    windows = _parse_peak_hours(settings.SCRAPE_SCHEDULER_PEAK_HOURS)
+    if _in_peak(local, windows):
+        interval = min(interval, settings.SCRAPE_SCHEDULER_PEAK_INTERVAL_MINUTES * 60)
+    else:
+        peak_start = _next_peak_start(local, windows)
+        if peak_start is not None:
+            interval = min(interval, (peak_start - local).total_seconds())
+    interval = max(min_seconds, interval)
+
+    jitter = interval * max(0.0, settings.SCRAPE_SCHEDULER_JITTER_RATIO)
+    delay = max(min_seconds, interval + rng.uniform(-jitter, jitter))
+    return now + timedelta(seconds=delay), int(interval)
+
+
+def _latest_listing_number(db: Session) -> Optional[int]:
+    """스파이더 체크포인트와 같은 기준 (DB의 최신 listing_number)"""
+    return db.scalar(select(func.max(Announcement.listing_number)))
+
+
+def _get_or_create_schedule(db: Session) -> ScrapeSchedule:
+    schedule = db.get(ScrapeSchedule, SCHEDULE_NAME)
+    if schedule is not None:
+        return schedule
+    # 처음 켜질 때는 바로 한 번 실행
+    db.add(ScrapeSchedule(name=SCHEDULE_NAME, next_run_at=utcnow(), idle_streak=0))
+    try:
+        db.commit()
+    except IntegrityError:
+        # 다른 워커가 먼저 만든 경우
+        db.rollback()
+    return db.get(ScrapeSchedule, SCHEDULE_NAME)
+
+
+class ScrapeScheduler:
+    """next_run_at을 주기적으로 확인해 작업을 등록하고, 끝난 작업 결과로 다음 실행 시각을 정합니다."""
+
+    def __init__(self):
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="scrape-scheduler", daemon=True)
+        self._thread.start()
+        logger.info("⏰ 스크래핑 스케줄러 시작 (확인 주기 %ss)", settings.SCRAPE_SCHEDULER_TICK_SECONDS)
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def get_state(self) -> Optional[ScrapeSchedule]:
+        db = SessionLocal()
+        try:
+            return db.get(ScrapeSchedule, SCHEDULE_NAME)
+        finally:
+            db.close()
+
+    def _loop(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.tick()
+            except Exception as exc:  # noqa: BLE001 - DB 일시 장애로 스케줄러가 멈추지 않도록
+                logger.exception("⚠️ 스크래핑 스케줄 확인 실패: %s", exc)
+            self._stop.wait(max(1.0, settings.SCRAPE_SCHEDULER_TICK_SECONDS))
+
+    def tick(self) -> None:
+        db = SessionLocal()
+        try:
+            schedule = _get_or_create_schedule(db)
+            if schedule.pending_job_id is not None:
+                job = db.get(ScrapeJob, schedule.pending_job_id)
+                if job is None or job.status in scrape_jobs.FINISHED_STATES:
+                    self._settle(db, schedule, job)
+                else:
+                    # 실행 워커가 재시작된 경우 대기 작업 / 끊긴 작업이 남지 않도록
+                    scraper_runner.ensure_dispatching()
+            elif schedule.next_run_at <= utcnow():
+                self._fire(db, schedule)
+        finally:
+            db.close()
+
+    def _fire(self, db: Session, schedule: ScrapeSchedule) -> None:
+        now = utcnow()
+        checkpoint = _latest_listing_number(db)
+        # 실행 중에는 다른 워커가 같은 회차를 다시 등록하지 않도록 next_run_at을 먼저 뒤로 옮김
+        guard = now + timedelta(minutes=max(1.0, settings.SCRAPE_SCHEDULER_MAX_INTERVAL_MINUTES))
+        claimed = db.execute(
+            update(ScrapeSchedule)
+            .where(
+                ScrapeSchedule.name == SCHEDULE_NAME,
+                ScrapeSchedule.next_run_at == schedule.next_run_at,
+                ScrapeSchedule.pending_job_id.is_(None),
+            )
+            .values(next_run_at=guard, checkpoint_before=checkpoint, last_run_at=now)
+        )
+        db.commit()
+        if claimed.rowcount != 1:
+            return
+
+        try:
+            job = scraper_runner.start(trigger="scheduler")
+        except Exception as exc:  # noqa: BLE001
+            logger.exception("❌ 예약 스크래핑 등록 실패: %s", exc)
+            next_run_at, interval = compute_next_run(now, schedule.idle_streak or 0)
+            db.execute(
+                update(ScrapeSchedule)
+                .where(ScrapeSchedule.name == SCHEDULE_NAME)
+                .values(next_run_at=next_run_at, interval_seconds=interval)
+            )
+            db.commit()
+            return
+
+        db.execute(
+            update(ScrapeSchedule)
+            .where(ScrapeSchedule.name == SCHEDULE_NAME)
+            .values(pending_job_id=job.job_id, last_job_id=job.job_id)
+        )
+        db.commit()
+        logger.info("⏰ 예약 스크래핑 등록: job_id=%s, 실행 전 체크포인트=%s", job.job_id, checkpoint)
+
+    def _settle(self, db: Session, schedule: ScrapeSchedule, job: Optional[ScrapeJob]) -> None:
+        checkpoint = _latest_listing_number(db)
+        before = schedule.checkpoint_before
+        idle_streak = schedule.idle_streak or 0
+        status = job.status if job is not None else None
+        if status == scrape_jobs.JOB_SUCCEEDED:
+            found_new = checkpoint is not None and (before is None or checkpoint > before)
+            idle_streak = 0 if found_new else idle_streak + 1
+        # 실패/취소는 새 공고 여부를 알 수 없으므로 간격을 유지
+
+        now = utcnow()
+        next_run_at, interval = compute_next_run(now, idle_streak)
+        settled = db.execute(
+            update(ScrapeSchedule)
+            .where(
+                ScrapeSchedule.name == SCHEDULE_NAME,
+                ScrapeSchedule.pending_job_id == schedule.pending_job_id,
+            )
+            .values(
+                pending_job_id=None,
+                next_run_at=next_run_at,
+                interval_seconds=interval,
+                idle_streak=idle_streak,
+                last_checkpoint=checkpoint,
+            )
+        )
+        db.commit()
+        if settled.rowcount == 1:
+            logger.info(
+                "⏰ 예약 스크래핑 종료 (job_id=%s, 상태=%s, 체크포인트 %s → %s, 연속 무변경 %d회). 다음 실행: %s UTC",
+                schedule.pending_job_id, status, before, checkpoint, idle_streak,
+                next_run_at.isoformat(timespec="seconds"),
+            )
+
+    @staticmethod
+    def describe(schedule: ScrapeSchedule) -> Dict[str, Any]:
+        return {
+            "enabled": settings.SCRAPE_SCHEDULER_ENABLED,
+            "next_run_at": schedule.next_run_at,
+            "interval_seconds": schedule.interval_seconds,
+            "idle_streak": schedule.idle_streak or 0,
+            "pending_job_id": schedule.pending_job_id,
+            "last_job_id": schedule.last_job_id,
+            "last_run_at": schedule.last_run_at,
+            "last_checkpoint": schedule.last_checkpoint,
+        }
+
+
+scrape_scheduler = ScrapeScheduler()
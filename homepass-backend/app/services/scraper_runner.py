@@ -1,14 +1,24 @@
 from __future__ import annotations
 
 import logging
+import os
+import re
+import signal
 import subprocess
 import threading
 import time
+from collections import deque
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, List, Optional, TextIO
+
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
 
 from app.config import settings
+from app.database import SessionLocal
+from app.models import ScrapeJob
+from app.services import scrape_jobs
 
 logger = logging.getLogger(__name__)
 
@@ -16,47 +26,294 @@ BACKEND_DIR = Path(__file__).resolve().parents[2]
 PROJECT_ROOT = BACKEND_DIR.parent
 DEFAULT_SCRAPER_DIR = PROJECT_ROOT / "homepass-scraper"
 
+# 단계 이름 (GET /announcements/scrape/status 의 stage 값)
+STAGE_SPIDER = "spider"
+STAGE_EXTRACTOR = "extractor"
+STAGE_GEOCODING = "geocoding"
+STAGE_COMMUTE_MATRIX = "commute_matrix"
+
+# 자식 프로세스 출력에서 진행 상황 추출
+_ITEM_SCRAPED_RE = re.compile(r"Scraped from <")  # Scrapy DEBUG: 아이템 1건마다
+_ITEM_SCRAPED_TOTAL_RE = re.compile(r"'item_scraped_count': (\d+)")  # Scrapy 종료 통계
+_ROW_EXTRACTED_MARKER = "공고 처리 성공"  # new_extractor.py: 공고 1건 처리 완료마다
+
+
+class ScrapeCancelled(Exception):
+    """취소 요청(또는 임대 상실)으로 실행을 중단할 때 사용"""
+
 
 class ScraperRunner:
-    """Launches the Scrapy crawler in a background thread."""
+    """
+    Launches the Scrapy crawler in a background thread.
+
+    실행 요청은 scrape_jobs 테이블에 대기 작업으로 등록되고, DB 임대(lease)를 잡은
+    워커 하나만 대기 작업을 순서대로 실행합니다 (uvicorn 워커/호스트가 여러 개여도 안전).
+    """
 
     def __init__(self):
         self._lock = threading.Lock()
         self._is_running = False
+        self._dispatching = False
         self._thread: Optional[threading.Thread] = None
 
+        # 현재 이 프로세스에서 실행 중인 작업 / 자식 프로세스들 (취소 시 프로세스 그룹 종료)
+        # 스파이더와 추출기가 동시에 실행되므로 여러 개일 수 있음
+        self._current_job_id: Optional[int] = None
+        self._processes: List[subprocess.Popen] = []
+
+        # 상주 추출 워커 (new_extractor.py --serve). 모델/파서를 로드한 채 실행 사이에도 유지되며
+        # 표준 입력 명령(follow | drain | idle)으로 extraction_queue 소비를 제어
+        self._extractor: Optional[subprocess.Popen] = None
+        self._extractor_lock = threading.Lock()
+        self._process_lock = threading.Lock()
+        self._cancel_event = threading.Event()
+        self._cancel_reason: Optional[str] = None
+
+        # 진행 상태 + 최근 출력 (고정 크기 링 버퍼 - 긴 실행에도 메모리 일정)
+        self._status_lock = threading.Lock()
+        self._status: Dict[str, Any] = self._new_status()
+        self._logs: deque = deque(maxlen=max(1, settings.SCRAPER_LOG_BUFFER_LINES))
+        self._log_seq = 0
+
     def is_running(self) -> bool:
         return self._is_running
 
-    def start(self, start_board_id: Optional[int] = None, days_limit: Optional[int] = None) -> None:
+    def get_status(self) -> Dict[str, Any]:
+        """현재(또는 마지막) 실행의 단계, 경과 시간, 수집/추출 건수"""
+        with self._status_lock:
+            status = dict(self._status)
+            status["stage_timings"] = dict(self._status["stage_timings"])
+            status["last_log_seq"] = self._log_seq
+            status["job_id"] = self._current_job_id
+
+        now = time.time()
+        started = status.pop("_started_ts")
+        stage_started = status.pop("_stage_started_ts")
+        finished = status.pop("_finished_ts")
+        status["is_running"] = self._is_running
+        status["elapsed_seconds"] = round((finished or now) - started, 2) if started else None
+        status["stage_elapsed_seconds"] = (
+            round(now - stage_started, 2) if stage_started and self._is_running else None
+        )
+        return status
+
+    def get_logs(self, after_seq: int = 0, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """링 버퍼에서 after_seq 이후의 출력 라인 (오래된 라인은 이미 밀려났을 수 있음)"""
+        with self._status_lock:
+            lines = [entry for entry in self._logs if entry["seq"] > after_seq]
+        if limit is not None:
+            lines = lines[-limit:] if limit > 0 else []
+        return lines
+
+    def start(
+        self,
+        start_board_id: Optional[int] = None,
+        days_limit: Optional[int] = None,
+        trigger: str = "api",
+    ) -> ScrapeJob:
+        """
+        스크래핑 작업을 대기열에 등록하고, 임대를 잡을 수 있으면 이 프로세스에서 실행합니다.
+
+        Returns:
+            등록된 (또는 이미 대기 중이던) 작업
+        """
         logger.info("=" * 80)
         logger.info("🚀 Scraper Runner 시작 요청")
         logger.info(f"   시작 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        logger.info(f"   파라미터: start_board_id={start_board_id}, days_limit={days_limit}")
-        
-        with self._lock:
-            if self._is_running:
-                logger.warning("⚠️ 이미 실행 중인 스크래퍼가 있습니다.")
-                raise RuntimeError("Scraper is already running")
-            self._is_running = True
-            logger.info("✅ 스크래퍼 시작 가능 (잠금 획득)")
-
-        thread = threading.Thread(
-            target=self._run_scraper,
-            kwargs={
-                "start_board_id": start_board_id or settings.SCRAPER_START_BOARD_ID,
-                "days_limit": days_limit or settings.SCRAPER_DAYS_LIMIT,
-            },
-            daemon=True,
+        logger.info(f"   파라미터: start_board_id={start_board_id}, days_limit={days_limit}, trigger={trigger}")
+
+        job = scrape_jobs.enqueue_job(
+            start_board_id or settings.SCRAPER_START_BOARD_ID,
+            days_limit or settings.SCRAPER_DAYS_LIMIT,
+            trigger=trigger,
         )
+        logger.info(f"📥 작업 대기열 등록: job_id={job.job_id}, status={job.status}")
+
+        if not self.ensure_dispatching():
+            logger.info("   이 프로세스의 실행 스레드가 대기열을 이어서 처리합니다.")
+        logger.info("=" * 80)
+        return job
+
+    def ensure_dispatching(self) -> bool:
+        """
+        실행 스레드가 없으면 시작 (대기 작업 처리 / 하트비트가 끊긴 작업 정리)
+        프로세스 재시작 후 남은 대기 작업을 이어서 처리할 때도 사용합니다.
+
+        Returns:
+            새 스레드를 시작했으면 True
+        """
+        with self._lock:
+            if self._dispatching:
+                return False
+            self._dispatching = True
+
+        thread = threading.Thread(target=self._dispatch_loop, daemon=True)
         thread.start()
         self._thread = thread
         logger.info(f"🧵 백그라운드 스레드 시작됨 (Thread ID: {thread.ident})")
-        logger.info("=" * 80)
+        return True
+
+    def cancel(self, job_id: int) -> Optional[ScrapeJob]:
+        """
+        작업 취소. 대기 중이면 바로 취소되고, 실행 중이면 자식 프로세스 그룹을 종료합니다.
+        (다른 워커가 실행 중이면 그 워커가 다음 하트비트에서 종료)
+        """
+        job = scrape_jobs.request_cancel(job_id)
+        if job is not None and job_id == self._current_job_id:
+            self._cancel_local("취소 요청")
+        return job
 
     # ------------------------------------------------------------------ #
     # Internal helpers
     # ------------------------------------------------------------------ #
+    def _dispatch_loop(self) -> None:
+        try:
+            while True:
+                if not scrape_jobs.acquire_lease():
+                    logger.info("🔒 다른 워커가 스크래퍼를 실행 중입니다. 작업은 대기열에서 처리됩니다.")
+                    break
+
+                orphaned = scrape_jobs.fail_orphaned_jobs()
+                if orphaned:
+                    logger.warning(f"⚠️ 하트비트가 끊긴 작업 {orphaned}건을 실패 처리했습니다.")
+
+                while (job := scrape_jobs.claim_next_job()) is not None:
+                    self._execute_job(job)
+                    scrape_jobs.renew_lease()
+
+                scrape_jobs.release_lease()
+                logger.info("🔓 스크래퍼 임대 해제됨")
+
+                # 임대 해제 직전에 등록된 작업이 남지 않도록 한 번 더 확인
+                with self._lock:
+                    if not scrape_jobs.has_queued_jobs():
+                        self._dispatching = False
+                        return
+        except Exception as exc:  # noqa: BLE001
+            logger.exception("💥 스크래퍼 작업 처리 중 오류: %s", exc)
+            try:
+                scrape_jobs.release_lease()
+            except Exception:  # noqa: BLE001
+                logger.exception("임대 해제 실패")
+        with self._lock:
+            self._dispatching = False
+
+    def _execute_job(self, job: ScrapeJob) -> None:
+        with self._status_lock:
+            self._status = self._new_status()
+            self._status["state"] = "running"
+            self._status["started_at"] = datetime.now().isoformat(timespec="seconds")
+            self._status["_started_ts"] = time.time()
+            self._logs.clear()
+
+        self._current_job_id = job.job_id
+        self._cancel_event.clear()
+        self._cancel_reason = None
+        with self._lock:
+            self._is_running = True
+            logger.info(f"✅ 작업 {job.job_id} 실행 시작 (잠금 획득)")
+
+        stop_heartbeat = threading.Event()
+        heartbeat = threading.Thread(
+            target=self._heartbeat_loop, args=(job.job_id, stop_heartbeat), daemon=True
+        )
+        heartbeat.start()
+        try:
+            self._run_scraper(job.job_id, job.start_board_id, job.days_limit)
+        finally:
+            stop_heartbeat.set()
+            heartbeat.join()
+            self._current_job_id = None
+
+    def _heartbeat_loop(self, job_id: int, stop: threading.Event) -> None:
+        """임대 연장 + 진행 상황 저장 + 취소 요청 확인"""
+        while not stop.wait(max(1.0, settings.SCRAPER_HEARTBEAT_SECONDS)):
+            try:
+                if not scrape_jobs.renew_lease(job_id):
+                    logger.error("❌ 스크래퍼 임대를 잃었습니다. 실행을 중단합니다.")
+                    self._cancel_local("임대 상실 (다른 워커가 임대를 가져감)")
+                    return
+                if scrape_jobs.heartbeat_job(job_id, self._progress()):
+                    self._cancel_local("취소 요청")
+            except Exception as exc:  # noqa: BLE001 - DB 일시 장애로 실행을 중단하지 않음
+                logger.warning("⚠️ 하트비트 실패: %s", exc)
+
+    def _progress(self) -> Dict[str, Any]:
+        with self._status_lock:
+            return {
+                "current_stage": self._status["stage"],
+                "stage_timings": dict(self._status["stage_timings"]),
+                "items_scraped": self._status["items_scraped"],
+                "rows_extracted": self._status["rows_extracted"],
+            }
+
+    def _cancel_local(self, reason: str) -> None:
+        if self._cancel_event.is_set():
+            return
+        logger.warning(f"🛑 스크래퍼 실행 중단: {reason}")
+        self._cancel_reason = reason
+        self._cancel_event.set()
+        self._terminate_processes()
+
+    def _check_cancelled(self) -> None:
+        if self._cancel_event.is_set():
+            raise ScrapeCancelled(self._cancel_reason or "취소 요청")
+
+    def _terminate_processes(self) -> None:
+        with self._process_lock:
+            processes = list(self._processes)
+        for process in processes:
+            self._terminate_process(process)
+
+    def _terminate_process(self, process: subprocess.Popen) -> None:
+        """자식 프로세스 그룹에 SIGTERM, 유예 시간 후에도 살아 있으면 SIGKILL"""
+        if process.poll() is not None:
+            return
+
+        try:
+            os.killpg(process.pid, signal.SIGTERM)
+        except ProcessLookupError:
+            return
+
+        def force_kill() -> None:
+            try:
+                process.wait(timeout=settings.SCRAPER_CANCEL_GRACE_SECONDS)
+            except subprocess.TimeoutExpired:
+                logger.warning("⚠️ 유예 시간 내 종료되지 않아 강제 종료합니다 (pid=%s)", process.pid)
+                try:
+                    os.killpg(process.pid, signal.SIGKILL)
+                except ProcessLookupError:
+                    pass
+
+        threading.Thread(target=force_kill, daemon=True).start()
+
+    @staticmethod
+    def _new_status() -> Dict[str, Any]:
+        return {
+            "state": "idle",  # idle | running | succeeded | failed | cancelled
+            "stage": None,
+            "started_at": None,
+            "finished_at": None,
+            "items_scraped": 0,
+            "rows_extracted": 0,
+            "stage_timings": {},  # 단계 이름 → 소요 시간(초)
+            "error": None,
+            "_started_ts": None,
+            "_stage_started_ts": None,
+            "_finished_ts": None,
+        }
+
+    def _update_status(self, **fields: Any) -> None:
+        with self._status_lock:
+            self._status.update(fields)
+
+    def _enter_stage(self, stage: str) -> None:
+        self._update_status(stage=stage, _stage_started_ts=time.time())
+
+    def _record_stage(self, stage: str, elapsed: float) -> None:
+        with self._status_lock:
+            self._status["stage_timings"][stage] = round(elapsed, 2)
+
     def _resolve_paths(self) -> tuple[Path, Path]:
         logger.info("📁 경로 확인 중...")
         
@@ -79,10 +336,13 @@ class ScraperRunner:
 
         return scraper_dir, python_path
 
-    def _run_scraper(self, start_board_id: int, days_limit: int) -> None:
+    def _run_scraper(self, job_id: int, start_board_id: int, days_limit: int) -> None:
         start_time = time.time()
+        final_state = scrape_jobs.JOB_FAILED
+        error: Optional[str] = None
         logger.info("=" * 80)
         logger.info("🔧 Scraper Pipeline 실행 시작")
+        logger.info(f"   job_id: {job_id}")
         logger.info(f"   start_board_id: {start_board_id}")
         logger.info(f"   days_limit: {days_limit}")
         logger.info("=" * 80)
@@ -90,44 +350,104 @@ class ScraperRunner:
         try:
             scraper_dir, python_path = self._resolve_paths()
             
-            # Step 1: SOCO Spider
+            # Step 1~2: SOCO Spider + Extractor (동시 실행)
+            # 스파이더가 upsert한 공고는 extraction_queue를 통해 바로 추출기로 전달됨
             logger.info("=" * 80)
-            logger.info("📡 [1/2] SOCO Spider 실행")
+            logger.info("📡 [1-2/4] SOCO Spider + New Extractor 동시 실행")
             logger.info("=" * 80)
-            step1_start = time.time()
-            self._run_soco_spider(scraper_dir, python_path, start_board_id, days_limit)
-            step1_elapsed = time.time() - step1_start
-            logger.info(f"✅ [1/2] SOCO Spider 완료 (소요 시간: {step1_elapsed:.2f}초)")
-            
+            self._check_cancelled()
+            self._run_crawl_and_extract(scraper_dir, python_path, start_board_id, days_limit)
+
             # LH importer는 제외 (사용자 요청으로 실행하지 않음)
             # self._run_lh_import(scraper_dir, python_path)
-            
-            # Step 2: Extractor
+
+            # Step 3: 좌표 없는 공고 Geocoding (추출된 address_detail 기준)
+            logger.info("=" * 80)
+            logger.info("📍 [3/4] 공고 좌표 변환")
+            logger.info("=" * 80)
+            self._check_cancelled()
+            self._enter_stage(STAGE_GEOCODING)
+            step3_start = time.time()
+            self._run_announcement_geocoding()
+            step3_elapsed = time.time() - step3_start
+            self._record_stage(STAGE_GEOCODING, step3_elapsed)
+            logger.info(f"✅ [3/4] 공고 좌표 변환 완료 (소요 시간: {step3_elapsed:.2f}초)")
+
+            # Step 4: 출퇴근 시간 행렬 갱신 (새 공고 반영)
             logger.info("=" * 80)
-            logger.info("🔬 [2/2] New Extractor 실행")
+            logger.info("🧭 [4/4] 출퇴근 시간 행렬 갱신")
             logger.info("=" * 80)
-            step2_start = time.time()
-            self._run_extractor(scraper_dir, python_path)
-            step2_elapsed = time.time() - step2_start
-            logger.info(f"✅ [2/2] New Extractor 완료 (소요 시간: {step2_elapsed:.2f}초)")
+            self._check_cancelled()
+            self._enter_stage(STAGE_COMMUTE_MATRIX)
+            step4_start = time.time()
+            self._run_commute_matrix()
+            step4_elapsed = time.time() - step4_start
+            self._record_stage(STAGE_COMMUTE_MATRIX, step4_elapsed)
+            logger.info(f"✅ [4/4] 출퇴근 시간 행렬 갱신 완료 (소요 시간: {step4_elapsed:.2f}초)")
             
             total_elapsed = time.time() - start_time
+            final_state = scrape_jobs.JOB_SUCCEEDED
+            self._update_status(state="succeeded")
             logger.info("=" * 80)
             logger.info("🎉 Scraper Pipeline 전체 완료!")
             logger.info(f"   총 소요 시간: {total_elapsed:.2f}초")
             logger.info(f"   종료 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
             logger.info("=" * 80)
             
+        except ScrapeCancelled as exc:
+            final_state = scrape_jobs.JOB_CANCELLED
+            error = str(exc)
+            self._update_status(state="cancelled", error=error)
+            logger.warning(f"🛑 Scraper pipeline 취소됨 (소요 시간: {time.time() - start_time:.2f}초): {exc}")
         except Exception as exc:  # noqa: BLE001
             elapsed = time.time() - start_time
+            error = str(exc)
+            self._update_status(state="failed", error=error)
             logger.error("=" * 80)
             logger.exception("💥 Scraper pipeline failed (소요 시간: %.2f초): %s", elapsed, exc)
             logger.error("=" * 80)
         finally:
+            self._update_status(
+                finished_at=datetime.now().isoformat(timespec="seconds"),
+                _finished_ts=time.time(),
+            )
+            try:
+                scrape_jobs.finish_job(job_id, final_state, self._progress(), error)
+            except Exception:  # noqa: BLE001
+                logger.exception("작업 결과 저장 실패 (job_id=%s)", job_id)
             with self._lock:
                 self._is_running = False
                 logger.info("🔓 스크래퍼 잠금 해제됨")
 
+    def _run_crawl_and_extract(
+        self, scraper_dir: Path, python_path: Path, start_board_id: int, days_limit: int
+    ) -> None:
+        """
+        상주 추출 워커를 follow 모드로 깨우고 스파이더를 실행합니다.
+        스파이더가 끝나면(실패 포함) drain 명령을 보내고, 큐가 빌 때까지 기다립니다.
+        """
+        extractor = self._ensure_extractor_worker(scraper_dir, python_path)
+        self._send_extractor_command("follow")
+
+        pipeline_start = time.time()
+        try:
+            self._enter_stage(STAGE_SPIDER)
+            self._run_soco_spider(scraper_dir, python_path, start_board_id, days_limit)
+            spider_elapsed = time.time() - pipeline_start
+            self._record_stage(STAGE_SPIDER, spider_elapsed)
+            logger.info(f"✅ [1/4] SOCO Spider 완료 (소요 시간: {spider_elapsed:.2f}초)")
+        finally:
+            # 취소 시에는 처리 중인 공고까지만 마치고 대기 (남은 큐는 다음 실행에서 처리)
+            self._send_extractor_command("idle" if self._cancel_event.is_set() else "drain")
+
+        # 스파이더 종료 후에는 남은 큐를 비우는 추출 단계
+        self._enter_stage(STAGE_EXTRACTOR)
+        if extractor is not None:
+            self._wait_for_extraction(extractor)
+        extractor_elapsed = time.time() - pipeline_start
+        self._record_stage(STAGE_EXTRACTOR, extractor_elapsed)
+        logger.info(f"✅ [2/4] New Extractor 완료 (스파이더 시작부터 {extractor_elapsed:.2f}초)")
+
     def _run_soco_spider(self, scraper_dir: Path, python_path: Path, start_board_id: int, days_limit: int) -> None:
         cmd = [
             str(python_path),
@@ -150,17 +470,109 @@ class ScraperRunner:
         cmd = [str(python_path), str(lh_script)]
         self._run_subprocess(cmd, scraper_dir, "LH importer")
 
-    def _run_extractor(self, scraper_dir: Path, python_path: Path) -> None:
-        extractor_script = scraper_dir / "new_extractor.py"
-        logger.info(f"📄 Extractor 스크립트 경로: {extractor_script}")
-        
-        if not extractor_script.exists():
-            logger.warning("⚠️ Extractor script not found at %s; skipping", extractor_script)
+    def _ensure_extractor_worker(self, scraper_dir: Path, python_path: Path) -> Optional[subprocess.Popen]:
+        """상주 추출 워커가 없거나 종료되었으면 새로 띄움 (첫 실행에서만 모델 로드 비용 발생)"""
+        with self._extractor_lock:
+            if self._extractor is not None and self._extractor.poll() is None:
+                return self._extractor
+            if self._extractor is not None:
+                logger.warning(f"⚠️ 상주 추출 워커가 종료되어 다시 시작합니다 (종료 코드: {self._extractor.returncode})")
+
+            extractor_script = scraper_dir / "new_extractor.py"
+            logger.info(f"📄 Extractor 스크립트 경로: {extractor_script}")
+            if not extractor_script.exists():
+                logger.warning("⚠️ Extractor script not found at %s; skipping", extractor_script)
+                self._extractor = None
+                return None
+
+            cmd = [
+                str(python_path),
+                str(extractor_script),
+                "--serve",
+                "--workers",
+                str(settings.SCRAPER_EXTRACTOR_WORKERS),
+            ]
+            logger.info(f"▶️  상주 추출 워커 시작: {' '.join(cmd)}")
+            # 취소 시 스파이더 프로세스 그룹만 종료되도록 별도 세션으로 실행.
+            # 백엔드가 종료되면 표준 입력이 닫히고 워커도 스스로 종료합니다.
+            process = subprocess.Popen(
+                cmd,
+                cwd=str(scraper_dir),
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                bufsize=1,
+                env={**os.environ, "PYTHONUNBUFFERED": "1"},
+                start_new_session=True,
+            )
+            for stream, stream_name in ((process.stdout, "stdout"), (process.stderr, "stderr")):
+                threading.Thread(
+                    target=self._pump_output, args=(stream, "New extractor", stream_name), daemon=True
+                ).start()
+            self._extractor = process
+            return process
+
+    def _send_extractor_command(self, command: str) -> None:
+        with self._extractor_lock:
+            process = self._extractor
+            if process is None or process.poll() is not None or process.stdin is None:
+                return
+            try:
+                process.stdin.write(command + "\n")
+                process.stdin.flush()
+            except (BrokenPipeError, OSError) as exc:
+                logger.warning("⚠️ 추출 워커에 명령 전달 실패 (%s): %s", command, exc)
+
+    @staticmethod
+    def _extraction_backlog() -> Optional[int]:
+        """extraction_queue의 대기 + 처리 중 작업 수 (테이블이 아직 없으면 None)"""
+        db = SessionLocal()
+        try:
+            return db.scalar(
+                text("SELECT COUNT(*) FROM extraction_queue WHERE status IN ('pending', 'processing')")
+            )
+        except SQLAlchemyError:
+            return None
+        finally:
+            db.close()
+
+    def _wait_for_extraction(self, extractor: subprocess.Popen) -> None:
+        deadline = time.time() + settings.SCRAPER_EXTRACTOR_DRAIN_TIMEOUT_SECONDS
+        while True:
+            if self._cancel_event.is_set():
+                self._send_extractor_command("idle")
+                self._check_cancelled()
+            if extractor.poll() is not None:
+                raise RuntimeError(f"상주 추출 워커가 종료되었습니다 (종료 코드: {extractor.returncode})")
+            if self._extraction_backlog() == 0:
+                return
+            if time.time() > deadline:
+                logger.warning("⚠️ 추출 대기 시간 초과: 남은 공고는 추출 워커가 계속 처리합니다.")
+                return
+            self._cancel_event.wait(1.0)
+
+    def _run_announcement_geocoding(self) -> None:
+        from app.services.announcement_geocoder import run_announcement_geocoding
+
+        try:
+            summary = run_announcement_geocoding()
+        except Exception as exc:  # noqa: BLE001 - 좌표 변환 실패가 스크래핑 결과를 무효화하지 않도록
+            logger.exception("⚠️ 공고 좌표 변환 실패: %s", exc)
             return
-        
-        logger.info("✅ Extractor 스크립트 확인됨")
-        cmd = [str(python_path), str(extractor_script)]
-        self._run_subprocess(cmd, scraper_dir, "New extractor")
+        if summary is not None:
+            logger.info(f"   결과: {summary}")
+
+    def _run_commute_matrix(self) -> None:
+        from app.services.commute_matrix import run_commute_matrix_job
+
+        try:
+            summary = run_commute_matrix_job()
+        except Exception as exc:  # noqa: BLE001 - 행렬 갱신 실패가 스크래핑 결과를 무효화하지 않도록
+            logger.exception("⚠️ 출퇴근 시간 행렬 갱신 실패: %s", exc)
+            return
+        if summary is not None:
+            logger.info(f"   결과: {summary}")
 
     def _run_subprocess(self, cmd: list[str], cwd: Path, label: str) -> None:
         logger.info("-" * 80)
@@ -168,53 +580,89 @@ class ScraperRunner:
         logger.info(f"   작업 디렉토리: {cwd}")
         logger.info(f"   실행 명령어: {' '.join(cmd)}")
         logger.info("-" * 80)
-        
+
+        # 자식 프로세스 출력이 블록 버퍼링되지 않도록
+        env = {**os.environ, "PYTHONUNBUFFERED": "1"}
+
+        self._check_cancelled()
         start_time = time.time()
+        # 새 세션(프로세스 그룹)으로 실행 → 취소 시 자식이 띄운 프로세스까지 함께 종료
+        process = subprocess.Popen(
+            cmd,
+            cwd=str(cwd),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            bufsize=1,
+            env=env,
+            start_new_session=True,
+        )
+        with self._process_lock:
+            self._processes.append(process)
+        # stdout/stderr를 각각 라인 단위로 읽어 링 버퍼에 쌓음 (전체 출력을 메모리에 모으지 않음)
+        readers = [
+            threading.Thread(target=self._pump_output, args=(process.stdout, label, "stdout"), daemon=True),
+            threading.Thread(target=self._pump_output, args=(process.stderr, label, "stderr"), daemon=True),
+        ]
+        for reader in readers:
+            reader.start()
         try:
-            result = subprocess.run(
-                cmd, 
-                cwd=str(cwd), 
-                check=True,
-                capture_output=True,
-                text=True
-            )
-            elapsed = time.time() - start_time
-            
-            logger.info("-" * 80)
-            logger.info(f"✅ {label} 성공 (소요 시간: {elapsed:.2f}초)")
-            
-            # stdout 출력 (new_extractor.py의 로그)
-            if result.stdout:
-                logger.info(f"📝 {label} 출력:")
-                for line in result.stdout.splitlines():
-                    logger.info(f"   {line}")
-            
-            # stderr가 있으면 경고로 출력
-            if result.stderr:
-                logger.warning(f"⚠️ {label} 경고/에러 출력:")
-                for line in result.stderr.splitlines():
-                    logger.warning(f"   {line}")
-            
-            logger.info("-" * 80)
-            
-        except subprocess.CalledProcessError as e:
-            elapsed = time.time() - start_time
+            returncode = process.wait()
+            for reader in readers:
+                reader.join()
+        finally:
+            with self._process_lock:
+                self._processes.remove(process)
+        elapsed = time.time() - start_time
+
+        if self._cancel_event.is_set():
+            logger.warning(f"🛑 {label} 중단됨 (소요 시간: {elapsed:.2f}초, 종료 코드: {returncode})")
+            self._check_cancelled()
+
+        if returncode != 0:
             logger.error("-" * 80)
             logger.error(f"❌ {label} 실패 (소요 시간: {elapsed:.2f}초)")
-            logger.error(f"   종료 코드: {e.returncode}")
-            
-            if e.stdout:
-                logger.error(f"   표준 출력:")
-                for line in e.stdout.splitlines():
-                    logger.error(f"      {line}")
-            
-            if e.stderr:
-                logger.error(f"   에러 출력:")
-                for line in e.stderr.splitlines():
-                    logger.error(f"      {line}")
-            
+            logger.error(f"   종료 코드: {returncode}")
             logger.error("-" * 80)
-            raise
+            raise subprocess.CalledProcessError(returncode, cmd)
+
+        logger.info("-" * 80)
+        logger.info(f"✅ {label} 성공 (소요 시간: {elapsed:.2f}초)")
+        logger.info("-" * 80)
+
+    def _pump_output(self, stream: TextIO, label: str, stream_name: str) -> None:
+        for raw_line in stream:
+            line = raw_line.rstrip("\n")
+            if not line:
+                continue
+            # stderr는 기존과 같이 경고 레벨로 기록 (Scrapy 로그는 stderr로 출력됨)
+            if stream_name == "stderr":
+                logger.warning(f"   [{label}] {line}")
+            else:
+                logger.info(f"   [{label}] {line}")
+            self._append_log(label, stream_name, line)
+        stream.close()
+
+    def _append_log(self, label: str, stream_name: str, line: str) -> None:
+        with self._status_lock:
+            self._log_seq += 1
+            self._logs.append(
+                {
+                    "seq": self._log_seq,
+                    "time": datetime.now().isoformat(timespec="seconds"),
+                    "source": label,
+                    "stream": stream_name,
+                    "line": line,
+                }
+            )
+
+            if _ITEM_SCRAPED_RE.search(line):
+                self._status["items_scraped"] += 1
+            elif (match := _ITEM_SCRAPED_TOTAL_RE.search(line)) is not None:
+                # 종료 통계가 최종 값 (DEBUG 로그가 꺼져 있어도 정확)
+                self._status["items_scraped"] = int(match.group(1))
+            elif _ROW_EXTRACTED_MARKER in line:
+                self._status["rows_extracted"] += 1
 
 
 scraper_runner = ScraperRunner()
@@ -0,0 +1,141 @@
+"""
+사용자 주소 / 출퇴근 기준지 좌표 관리
+
+주소를 저장할 때 한 번만 Geocoding하여 Users.address_lat/lng,
+Preferences.commute_base_lat/lng 에 보관합니다. 출퇴근 경로 조회와
+출퇴근 시간 행렬 계산은 저장된 좌표를 사용하고, 좌표가 비어 있는 경우
+(이전 데이터, 저장 당시 네이버 API 장애)에만 다시 변환해 채웁니다.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Optional, Tuple
+
+from sqlalchemy import delete
+from sqlalchemy.orm import Session
+
+from app.models import CommuteTime, Preference, User
+from app.services.naver_maps import NaverApiError, NaverMapsService
+
+logger = logging.getLogger(__name__)
+
+Coords = Tuple[float, float]
+
+
+def normalize_address(address: str) -> str:
+    return " ".join(address.split())
+
+
+async def geocode_address(naver_maps: NaverMapsService, address: Optional[str]) -> Optional[Coords]:
+    """
+    주소 → (lat, lng). 변환 결과가 없으면 None
+
+    API 장애(NaverApiError / NaverApiUnavailable)는 그대로 전파합니다.
+    (장애를 "변환 불가"와 구분해 호출자가 503 등으로 응답할 수 있도록)
+    """
+    if not address or not address.strip():
+        return None
+    result = await naver_maps.geocode(normalize_address(address))
+    return (result["lat"], result["lng"]) if result else None
+
+
+async def _geocode_on_save(naver_maps: NaverMapsService, address: Optional[str]) -> Optional[Coords]:
+    """주소 저장 시 변환: API 장애여도 저장은 진행하고 좌표는 비워 둠 (조회 시 다시 변환)"""
+    try:
+        return await geocode_address(naver_maps, address)
+    except NaverApiError as exc:
+        logger.warning("주소 좌표 변환 실패 (%s): %s", address, exc)
+        return None
+
+
+def _stored(lat, lng) -> Optional[Coords]:
+    if lat is None or lng is None:
+        return None
+    return float(lat), float(lng)
+
+
+def _address_changed(old: Optional[str], new: Optional[str]) -> bool:
+    return (old or "").strip() != (new or "").strip()
+
+
+def _clear_commute_times(db: Session, user_id: Optional[int]) -> None:
+    """기준지가 바뀐 사용자의 출퇴근 시간 행렬 삭제 (이전 위치 기준 결과, 다음 배치에서 다시 계산)"""
+    if user_id is not None:
+        db.execute(delete(CommuteTime).where(CommuteTime.user_id == user_id))
+
+
+async def set_user_address(
+    db: Session, user: User, address: Optional[str], naver_maps: Optional[NaverMapsService]
+) -> None:
+    """사용자 주소 변경 시 좌표를 초기화하고 새로 변환"""
+    if not _address_changed(user.address, address) and _stored(user.address_lat, user.address_lng):
+        return
+    if _address_changed(user.address, address) and not _uses_preference_base(user):
+        _clear_commute_times(db, user.user_id)
+    user.address = address
+    user.address_lat = user.address_lng = None
+    if naver_maps is not None:
+        coords = await _geocode_on_save(naver_maps, address)
+        if coords:
+            user.address_lat, user.address_lng = coords
+
+
+async def set_commute_base_address(
+    db: Session, preference: Preference, address: Optional[str], naver_maps: Optional[NaverMapsService]
+) -> None:
+    """출퇴근 기준지 변경 시 좌표를 초기화하고 새로 변환"""
+    if not _address_changed(preference.commute_base_address, address) and _stored(
+        preference.commute_base_lat, preference.commute_base_lng
+    ):
+        return
+    if _address_changed(preference.commute_base_address, address):
+        _clear_commute_times(db, preference.user_id)
+    preference.commute_base_address = address
+    preference.commute_base_lat = preference.commute_base_lng = None
+    if naver_maps is not None:
+        coords = await _geocode_on_save(naver_maps, address)
+        if coords:
+            preference.commute_base_lat, preference.commute_base_lng = coords
+
+
+async def get_user_coords(db: Session, user: User, naver_maps: NaverMapsService) -> Optional[Coords]:
+    """저장된 사용자 주소 좌표 (없으면 변환 후 저장, API 장애는 NaverApiError로 전파)"""
+    coords = _stored(user.address_lat, user.address_lng)
+    if coords or not user.address:
+        return coords
+
+    coords = await geocode_address(naver_maps, user.address)
+    if coords:
+        user.address_lat, user.address_lng = coords
+        db.add(user)
+        db.commit()
+    return coords
+
+
+def _uses_preference_base(user: User) -> bool:
+    preference = user.preference
+    return preference is not None and bool((preference.commute_base_address or "").strip())
+
+
+def commute_base_address(user: User) -> Optional[str]:
+    """출퇴근 기준지 주소: 희망 조건의 기준지, 없으면 사용자 주소"""
+    return user.preference.commute_base_address if _uses_preference_base(user) else user.address
+
+
+def stored_commute_base_coords(user: User) -> Optional[Coords]:
+    """commute_base_address()에 해당하는 저장된 좌표 (없으면 None)"""
+    if _uses_preference_base(user):
+        return _stored(user.preference.commute_base_lat, user.preference.commute_base_lng)
+    return _stored(user.address_lat, user.address_lng)
+
+
+def store_commute_base_coords(db: Session, user: User, coords: Coords) -> None:
+    """commute_base_address()의 좌표를 저장 (커밋은 호출자가)"""
+    if _uses_preference_base(user):
+        user.preference.commute_base_lat, user.preference.commute_base_lng = coords
+        db.add(user.preference)
+    else:
+        user.address_lat, user.address_lng = coords
+        db.add(user)
+
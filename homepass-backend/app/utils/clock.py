@@ -0,0 +1,8 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+
+def utcnow() -> datetime:
+    """현재 UTC 시각 (타임존 없음) - DB DateTime 컬럼은 타임존 없이 UTC로 저장"""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import re
+from typing import Sequence
+
+import numpy as np
+
+EARTH_RADIUS_M = 6371000  # 지구 반지름 (미터)
+
+# 네이버 검색 API의 mapx/mapy는 WGS84 좌표 × 10^7 정수 문자열
+NAVER_COORD_SCALE = 10_000_000
+
+_STATION_SUFFIX_RE = re.compile(r"역(?:\s+.+|\(.+\))$")
+_HTML_BOLD_RE = re.compile(r"</?b>")
+_SCHOOL_TYPES = ("초등학교", "중학교", "고등학교", "대학교")
+
+
+def haversine_m(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """두 좌표 간 거리 (미터, Haversine)"""
+    return float(haversine_many(lat1, lng1, np.array([lat2]), np.array([lng2]))[0])
+
+
+def haversine_many(
+    lat: float,
+    lng: float,
+    lats: Sequence[float] | np.ndarray,
+    lngs: Sequence[float] | np.ndarray,
+) -> np.ndarray:
+    """
+    한 중심점에서 여러 좌표까지의 거리 (미터)를 한 번에 계산
+
+    Args:
+        lat, lng: 중심 좌표
+        lats, lngs: 후보 좌표 배열 (같은 길이)
+
+    Returns:
+        거리 배열 (np.ndarray, float64)
+    """
+    lat1 = np.radians(lat)
+    lat2 = np.radians(np.asarray(lats, dtype=float))
+    delta_lat = lat2 - lat1
+    delta_lng = np.radians(np.asarray(lngs, dtype=float) - lng)
+
+    a = np.sin(delta_lat / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin(delta_lng / 2) ** 2
+    return 2 * EARTH_RADIUS_M * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+
+
+def within_radius(
+    lat: float,
+    lng: float,
+    lats: Sequence[float] | np.ndarray,
+    lngs: Sequence[float] | np.ndarray,
+    radius_m: float,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    반경 내 후보만 골라 가까운 순으로 정렬
+
+    Returns:
+        (원본 인덱스 배열, 해당 거리 배열) - 거리 오름차순
+    """
+    distances = haversine_many(lat, lng, lats, lngs)
+    idx = np.flatnonzero(distances <= radius_m)
+    order = idx[np.argsort(distances[idx], kind="stable")]
+    return order, distances[order]
+
+
+def strip_html_bold(text: str) -> str:
+    """네이버 검색 결과 제목의 <b></b> 강조 태그 제거"""
+    return _HTML_BOLD_RE.sub("", text)
+
+
+def normalize_place_name(name: str) -> str:
+    """
+    장소 이름을 정규화하여 중복 제거용 기본 이름 추출
+
+    예:
+    - "서울상봉초등학교체육관" → "서울상봉초등학교"
+    - "상봉역 경춘선" → "상봉역"
+    - "상봉역(경춘선)" → "상봉역"
+    - "망우공원 산책로" → "망우공원"
+    """
+    # 지하철역: "역" 뒤의 노선 정보 제거
+    if "역" in name:
+        name = _STATION_SUFFIX_RE.sub("역", name)
+
+    # 학교: 학교 이름 뒤의 세부 시설명 제거
+    for school_type in _SCHOOL_TYPES:
+        idx = name.find(school_type)
+        if idx >= 0:
+            name = name[:idx + len(school_type)]
+            break
+
+    # 공원: 공원 이름 뒤의 세부 정보 제거
+    if "공원" in name and not name.endswith("공원"):
+        name = name[:name.find("공원") + len("공원")]
+
+    return name.strip()
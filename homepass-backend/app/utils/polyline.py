@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import math
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from app.utils.geo import EARTH_RADIUS_M
+
+# Web Mercator 기준 zoom 0에서 적도의 1픽셀 크기 (미터)
+_METERS_PER_PIXEL_Z0 = 156543.03392
+
+PATH_FORMAT_COORDS = "coords"
+PATH_FORMAT_POLYLINE = "polyline"
+
+
+def tolerance_for_zoom(zoom: float, lat: float, pixels: float = 1.0) -> float:
+    """
+    지도 zoom 레벨에서 화면상 `pixels` 픽셀에 해당하는 거리(미터)
+
+    이보다 작은 굴곡은 해당 zoom에서 눈에 보이지 않으므로 단순화 허용 오차로 사용합니다.
+    """
+    return pixels * _METERS_PER_PIXEL_Z0 * math.cos(math.radians(lat)) / (2 ** zoom)
+
+
+def _project_to_meters(points: np.ndarray) -> np.ndarray:
+    """[lat, lng] 배열을 평균 위도 기준 등장방형 투영(미터)으로 변환"""
+    lat0 = np.radians(points[:, 0].mean())
+    xy = np.empty_like(points)
+    xy[:, 0] = np.radians(points[:, 1]) * EARTH_RADIUS_M * np.cos(lat0)
+    xy[:, 1] = np.radians(points[:, 0]) * EARTH_RADIUS_M
+    return xy
+
+
+def simplify_path(path: Sequence[Sequence[float]], tolerance_m: float) -> List[List[float]]:
+    """
+    Douglas-Peucker 경로 단순화 (NumPy 벡터 연산)
+
+    각 구간에서 양 끝점을 잇는 선분까지의 거리를 한 번에 계산하고,
+    가장 먼 점이 tolerance_m(미터)보다 멀면 그 점을 남기고 구간을 나눕니다.
+
+    Args:
+        path: [[lat, lng], ...]
+        tolerance_m: 허용 오차 (미터)
+
+    Returns:
+        단순화된 [[lat, lng], ...] (시작/끝 점은 항상 유지)
+    """
+    points = np.asarray(path, dtype=float)
+    n = len(points)
+    if n < 3 or tolerance_m <= 0:
+        return points.tolist()
+
+    xy = _project_to_meters(points)
+    keep = np.zeros(n, dtype=bool)
+    keep[0] = keep[-1] = True
+
+    stack = [(0, n - 1)]
+    while stack:
+        start, end = stack.pop()
+        if end - start < 2:
+            continue
+
+        a = xy[start]
+        seg = xy[start + 1:end] - a
+        d = xy[end] - a
+        length_sq = float(d @ d)
+        if length_sq == 0.0:
+            dist = np.hypot(seg[:, 0], seg[:, 1])
+        else:
+            t = np.clip((seg @ d) / length_sq, 0.0, 1.0)
+            diff = seg - t[:, None] * d
+            dist = np.hypot(diff[:, 0], diff[:, 1])
+
+        idx = int(np.argmax(dist))
+        if dist[idx] > tolerance_m:
+            split = start + 1 + idx
+            keep[split] = True
+            stack.append((start, split))
+            stack.append((split, end))
+
+    return points[keep].tolist()
+
+
+def encode_polyline(path: Sequence[Sequence[float]], precision: int = 5) -> str:
+    """
+    Encoded Polyline Algorithm Format 인코딩 ([[lat, lng], ...] → 문자열)
+
+    프론트엔드에서는 표준 polyline 디코더(precision 동일)로 복원할 수 있습니다.
+    """
+    if len(path) == 0:
+        return ""
+
+    factor = 10 ** precision
+    scaled = np.round(np.asarray(path, dtype=float) * factor).astype(np.int64)
+    deltas = np.diff(scaled, axis=0, prepend=np.zeros((1, 2), dtype=np.int64)).ravel()
+    # zigzag 인코딩: 음수를 홀수로 매핑
+    values = np.where(deltas < 0, ~(deltas << 1), deltas << 1)
+
+    chunks: List[str] = []
+    for value in values.tolist():
+        while value >= 0x20:
+            chunks.append(chr((0x20 | (value & 0x1F)) + 63))
+            value >>= 5
+        chunks.append(chr(value + 63))
+    return "".join(chunks)
+
+
+def decode_polyline(encoded: str, precision: int = 5) -> List[List[float]]:
+    """encode_polyline의 역변환 (검증/디버깅용)"""
+    values: List[int] = []
+    index = 0
+    while index < len(encoded):
+        result = shift = 0
+        while True:
+            b = ord(encoded[index]) - 63
+            index += 1
+            result |= (b & 0x1F) << shift
+            shift += 5
+            if b < 0x20:
+                break
+        values.append(~(result >> 1) if result & 1 else result >> 1)
+
+    coords = np.cumsum(np.asarray(values, dtype=np.int64).reshape(-1, 2), axis=0)
+    return (coords / (10 ** precision)).tolist()
+
+
+def format_route_path(
+    path: Sequence[Sequence[float]],
+    *,
+    simplify: bool = True,
+    zoom: Optional[float] = None,
+    path_format: str = PATH_FORMAT_COORDS,
+    default_zoom: float = 16,
+) -> Dict[str, Any]:
+    """
+    경로 응답용 path 필드 구성
+
+    Returns:
+        {"path": [[lat, lng], ...], "encoded_path": str | None, "original_point_count": int}
+        path_format="polyline"이면 path는 비우고 encoded_path만 채웁니다.
+    """
+    original_count = len(path)
+    points: List[List[float]] = [list(p) for p in path]
+
+    if simplify and original_count >= 3:
+        mid_lat = points[original_count // 2][0]
+        tolerance = tolerance_for_zoom(zoom if zoom is not None else default_zoom, mid_lat)
+        points = simplify_path(points, tolerance)
+
+    if path_format == PATH_FORMAT_POLYLINE:
+        return {
+            "path": [],
+            "encoded_path": encode_polyline(points),
+            "original_point_count": original_count,
+        }
+    return {
+        "path": points,
+        "encoded_path": None,
+        "original_point_count": original_count,
+    }
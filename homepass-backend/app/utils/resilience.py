@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import asyncio
+import random
+import threading
+import time
+from typing import Any, Dict, Optional
+
+
+def backoff_delay(attempt: int, base: float, cap: float) -> float:
+    """
+    지수 백오프 + Full Jitter 지연 시간 (초)
+
+    attempt=0 → [0, base], attempt=1 → [0, 2*base], ... 최대 cap
+    """
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+class TokenBucket:
+    """
+    초당 rate개의 토큰을 채우는 비동기 토큰 버킷 (클라이언트 측 QPS 제한)
+
+    rate <= 0 이면 제한하지 않습니다.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+        self.acquired = 0
+        self.throttled = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def _try_take(self) -> float:
+        """토큰을 하나 가져오면 0, 부족하면 다음 토큰까지 남은 시간(초)을 반환"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self.rate
+
+    async def acquire(self) -> float:
+        """토큰을 획득할 때까지 대기하고, 실제 대기한 시간(초)을 반환"""
+        if self.rate <= 0:
+            self.acquired += 1
+            return 0.0
+
+        started = time.monotonic()
+        while True:
+            delay = self._try_take()
+            if delay == 0:
+                break
+            await asyncio.sleep(delay)
+
+        waited = time.monotonic() - started
+        self.acquired += 1
+        if waited > 0.001:
+            self.throttled += 1
+            self.total_wait_seconds += waited
+            self.max_wait_seconds = max(self.max_wait_seconds, waited)
+        return waited
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "rate_per_second": self.rate,
+            "acquired": self.acquired,
+            "throttled": self.throttled,
+            "total_wait_seconds": round(self.total_wait_seconds, 3),
+            "max_wait_seconds": round(self.max_wait_seconds, 3),
+        }
+
+
+class CircuitBreaker:
+    """
+    연속 실패가 failure_threshold 회 이상이면 열림(open) 상태로 전환하여
+    reset_timeout 초 동안 요청을 차단합니다. 이후 반열림(half_open) 상태에서
+    한 건의 시험 요청이 성공하면 닫힘(closed)으로 복귀합니다.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+        self.opened_count = 0
+        self.rejected = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            self._maybe_half_open()
+            return self._state
+
+    def _maybe_half_open(self) -> None:
+        if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+            self._state = self.HALF_OPEN
+            self._trial_in_flight = False
+
+    def allow_request(self) -> bool:
+        with self._lock:
+            self._maybe_half_open()
+            if self._state == self.CLOSED:
+                return True
+            if self._state == self.HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            self.rejected += 1
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._trial_in_flight = False
+            self._state = self.CLOSED
+
+    def release(self) -> None:
+        """성공/실패를 기록하지 못하고 끝난 요청(취소 등)의 반열림 시험 슬롯을 반환합니다."""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            self._trial_in_flight = False
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != self.OPEN:
+                    self.opened_count += 1
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "state": self.state,
+            "consecutive_failures": self._failures,
+            "opened_count": self.opened_count,
+            "rejected": self.rejected,
+        }
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class _LeaderCancelled(Exception):
+    """업스트림 요청을 실행하던 첫 호출자가 취소됨 (대기자 중 하나가 이어서 실행)"""
+
+
+class SingleFlight:
+    """
+    동일한 키로 동시에 들어온 비동기 호출을 하나의 업스트림 요청으로 합칩니다.
+
+    첫 호출자가 실제 코루틴을 실행하고, 그 사이 같은 키로 들어온 호출자는
+    같은 Future 결과(또는 예외)를 공유합니다. 결과는 캐시하지 않으므로
+    요청이 끝나면 다음 호출은 다시 업스트림으로 나갑니다.
+
+    첫 호출자가 취소되면 그 취소를 대기자에게 전파하지 않고,
+    대기자 중 하나가 새 첫 호출자가 되어 직접 실행합니다.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self.upstream_calls = 0
+        self.coalesced_calls = 0
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> Any:
+        loop = asyncio.get_running_loop()
+        # Future는 이벤트 루프에 묶이므로 루프별로 분리 (백그라운드 스레드의 asyncio.run 대비)
+        slot = (id(loop), key)
+
+        while (future := self._inflight.get(slot)) is not None:
+            self.coalesced_calls += 1
+            try:
+                # 대기 중인 호출자가 취소되어도 공유 Future는 취소되지 않도록 보호
+                return await asyncio.shield(future)
+            except _LeaderCancelled:
+                continue
+
+        future = loop.create_future()
+        self._inflight[slot] = future
+        self.upstream_calls += 1
+        try:
+            result = await func()
+        except asyncio.CancelledError:
+            if not future.done():
+                future.set_exception(_LeaderCancelled())
+                future.exception()
+            raise
+        except BaseException as exc:
+            if not future.done():
+                future.set_exception(exc)
+                # 대기자가 없을 때 "exception was never retrieved" 경고 방지
+                future.exception()
+            raise
+        else:
+            if not future.done():
+                future.set_result(result)
+            return result
+        finally:
+            self._inflight.pop(slot, None)
+
+    def inflight_count(self) -> int:
+        return len(self._inflight)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "upstream_calls": self.upstream_calls,
+            "coalesced_calls": self.coalesced_calls,
+            "inflight": self.inflight_count(),
+        }
@@ -0,0 +1,103 @@
+# bench_geo.py
+"""
+거리 계산 / 장소명 정규화 마이크로 벤치마크
+
+    python test/bench_geo.py --candidates 20 200 2000 20000
+
+기존 방식(후보마다 math 기반 Haversine + 호출마다 import re 후 정규식 컴파일)과
+app.utils.geo 의 NumPy 배치 거리 계산 / 사전 컴파일 정규화기를 비교합니다.
+"""
+
+import argparse
+import random
+import sys
+import timeit
+from math import atan2, cos, radians, sin, sqrt
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.utils.geo import haversine_many, normalize_place_name, within_radius  # noqa: E402
+
+CENTER = (37.5665, 126.9780)
+NAMES = ["상봉역 경춘선", "망우역(7호선)", "서울상봉초등학교체육관", "망우공원 산책로", "CU 시청점", "서울대학교병원"]
+
+
+def legacy_distance(lat1, lng1, lat2, lng2):
+    R = 6371000
+    lat1_rad = radians(lat1)
+    lat2_rad = radians(lat2)
+    delta_lat = radians(lat2 - lat1)
+    delta_lng = radians(lng2 - lng1)
+    a = sin(delta_lat / 2) ** 2 + cos(lat1_rad) * cos(lat2_rad) * sin(delta_lng / 2) ** 2
+    return R * 2 * atan2(sqrt(a), sqrt(1 - a))
+
+
+def legacy_normalize(name):
+    import re
+
+    if "역" in name:
+        name = re.sub(r"역\s+.+$", "역", name)
+        name = re.sub(r"역\(.+\)$", "역", name)
+    for school_type in ["초등학교", "중학교", "고등학교", "대학교"]:
+        if school_type in name:
+            idx = name.find(school_type)
+            if idx >= 0:
+                name = name[:idx + len(school_type)]
+            break
+    if "공원" in name and not name.endswith("공원"):
+        idx = name.find("공원")
+        if idx >= 0:
+            name = name[:idx + len("공원")]
+    return name.strip()
+
+
+def legacy_filter(lats, lngs, radius):
+    results = []
+    for lat, lng in zip(lats, lngs):
+        distance = legacy_distance(CENTER[0], CENTER[1], lat, lng)
+        if distance <= radius:
+            results.append(distance)
+    results.sort()
+    return results
+
+
+def report(label, func, number):
+    best = min(timeit.repeat(func, number=number, repeat=5)) / number
+    print(f"   {label:<32} {best * 1e6:10.1f} us/call")
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--candidates", type=int, nargs="+", default=[20, 200, 2000, 20000])
+    parser.add_argument("--radius", type=float, default=3000)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    for n in args.candidates:
+        lats = [CENTER[0] + rng.uniform(-0.05, 0.05) for _ in range(n)]
+        lngs = [CENTER[1] + rng.uniform(-0.05, 0.05) for _ in range(n)]
+
+        legacy = legacy_filter(lats, lngs, args.radius)
+        _, vectorized = within_radius(CENTER[0], CENTER[1], lats, lngs, args.radius)
+        assert len(legacy) == len(vectorized)
+        assert max(abs(a - b) for a, b in zip(legacy, vectorized.tolist())) < 1e-6 if legacy else True
+
+        number = max(1, 20000 // n)
+        print(f"[distance filter] candidates={n}")
+        t_legacy = report("legacy python loop", lambda: legacy_filter(lats, lngs, args.radius), number)
+        t_numpy = report("numpy within_radius", lambda: within_radius(CENTER[0], CENTER[1], lats, lngs, args.radius), number)
+        report("numpy haversine_many only", lambda: haversine_many(CENTER[0], CENTER[1], lats, lngs), number)
+        print(f"   speedup: x{t_legacy / t_numpy:.1f}")
+
+    names = NAMES * 50
+    assert [legacy_normalize(n) for n in NAMES] == [normalize_place_name(n) for n in NAMES]
+    print(f"[name normalize] names={len(names)}")
+    t_legacy = report("legacy (runtime import re)", lambda: [legacy_normalize(n) for n in names], 200)
+    t_new = report("precompiled", lambda: [normalize_place_name(n) for n in names], 200)
+    print(f"   speedup: x{t_legacy / t_new:.1f}")
+
+
+if __name__ == "__main__":
+    main()
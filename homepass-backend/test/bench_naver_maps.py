@@ -0,0 +1,131 @@
+# bench_naver_maps.py
+"""
+NaverMapsService 오프라인 벤치마크 (로컬 대체 서버 사용)
+
+1) 대체 서버 실행:
+    uvicorn naver_stub:app --app-dir test --port 9100
+
+2) 벤치마크 실행 (homepass-backend 디렉토리에서):
+    python test/bench_naver_maps.py --requests 200 --concurrency 50
+
+동일 요청 폭주(공고 오픈 직후)와 서로 다른 요청 혼합 시나리오에서
+지연 시간 분포와 업스트림 호출 수(병합/재시도/브레이커 지표)를 출력합니다.
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="NaverMapsService offline benchmark")
+    parser.add_argument("--stub-url", default="http://localhost:9100")
+    parser.add_argument("--requests", type=int, default=200, help="시나리오별 요청 수")
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--distinct", type=int, default=20, help="혼합 시나리오의 서로 다른 요청 종류 수")
+    parser.add_argument("--error-rate", type=float, default=None, help="대체 서버 오류 주입 비율 (0~1)")
+    parser.add_argument("--latency-ms", type=float, default=None, help="대체 서버 응답 지연 (ms)")
+    return parser.parse_args()
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    idx = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[idx]
+
+
+async def run_scenario(name, make_call, total, concurrency):
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+    failures = 0
+
+    async def one(i):
+        nonlocal failures
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                await make_call(i)
+            except Exception:
+                failures += 1
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(total)))
+    elapsed = time.perf_counter() - started
+
+    print(f"[{name}] {total} req in {elapsed:.2f}s ({total / elapsed:.1f} req/s), failures={failures}")
+    print(
+        f"   latency ms: p50={percentile(latencies, 50):.1f} "
+        f"p95={percentile(latencies, 95):.1f} p99={percentile(latencies, 99):.1f} "
+        f"mean={statistics.fmean(latencies):.1f}"
+    )
+
+
+async def main():
+    args = parse_args()
+
+    # 설정 로드 전에 대체 서버를 가리키도록 지정
+    os.environ.setdefault("NAVER_MAPS_BASE_URL", args.stub_url)
+    os.environ.setdefault("NAVER_SEARCH_BASE_URL", f"{args.stub_url}/v1")
+
+    import httpx
+    from app.services.naver_maps import NaverMapsService
+
+    async with httpx.AsyncClient(base_url=args.stub_url) as admin:
+        update = {}
+        if args.error_rate is not None:
+            update["error_rate"] = args.error_rate
+        if args.latency_ms is not None:
+            update["latency_ms"] = args.latency_ms
+        if update:
+            await admin.post("/__stub/config", json=update)
+        await admin.post("/__stub/reset")
+
+    service = NaverMapsService()
+
+    await run_scenario(
+        "burst: identical geocode",
+        lambda i: service.geocode("서울특별시 중구 세종대로 110"),
+        args.requests,
+        args.concurrency,
+    )
+    await run_scenario(
+        "mixed: geocode",
+        lambda i: service.geocode(f"서울특별시 강남구 테헤란로 {i % args.distinct}"),
+        args.requests,
+        args.concurrency,
+    )
+    await run_scenario(
+        "mixed: nearby places",
+        lambda i: service.get_nearby_places(37.5665, 126.9780, ["subway", "store", "park"][i % 3]),
+        args.requests,
+        args.concurrency,
+    )
+    await run_scenario(
+        "mixed: directions",
+        lambda i: service.get_directions(37.5665, 126.9780, 37.5172 + (i % args.distinct) * 0.001, 127.0473),
+        args.requests // 4 or 1,
+        args.concurrency,
+    )
+
+    async with httpx.AsyncClient(base_url=args.stub_url) as admin:
+        stub_stats = (await admin.get("/__stub/stats")).json()
+
+    print("\n[service metrics]")
+    for key, value in service.get_metrics().items():
+        print(f"   {key}: {value}")
+    print("[stub upstream requests]")
+    print(f"   requests: {stub_stats['requests']}")
+    print(f"   injected errors: {stub_stats['errors']}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
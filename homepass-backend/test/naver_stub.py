@@ -0,0 +1,266 @@
+# naver_stub.py
+"""
+네이버 Maps / Search API 로컬 대체 서버 (오프라인 벤치마크 / 부하 테스트용)
+
+실제 키와 쿼터 없이 NaverMapsService를 돌려볼 수 있도록
+Geocoding, Reverse Geocoding, Direction 5, 지역 검색 엔드포인트를
+같은 경로/응답 형식으로 흉내 냅니다. 같은 입력에는 항상 같은 결과를 돌려줍니다.
+
+실행 (homepass-backend 디렉토리에서):
+    uvicorn naver_stub:app --app-dir test --port 9100
+
+백엔드 연결 (.env):
+    NAVER_MAPS_BASE_URL=http://localhost:9100
+    NAVER_SEARCH_BASE_URL=http://localhost:9100/v1
+
+환경 변수 (또는 POST /__stub/config 로 실행 중 변경):
+    NAVER_STUB_LATENCY_MS         응답 지연 평균 (기본 50)
+    NAVER_STUB_LATENCY_JITTER_MS  지연 편차 (기본 20)
+    NAVER_STUB_ERROR_RATE         오류 응답 비율 0~1 (기본 0)
+    NAVER_STUB_ERROR_STATUS       오류 응답 상태 코드 (기본 503, 429도 가능)
+    NAVER_STUB_PATH_POINTS        경로 좌표 개수 (기본 2000)
+    NAVER_STUB_SEED               지연/오류 난수 시드 (기본 42)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import math
+import os
+import random
+from collections import Counter
+from typing import Any, List, Optional, Tuple
+
+from fastapi import FastAPI, Query
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+# (구 이름, 위도, 경도) - 역지오코딩 / 검색 중심점용 고정 픽스처
+SEOUL_DISTRICTS: List[Tuple[str, float, float]] = [
+    ("중구", 37.5641, 126.9979),
+    ("종로구", 37.5735, 126.9790),
+    ("강남구", 37.5172, 127.0473),
+    ("송파구", 37.5145, 127.1059),
+    ("관악구", 37.4784, 126.9516),
+    ("마포구", 37.5663, 126.9019),
+    ("중랑구", 37.6063, 127.0925),
+    ("노원구", 37.6542, 127.0568),
+]
+DONG_NAMES = ["신사동", "삼성동", "역삼동", "상봉동", "망우동", "신림동", "서교동", "명동"]
+PLACE_SUFFIXES = ["역", "초등학교", "편의점", "병원", "공원", "마트"]
+
+
+class StubConfig(BaseModel):
+    latency_ms: float = float(os.environ.get("NAVER_STUB_LATENCY_MS", "50"))
+    latency_jitter_ms: float = float(os.environ.get("NAVER_STUB_LATENCY_JITTER_MS", "20"))
+    error_rate: float = float(os.environ.get("NAVER_STUB_ERROR_RATE", "0"))
+    error_status: int = int(os.environ.get("NAVER_STUB_ERROR_STATUS", "503"))
+    path_points: int = int(os.environ.get("NAVER_STUB_PATH_POINTS", "2000"))
+    seed: int = int(os.environ.get("NAVER_STUB_SEED", "42"))
+
+
+class StubConfigUpdate(BaseModel):
+    latency_ms: Optional[float] = None
+    latency_jitter_ms: Optional[float] = None
+    error_rate: Optional[float] = None
+    error_status: Optional[int] = None
+    path_points: Optional[int] = None
+    seed: Optional[int] = None
+
+
+app = FastAPI(title="Naver API Stub", docs_url="/docs", redoc_url=None)
+
+_config = StubConfig()
+_rng = random.Random(_config.seed)
+_requests: Counter = Counter()
+_errors: Counter = Counter()
+
+
+def _unit(*parts: Any) -> float:
+    """입력값에 대해 항상 같은 [0, 1) 값을 반환 (해시 기반 고정 난수)"""
+    digest = hashlib.sha256("|".join(str(p) for p in parts).encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") / 2 ** 64
+
+
+async def _simulate(endpoint: str) -> Optional[JSONResponse]:
+    """설정된 지연을 적용하고, 오류 주입 대상이면 오류 응답을 반환"""
+    _requests[endpoint] += 1
+    delay_ms = max(0.0, _rng.gauss(_config.latency_ms, _config.latency_jitter_ms))
+    if delay_ms:
+        await asyncio.sleep(delay_ms / 1000)
+    if _config.error_rate > 0 and _rng.random() < _config.error_rate:
+        _errors[endpoint] += 1
+        headers = {"Retry-After": "1"} if _config.error_status == 429 else None
+        return JSONResponse(
+            status_code=_config.error_status,
+            content={"error": {"errorCode": str(_config.error_status), "message": "stub injected error"}},
+            headers=headers,
+        )
+    return None
+
+
+def _nearest_district(lat: float, lng: float) -> Tuple[str, float, float]:
+    return min(SEOUL_DISTRICTS, key=lambda d: (d[1] - lat) ** 2 + (d[2] - lng) ** 2)
+
+
+def _district_in_text(text: str) -> Tuple[str, float, float]:
+    for district in SEOUL_DISTRICTS:
+        if district[0] in text:
+            return district
+    return SEOUL_DISTRICTS[0]
+
+
+@app.get("/map-geocode/v2/geocode")
+async def geocode(query: str = Query("")):
+    error = await _simulate("geocode")
+    if error:
+        return error
+
+    query = query.strip()
+    if not query:
+        return {"status": "INVALID_REQUEST", "meta": {"totalCount": 0}, "addresses": []}
+
+    name, base_lat, base_lng = _district_in_text(query)
+    lat = base_lat + (_unit("geocode-lat", query) - 0.5) * 0.02
+    lng = base_lng + (_unit("geocode-lng", query) - 0.5) * 0.02
+    return {
+        "status": "OK",
+        "meta": {"totalCount": 1, "page": 1, "count": 1},
+        "addresses": [
+            {
+                "roadAddress": f"서울특별시 {name} {query}",
+                "jibunAddress": f"서울특별시 {name} {query}",
+                "x": f"{lng:.7f}",
+                "y": f"{lat:.7f}",
+            }
+        ],
+    }
+
+
+@app.get("/map-reversegeocode/v2/gc")
+async def reverse_geocode(coords: str = Query(...), orders: str = "roadaddr,addr", output: str = "json"):
+    error = await _simulate("reverse_geocode")
+    if error:
+        return error
+
+    try:
+        lng_text, lat_text = coords.split(",", 1)
+        lng, lat = float(lng_text), float(lat_text)
+    except ValueError:
+        return JSONResponse(status_code=400, content={"status": {"code": 100, "name": "invalid coords"}})
+
+    name, _, _ = _nearest_district(lat, lng)
+    dong = DONG_NAMES[int(_unit("dong", round(lat, 3), round(lng, 3)) * len(DONG_NAMES))]
+    region = {
+        "area1": {"name": "서울특별시"},
+        "area2": {"name": name},
+        "area3": {"name": dong},
+    }
+    number = 1 + int(_unit("bunji", round(lat, 4), round(lng, 4)) * 300)
+    return {
+        "status": {"code": 0, "name": "ok"},
+        "results": [
+            {"name": "roadaddr", "region": region, "roadaddr": {"roadAddress": f"서울특별시 {name} {dong}로 {number}"}},
+            {"name": "addr", "region": region, "addr": {"jibunAddress": f"서울특별시 {name} {dong} {number}"}},
+        ],
+    }
+
+
+@app.get("/map-direction/v1/driving")
+async def driving(start: str = Query(...), goal: str = Query(...), option: str = "trafast"):
+    error = await _simulate("directions")
+    if error:
+        return error
+
+    try:
+        start_lng, start_lat = (float(v) for v in start.split(",", 1))
+        goal_lng, goal_lat = (float(v) for v in goal.split(",", 1))
+    except ValueError:
+        return {"code": 2, "message": "invalid start/goal", "route": {}}
+
+    n = max(2, _config.path_points)
+    # 직선 경로에 완만한 굴곡을 더해 실제 도로 경로처럼 조밀한 좌표열 생성
+    amplitude = 0.002 + _unit("amp", start, goal) * 0.004
+    path = []
+    for i in range(n):
+        t = i / (n - 1)
+        wiggle = amplitude * math.sin(t * math.pi * 6) * math.sin(t * math.pi)
+        lat = start_lat + (goal_lat - start_lat) * t + wiggle
+        lng = start_lng + (goal_lng - start_lng) * t - wiggle
+        path.append([round(lng, 7), round(lat, 7)])
+
+    straight_m = math.hypot((goal_lat - start_lat) * 111_000, (goal_lng - start_lng) * 88_000)
+    distance = int(straight_m * 1.3)
+    duration = int(distance / 8.0 * 1000)  # 평균 약 29km/h
+    summary = {
+        "start": {"location": [start_lng, start_lat]},
+        "goal": {"location": [goal_lng, goal_lat], "dir": 0},
+        "distance": distance,
+        "duration": duration,
+        "tollFare": 0,
+        "taxiFare": 4800 + distance // 130 * 100,
+        "fuelPrice": distance // 10,
+    }
+    return {
+        "code": 0,
+        "message": "길찾기를 성공하였습니다.",
+        "route": {option: [{"summary": summary, "path": path}]},
+    }
+
+
+@app.get("/v1/search/local.json")
+async def search_local(query: str = Query(""), display: int = 5, start: int = 1, sort: str = "random"):
+    error = await _simulate("search_local")
+    if error:
+        return error
+
+    name, base_lat, base_lng = _district_in_text(query)
+    keyword = query.split()[-1] if query.split() else "장소"
+    items = []
+    for i in range(max(1, min(display, 20))):
+        lat = base_lat + (_unit("lat", query, i) - 0.5) * 0.03
+        lng = base_lng + (_unit("lng", query, i) - 0.5) * 0.03
+        suffix = PLACE_SUFFIXES[i % len(PLACE_SUFFIXES)]
+        items.append(
+            {
+                "title": f"<b>{name}</b> {keyword} {i + 1}{suffix}",
+                "link": "",
+                "category": keyword,
+                "description": "",
+                "telephone": "",
+                "address": f"서울특별시 {name} 테스트동 {i + 1}",
+                "roadAddress": f"서울특별시 {name} 테스트로 {i + 1}",
+                "mapx": str(int(lng * 10_000_000)),
+                "mapy": str(int(lat * 10_000_000)),
+            }
+        )
+    return {"lastBuildDate": "", "total": len(items), "start": start, "display": len(items), "items": items}
+
+
+@app.get("/__stub/stats")
+def stats():
+    return {
+        "config": _config.model_dump(),
+        "requests": dict(_requests),
+        "errors": dict(_errors),
+    }
+
+
+@app.post("/__stub/config")
+def update_config(payload: StubConfigUpdate):
+    global _config, _rng
+    updates = payload.model_dump(exclude_none=True)
+    _config = _config.model_copy(update=updates)
+    if "seed" in updates:
+        _rng = random.Random(_config.seed)
+    return _config.model_dump()
+
+
+@app.post("/__stub/reset")
+def reset():
+    global _rng
+    _requests.clear()
+    _errors.clear()
+    _rng = random.Random(_config.seed)
+    return {"status": "reset"}
@@ -0,0 +1,150 @@
+# homepass_scraper/homepass_scraper/crawl_state.py
+"""
+이어받기 가능한 수집 상태 (SocoBoardSpider)
+
+수집이 중간에 끊겨도(배포, OOM, 네트워크) 낮은 번호의 공고를 잃지 않도록
+체크포인트를 "연속으로 끝난 번호"까지만 전진시킵니다.
+
+- checkpoint: 이 번호 이하는 모두 처리 완료
+- completed: checkpoint보다 큰 번호 중 처리가 끝난 번호 (checkpoint+1부터 이어지면 checkpoint로 흡수)
+- pending: 상세 요청을 보냈지만 아직 끝나지 않은 공고 (목록 행 포함)
+  → 다음 실행에서 목록을 다시 받지 않고 바로 상세 요청을 재개
+  → max_attempts번 실행해도 끝나지 않으면(계속 404 등) 포기하고 완료로 처리 (체크포인트가 영원히 멈추지 않도록)
+
+상태 파일: <state_dir>/<스파이더 이름>.sqlite3 (SOCO_STATE_DIR 또는 JOBDIR, 기본 homepass-scraper/.crawlstate)
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+DEFAULT_STATE_DIR = Path(__file__).resolve().parents[1] / ".crawlstate"
+
+# MySQLAnnouncementsPipeline이 커밋한 공고 (인자: listing_numbers).
+# 스파이더는 DB에 실제로 기록된 뒤에만 번호를 완료로 처리 (배치 버퍼에 있던 공고를 잃지 않도록)
+announcements_written = object()
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS crawl_meta (
+        key TEXT PRIMARY KEY,
+        value TEXT NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS completed (
+        number INTEGER PRIMARY KEY,
+        completed_at REAL NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS pending (
+        number INTEGER PRIMARY KEY,
+        board_id TEXT,
+        row_json TEXT NOT NULL,
+        attempts INTEGER NOT NULL DEFAULT 0,
+        updated_at REAL NOT NULL
+    )
+    """,
+)
+
+
+class CrawlState:
+    def __init__(self, path: Path, max_attempts: int = 3):
+        self.path = Path(path).expanduser().resolve()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_attempts = max(1, max_attempts)
+
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(self.path), check_same_thread=False, timeout=30)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        for statement in _SCHEMA:
+            self._db.execute(statement)
+        self._db.commit()
+
+        row = self._db.execute("SELECT value FROM crawl_meta WHERE key = 'checkpoint'").fetchone()
+        self.checkpoint: Optional[int] = int(row[0]) if row else None
+        self._completed = {number for (number,) in self._db.execute("SELECT number FROM completed")}
+
+    # ------------------------------------------------------------------ #
+    # 체크포인트
+    # ------------------------------------------------------------------ #
+    def initialize(self, checkpoint: int) -> None:
+        """상태 파일이 없던 첫 실행: 기존 방식(DB / 체크포인트 파일)으로 구한 값에서 시작"""
+        with self._lock:
+            self.checkpoint = checkpoint
+            self._save_checkpoint()
+            self._db.commit()
+
+    def _save_checkpoint(self) -> None:
+        self._db.execute(
+            "INSERT INTO crawl_meta (key, value) VALUES ('checkpoint', ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            (str(self.checkpoint),),
+        )
+
+    def is_done(self, number: int) -> bool:
+        return (self.checkpoint is not None and number <= self.checkpoint) or number in self._completed
+
+    def complete(self, number: int) -> bool:
+        """번호 처리 완료. 체크포인트가 전진했으면 True"""
+        with self._lock:
+            if self.is_done(number):
+                return False
+            self._completed.add(number)
+            self._db.execute(
+                "INSERT OR REPLACE INTO completed (number, completed_at) VALUES (?, ?)", (number, time.time())
+            )
+            self._db.execute("DELETE FROM pending WHERE number = ?", (number,))
+            advanced = self._advance()
+            self._db.commit()
+            return advanced
+
+    def _advance(self) -> bool:
+        start = self.checkpoint or 0
+        checkpoint = start
+        while checkpoint + 1 in self._completed:
+            checkpoint += 1
+            self._completed.discard(checkpoint)
+        if checkpoint == start:
+            return False
+        self.checkpoint = checkpoint
+        self._db.execute("DELETE FROM completed WHERE number <= ?", (checkpoint,))
+        self._save_checkpoint()
+        return True
+
+    # ------------------------------------------------------------------ #
+    # 대기 중인 상세 요청
+    # ------------------------------------------------------------------ #
+    def add_pending(self, number: int, board_id, row: Dict) -> int:
+        """상세 요청 기록 (시도 횟수 +1). 현재 시도 횟수를 반환"""
+        with self._lock:
+            self._db.execute(
+                """
+                INSERT INTO pending (number, board_id, row_json, attempts, updated_at) VALUES (?, ?, ?, 1, ?)
+                ON CONFLICT(number) DO UPDATE SET
+                    board_id = excluded.board_id,
+                    row_json = excluded.row_json,
+                    attempts = pending.attempts + 1,
+                    updated_at = excluded.updated_at
+                """,
+                (number, None if board_id is None else str(board_id), json.dumps(row, ensure_ascii=False), time.time()),
+            )
+            (attempts,) = self._db.execute("SELECT attempts FROM pending WHERE number = ?", (number,)).fetchone()
+            self._db.commit()
+            return attempts
+
+    def pending(self) -> List[Tuple[int, Optional[str], Dict, int]]:
+        """이전 실행에서 끝나지 않은 상세 요청 (번호 내림차순: 번호, boardId, 목록 행, 시도 횟수)"""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT number, board_id, row_json, attempts FROM pending ORDER BY number DESC"
+            ).fetchall()
+        return [(number, board_id, json.loads(row_json), attempts) for number, board_id, row_json, attempts in rows]
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
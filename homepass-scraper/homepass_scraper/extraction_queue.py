@@ -0,0 +1,170 @@
+# homepass_scraper/homepass_scraper/extraction_queue.py
+"""
+크롤링 → PDF 추출 작업 큐 (MySQL 테이블)
+
+MySQLAnnouncementsPipeline이 공고를 upsert할 때 같은 트랜잭션에서 큐에 넣고,
+new_extractor.py (--follow)가 크롤링과 동시에 꺼내 처리합니다.
+두 프로세스가 DB만 공유하면 되므로 별도 메시지 브로커가 필요 없습니다.
+
+상태: pending → processing → done | failed (재시도 횟수 초과)
+추출 중(processing)에 다시 등록되면 requeue를 표시해 두고, 끝난 뒤 done 대신 pending으로 되돌립니다.
+(추출기가 읽은 내용은 이미 낡았으므로)
+"""
+
+from typing import List, Optional, Tuple
+
+QUEUE_TABLE = "extraction_queue"
+
+STATUS_PENDING = "pending"
+STATUS_PROCESSING = "processing"
+STATUS_DONE = "done"
+STATUS_FAILED = "failed"
+
+CREATE_TABLE_SQL = f"""
+    CREATE TABLE IF NOT EXISTS {QUEUE_TABLE} (
+        announcement_id INT NOT NULL PRIMARY KEY,
+        listing_number INT NULL,
+        status VARCHAR(20) NOT NULL DEFAULT '{STATUS_PENDING}',
+        attempts INT NOT NULL DEFAULT 0,
+        requeue TINYINT(1) NOT NULL DEFAULT 0,
+        claimed_by VARCHAR(255) NULL,
+        last_error TEXT NULL,
+        enqueued_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+        updated_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+        INDEX ix_extraction_queue_status (status, enqueued_at)
+    ) DEFAULT CHARSET=utf8mb4
+"""
+
+
+_ENQUEUE_SQL = f"""
+    INSERT INTO {QUEUE_TABLE} (announcement_id, listing_number, status, attempts)
+    VALUES (%s, %s, '{STATUS_PENDING}', 0)
+    ON DUPLICATE KEY UPDATE
+        listing_number = VALUES(listing_number),
+        requeue = IF(status = '{STATUS_PROCESSING}', 1, 0),
+        status = IF(status = '{STATUS_PROCESSING}', status, '{STATUS_PENDING}'),
+        attempts = IF(status = '{STATUS_PROCESSING}', attempts, 0),
+        last_error = NULL,
+        enqueued_at = CURRENT_TIMESTAMP
+"""
+
+
+def ensure_table(cursor) -> None:
+    cursor.execute(CREATE_TABLE_SQL)
+    # requeue 컬럼 도입 이전에 만들어진 테이블
+    cursor.execute(f"SHOW COLUMNS FROM {QUEUE_TABLE} LIKE 'requeue'")
+    if cursor.fetchone() is None:
+        cursor.execute(f"ALTER TABLE {QUEUE_TABLE} ADD COLUMN requeue TINYINT(1) NOT NULL DEFAULT 0 AFTER attempts")
+
+
+def enqueue(cursor, announcement_id: int, listing_number: Optional[int] = None) -> None:
+    """
+    추출 대상 등록 (이미 있으면 다시 pending으로)
+    커밋은 호출자가 upsert와 함께 수행합니다.
+    """
+    cursor.execute(_ENQUEUE_SQL, (announcement_id, listing_number))
+
+
+def enqueue_many(cursor, targets: List[Tuple[int, Optional[int]]]) -> None:
+    """enqueue의 배치 버전 (announcement_id, listing_number) 목록"""
+    if targets:
+        cursor.executemany(_ENQUEUE_SQL, targets)
+
+
+def claim(conn, worker_id: str, limit: int = 1) -> List[int]:
+    """
+    pending 작업을 최대 limit개 가져와 processing으로 표시 (최신 공고 우선)
+    FOR UPDATE SKIP LOCKED로 여러 추출 워커가 같은 행을 가져가지 않도록 합니다.
+    """
+    with conn.cursor() as cursor:
+        cursor.execute(
+            f"""
+            SELECT announcement_id FROM {QUEUE_TABLE}
+            WHERE status = '{STATUS_PENDING}'
+            ORDER BY listing_number DESC, enqueued_at ASC
+            LIMIT %s
+            FOR UPDATE SKIP LOCKED
+            """,
+            (limit,),
+        )
+        ids = [row["announcement_id"] if isinstance(row, dict) else row[0] for row in cursor.fetchall()]
+        if ids:
+            placeholders = ", ".join(["%s"] * len(ids))
+            cursor.execute(
+                f"""
+                UPDATE {QUEUE_TABLE}
+                SET status = '{STATUS_PROCESSING}', claimed_by = %s, attempts = attempts + 1, requeue = 0
+                WHERE announcement_id IN ({placeholders})
+                """,
+                (worker_id, *ids),
+            )
+    conn.commit()
+    return ids
+
+
+def mark_done(cursor, announcement_id: int) -> None:
+    """완료 기록. 추출 중에 다시 등록된 작업(requeue)은 새 내용으로 다시 처리하도록 pending으로"""
+    cursor.execute(
+        f"""
+        UPDATE {QUEUE_TABLE}
+        SET status = IF(requeue = 1, '{STATUS_PENDING}', '{STATUS_DONE}'),
+            attempts = IF(requeue = 1, 0, attempts),
+            last_error = NULL,
+            requeue = 0
+        WHERE announcement_id = %s
+        """,
+        (announcement_id,),
+    )
+
+
+def mark_failed(cursor, announcement_id: int, error: str, max_attempts: int) -> None:
+    """실패 기록. 재시도 횟수가 남아 있거나 추출 중에 다시 등록됐으면(requeue) 다시 pending으로"""
+    cursor.execute(
+        f"""
+        UPDATE {QUEUE_TABLE}
+        SET status = IF(requeue = 0 AND attempts >= %s, '{STATUS_FAILED}', '{STATUS_PENDING}'),
+            attempts = IF(requeue = 1, 0, attempts),
+            last_error = %s,
+            requeue = 0
+        WHERE announcement_id = %s
+        """,
+        (max_attempts, error[:2000], announcement_id),
+    )
+
+
+def release_stale(cursor, stale_minutes: int) -> int:
+    """processing 상태로 오래 남은 작업(추출기 비정상 종료)을 다시 pending으로"""
+    return cursor.execute(
+        f"""
+        UPDATE {QUEUE_TABLE}
+        SET status = '{STATUS_PENDING}', requeue = 0
+        WHERE status = '{STATUS_PROCESSING}'
+          AND updated_at < (CURRENT_TIMESTAMP - INTERVAL %s MINUTE)
+        """,
+        (stale_minutes,),
+    )
+
+
+def pending_count(cursor) -> int:
+    cursor.execute(
+        f"SELECT COUNT(*) AS cnt FROM {QUEUE_TABLE} WHERE status IN ('{STATUS_PENDING}', '{STATUS_PROCESSING}')"
+    )
+    row = cursor.fetchone()
+    return int(row["cnt"] if isinstance(row, dict) else row[0])
+
+
+def backfill(cursor, limit: int) -> int:
+    """
+    큐 도입 이전에 저장되어 가격 정보가 없는 공고를 등록 (최신 공고부터 limit개)
+    """
+    return cursor.execute(
+        f"""
+        INSERT IGNORE INTO {QUEUE_TABLE} (announcement_id, listing_number, status, attempts)
+        SELECT announcement_id, listing_number, '{STATUS_PENDING}', 0
+        FROM Announcements
+        WHERE listing_number IS NOT NULL AND price IS NULL
+        ORDER BY listing_number DESC
+        LIMIT %s
+        """,
+        (limit,),
+    )
@@ -0,0 +1,205 @@
+# homepass_scraper/homepass_scraper/http_cache.py
+"""
+조건부 요청(ETag / Last-Modified)용 영구 캐시
+
+스파이더(ConditionalRequestMiddleware)와 new_extractor.py(PDF 다운로드)가 같은 캐시 파일을 공유합니다.
+
+- 검증자(ETag, Last-Modified)는 sqlite 파일에 URL별로 저장
+- 본문이 필요한 경우(PDF)에만 본문을 파일로 저장하고, 파싱 결과(meta)도 함께 보관
+  → 304 응답이면 다운로드와 파싱을 모두 건너뜀
+- 최대 항목 수 / 본문 총 크기 / 최대 보관 기간을 넘으면 오래 사용하지 않은 항목부터 삭제
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parents[1] / ".httpcache"
+
+_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS http_cache (
+        url TEXT PRIMARY KEY,
+        etag TEXT,
+        last_modified TEXT,
+        body_file TEXT,
+        body_size INTEGER NOT NULL DEFAULT 0,
+        meta TEXT,
+        stored_at REAL NOT NULL,
+        accessed_at REAL NOT NULL
+    )
+"""
+
+
+class ConditionalHttpCache:
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        max_entries: int = 20000,
+        max_bytes: int = 512 * 1024 * 1024,
+        max_age_seconds: float = 30 * 86400,
+    ):
+        self.cache_dir = Path(cache_dir).expanduser().resolve() if cache_dir else DEFAULT_CACHE_DIR
+        self.body_dir = self.cache_dir / "bodies"
+        self.body_dir.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.max_age_seconds = max_age_seconds
+
+        self._lock = threading.Lock()
+        # 추출기는 여러 스레드에서 사용 → 연결 하나를 잠금으로 보호
+        self._db = sqlite3.connect(str(self.cache_dir / "conditional.sqlite3"), check_same_thread=False, timeout=30)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(_SCHEMA)
+        self._db.commit()
+
+    @classmethod
+    def from_env(cls) -> "ConditionalHttpCache":
+        """new_extractor.py 등 Scrapy 밖에서 사용할 때 (스파이더 설정과 같은 이름의 환경변수)"""
+        return cls(
+            cache_dir=os.getenv("HTTP_COND_CACHE_DIR") or None,
+            max_entries=int(os.getenv("HTTP_COND_CACHE_MAX_ENTRIES", "20000")),
+            max_bytes=int(float(os.getenv("HTTP_COND_CACHE_MAX_MB", "512")) * 1024 * 1024),
+            max_age_seconds=float(os.getenv("HTTP_COND_CACHE_MAX_AGE_DAYS", "30")) * 86400,
+        )
+
+    # ------------------------------------------------------------------ #
+    # 조회
+    # ------------------------------------------------------------------ #
+    def _row(self, url: str):
+        row = self._db.execute(
+            "SELECT etag, last_modified, body_file, meta, stored_at FROM http_cache WHERE url = ?", (url,)
+        ).fetchone()
+        if row is None:
+            return None
+        if time.time() - row[4] > self.max_age_seconds:
+            # 보관 기간이 지난 항목은 없는 것으로 취급 (다음 응답으로 덮어씀)
+            return None
+        return row
+
+    def conditional_headers(self, url: str, require_body: bool = False) -> Dict[str, str]:
+        """
+        조건부 요청 헤더 (If-None-Match / If-Modified-Since)
+
+        require_body=True면 본문이 저장된 경우에만 반환 (304를 받아도 쓸 본문이 있어야 하므로)
+        """
+        with self._lock:
+            row = self._row(url)
+        if row is None:
+            return {}
+        etag, last_modified, body_file, _, _ = row
+        if require_body and not (body_file and (self.body_dir / body_file).exists()):
+            return {}
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        return headers
+
+    def load_body(self, url: str) -> Optional[bytes]:
+        with self._lock:
+            row = self._row(url)
+        if row is None or not row[2]:
+            return None
+        try:
+            return (self.body_dir / row[2]).read_bytes()
+        except OSError:
+            return None
+
+    def load_meta(self, url: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._row(url)
+        if row is None or not row[3]:
+            return None
+        try:
+            return json.loads(row[3])
+        except ValueError:
+            return None
+
+    # ------------------------------------------------------------------ #
+    # 저장
+    # ------------------------------------------------------------------ #
+    def store(self, url: str, etag: Optional[str], last_modified: Optional[str], body: Optional[bytes] = None) -> None:
+        """200 응답 저장. 검증자가 없으면 조건부 요청이 불가능하므로 저장하지 않음"""
+        if not etag and not last_modified:
+            return
+        body_file = None
+        if body is not None:
+            body_file = hashlib.sha256(url.encode("utf-8")).hexdigest()
+            (self.body_dir / body_file).write_bytes(body)
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                """
+                INSERT INTO http_cache (url, etag, last_modified, body_file, body_size, meta, stored_at, accessed_at)
+                VALUES (?, ?, ?, ?, ?, NULL, ?, ?)
+                ON CONFLICT(url) DO UPDATE SET
+                    etag = excluded.etag,
+                    last_modified = excluded.last_modified,
+                    body_file = excluded.body_file,
+                    body_size = excluded.body_size,
+                    meta = NULL,
+                    stored_at = excluded.stored_at,
+                    accessed_at = excluded.accessed_at
+                """,
+                (url, etag, last_modified, body_file, len(body) if body is not None else 0, now, now),
+            )
+            self._db.commit()
+
+    def touch(self, url: str) -> None:
+        """304 응답: 저장된 응답이 여전히 유효하므로 보관 기간을 다시 시작"""
+        now = time.time()
+        with self._lock:
+            self._db.execute("UPDATE http_cache SET stored_at = ?, accessed_at = ? WHERE url = ?", (now, now, url))
+            self._db.commit()
+
+    def save_meta(self, url: str, meta: Dict[str, Any]) -> None:
+        """본문에서 얻은 파싱 결과 저장 (다음 304 때 파싱 생략용)"""
+        with self._lock:
+            self._db.execute(
+                "UPDATE http_cache SET meta = ? WHERE url = ?",
+                (json.dumps(meta, ensure_ascii=False, default=str), url),
+            )
+            self._db.commit()
+
+    # ------------------------------------------------------------------ #
+    # 정리
+    # ------------------------------------------------------------------ #
+    def prune(self) -> int:
+        """보관 기간 / 항목 수 / 본문 총 크기 제한 적용. 삭제한 항목 수를 반환"""
+        removed = []
+        with self._lock:
+            expired_before = time.time() - self.max_age_seconds
+            removed += self._db.execute(
+                "SELECT url, body_file FROM http_cache WHERE stored_at < ?", (expired_before,)
+            ).fetchall()
+
+            rows = self._db.execute(
+                "SELECT url, body_file, body_size FROM http_cache WHERE stored_at >= ? ORDER BY accessed_at DESC",
+                (expired_before,),
+            ).fetchall()
+            total_bytes = 0
+            for idx, (url, body_file, body_size) in enumerate(rows):
+                total_bytes += body_size
+                if idx >= self.max_entries or total_bytes > self.max_bytes:
+                    removed.append((url, body_file))
+
+            self._db.executemany("DELETE FROM http_cache WHERE url = ?", [(url,) for url, _ in removed])
+            self._db.commit()
+
+        for _, body_file in removed:
+            if body_file:
+                try:
+                    (self.body_dir / body_file).unlink()
+                except OSError:
+                    pass
+        return len(removed)
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
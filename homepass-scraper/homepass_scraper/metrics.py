@@ -0,0 +1,388 @@
+# homepass_scraper/homepass_scraper/metrics.py
+"""
+수집 상태 지표 (Prometheus 텍스트 형식)
+
+Scrapy stats에 모인 값을 Prometheus 텍스트 형식으로 내보냅니다.
+- 파일: METRICS_DIR/homepass_crawl.prom (METRICS_INTERVAL초마다 + 종료 시, 원자적 교체)
+  → node_exporter textfile collector 또는 백엔드(GET /announcements/scrape/metrics)가 그대로 읽음
+- HTTP: METRICS_HTTP_PORT가 0이 아니면 METRICS_HTTP_HOST:PORT/metrics 로도 제공 (다른 호스트에서 실행할 때)
+
+카운터/요약 지표는 scope 라벨로 이번 실행(run)과 누적(total)을 함께 냅니다.
+누적값은 METRICS_DIR/cumulative.json에 실행이 끝날 때마다 더해 보관합니다.
+
+지표 출처 (stats 키):
+    downloader/*              Scrapy DownloaderStats (요청 수, 상태 코드별 응답 수, 받은 바이트)
+    parse/<콜백>/seconds|count CallbackTimingMiddleware
+    soco/*                    SocoBoardSpider (필터링, 체크포인트)
+    mysql/*                   MySQLAnnouncementsPipeline (배치 크기, upsert 소요 시간)
+    adaptive/*                AdaptiveConcurrencyMiddleware (도메인별 동시성 / 지연)
+"""
+
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from scrapy import signals
+from scrapy.exceptions import NotConfigured
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_METRICS_DIR = Path(__file__).resolve().parents[1] / ".metrics"
+METRICS_FILE_NAME = "homepass_crawl.prom"
+CUMULATIVE_FILE_NAME = "cumulative.json"
+
+PREFIX = "homepass_crawl"
+
+# (지표 이름, 종류, 설명) — 출력 순서
+_FAMILIES = [
+    ("requests_total", "counter", "Requests sent to the downloader"),
+    ("responses_total", "counter", "Responses received, by HTTP status"),
+    ("download_exceptions_total", "counter", "Download errors, by exception type"),
+    ("response_bytes_total", "counter", "Response bytes downloaded"),
+    ("retries_total", "counter", "Requests retried"),
+    ("parse_seconds", "summary", "Time spent in spider callbacks, by callback"),
+    ("items_scraped_total", "counter", "Items that passed every pipeline"),
+    ("items_filtered_total", "counter", "Posts or items filtered out, by stage"),
+    ("db_upsert_seconds", "summary", "MySQLAnnouncementsPipeline batch upsert latency"),
+    ("db_batch_rows", "summary", "Rows per MySQLAnnouncementsPipeline batch"),
+    ("db_batch_rows_max", "gauge", "Largest MySQL batch in this run"),
+    ("checkpoint", "gauge", "SOCO listing number checkpoint (start: loaded, current: highest seen, contiguous: all done up to, saved: written)"),
+    ("domain_concurrency", "gauge", "Adaptive per-domain concurrency"),
+    ("domain_delay_seconds", "gauge", "Adaptive per-domain download delay"),
+    ("run_running", "gauge", "1 while the crawl is running"),
+    ("run_start_timestamp_seconds", "gauge", "Start time of the current or last run"),
+    ("run_elapsed_seconds", "gauge", "Elapsed time of the current or last run"),
+]
+
+# stats 키 → (지표, 라벨). 접미사가 라벨 값인 키는 _PREFIXED에서 처리
+_DIRECT = {
+    "downloader/request_count": ("requests_total", ()),
+    "downloader/response_bytes": ("response_bytes_total", ()),
+    "retry/count": ("retries_total", ()),
+    "item_scraped_count": ("items_scraped_total", ()),
+    "soco/list_filtered": ("items_filtered_total", (("stage", "list"),)),
+    "soco/detail_filtered": ("items_filtered_total", (("stage", "detail"),)),
+    "item_dropped_count": ("items_filtered_total", (("stage", "pipeline"),)),
+    "mysql/unchanged_skipped": ("items_filtered_total", (("stage", "unchanged"),)),
+    "mysql/upsert_seconds": ("db_upsert_seconds_sum", ()),
+    "mysql/upsert_batches": ("db_upsert_seconds_count", ()),
+    "mysql/batch_rows": ("db_batch_rows_sum", ()),
+}
+_DIRECT_BATCHES = ("db_batch_rows_count", ())  # mysql/upsert_batches를 두 요약에 함께 사용
+_PREFIXED = [
+    ("downloader/response_status_count/", "responses_total", "status"),
+    ("downloader/exception_type_count/", "download_exceptions_total", "type"),
+]
+_GAUGES = {
+    "mysql/batch_rows_max": ("db_batch_rows_max", ()),
+    "soco/checkpoint_start": ("checkpoint", (("position", "start"),)),
+    "soco/current_max_no": ("checkpoint", (("position", "current"),)),
+    "soco/checkpoint_saved": ("checkpoint", (("position", "saved"),)),
+    "soco/checkpoint_contiguous": ("checkpoint", (("position", "contiguous"),)),
+}
+
+Sample = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels) + "}"
+
+
+def _format_value(value: float) -> str:
+    if isinstance(value, bool):
+        value = int(value)
+    if isinstance(value, int) or float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def collect(stats: Dict) -> Tuple[Dict[Sample, float], Dict[Sample, float]]:
+    """stats 사전 → (누적되는 카운터/요약 표본, 게이지 표본)"""
+    counters: Dict[Sample, float] = {}
+    gauges: Dict[Sample, float] = {}
+    for key, value in stats.items():
+        if not isinstance(value, (int, float)):
+            continue
+        if key in _DIRECT:
+            sample = _DIRECT[key]
+            counters[sample] = counters.get(sample, 0) + value
+            if key == "mysql/upsert_batches":
+                counters[_DIRECT_BATCHES] = value
+            continue
+        if key in _GAUGES:
+            gauges[_GAUGES[key]] = value
+            continue
+        for prefix, name, label in _PREFIXED:
+            if key.startswith(prefix):
+                counters[(name, ((label, key[len(prefix):]),))] = value
+                break
+        else:
+            parts = key.split("/")
+            if len(parts) != 3:
+                continue
+            if parts[0] == "parse":
+                # parse/<콜백>/seconds | parse/<콜백>/count
+                _, callback, kind = parts
+                if kind == "seconds":
+                    counters[("parse_seconds_sum", (("callback", callback),))] = value
+                elif kind == "count":
+                    counters[("parse_seconds_count", (("callback", callback),))] = value
+            elif parts[0] == "adaptive":
+                _, domain, kind = parts
+                if kind == "concurrency":
+                    gauges[("domain_concurrency", (("domain", domain),))] = value
+                elif kind == "delay":
+                    gauges[("domain_delay_seconds", (("domain", domain),))] = value
+    return counters, gauges
+
+
+def render(run: Dict[Sample, float], total: Dict[Sample, float], gauges: Dict[Sample, float]) -> str:
+    """Prometheus 텍스트 형식 (exposition format 0.0.4)"""
+    lines: List[str] = []
+    for family, kind, help_text in _FAMILIES:
+        samples = []
+        if kind == "gauge":
+            samples = [(name, labels, value) for (name, labels), value in gauges.items() if name == family]
+        else:
+            for scope, source in (("run", run), ("total", total)):
+                for (name, labels), value in source.items():
+                    if name == family or (kind == "summary" and name in (f"{family}_sum", f"{family}_count")):
+                        samples.append((name, (("scope", scope),) + labels, value))
+        if not samples:
+            continue
+        lines.append(f"# HELP {PREFIX}_{family} {help_text}")
+        lines.append(f"# TYPE {PREFIX}_{family} {kind}")
+        for name, labels, value in sorted(samples, key=lambda s: (s[0], s[1])):
+            lines.append(f"{PREFIX}_{name}{_format_labels(labels)} {_format_value(value)}")
+    return "\n".join(lines) + "\n"
+
+
+def _sample_key(sample: Sample) -> str:
+    name, labels = sample
+    return name + _format_labels(labels)
+
+
+class CrawlMetrics:
+    """
+    Scrapy 확장: stats를 주기적으로 Prometheus 텍스트로 내보냄 (파일 + 선택적 HTTP)
+
+    EXTENSIONS = {"homepass_scraper.metrics.CrawlMetrics": 500}
+    """
+
+    def __init__(self, crawler, metrics_dir: Path, interval: float, http_host: str, http_port: int):
+        self.crawler = crawler
+        self.stats = crawler.stats
+        self.metrics_dir = metrics_dir
+        self.metrics_dir.mkdir(parents=True, exist_ok=True)
+        self.metrics_path = self.metrics_dir / METRICS_FILE_NAME
+        self.cumulative_path = self.metrics_dir / CUMULATIVE_FILE_NAME
+        self.interval = interval
+        self.http_host = http_host
+        self.http_port = http_port
+
+        self.cumulative: Dict[str, Tuple[Sample, float]] = self._load_cumulative()
+        self.started_at: Optional[float] = None
+        self.running = False
+        self.latest = ""
+        self.loop = None
+        self.listener = None
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        settings = crawler.settings
+        if not settings.getbool("METRICS_ENABLED", True):
+            raise NotConfigured
+        metrics_dir = settings.get("METRICS_DIR") or None
+        ext = cls(
+            crawler,
+            Path(metrics_dir).expanduser().resolve() if metrics_dir else DEFAULT_METRICS_DIR,
+            interval=settings.getfloat("METRICS_INTERVAL", 15.0),
+            http_host=settings.get("METRICS_HTTP_HOST", "127.0.0.1"),
+            http_port=settings.getint("METRICS_HTTP_PORT", 0),
+        )
+        crawler.signals.connect(ext.spider_opened, signal=signals.spider_opened)
+        crawler.signals.connect(ext.spider_closed, signal=signals.spider_closed)
+        return ext
+
+    # ------------------------------------------------------------------ #
+    # 누적값
+    # ------------------------------------------------------------------ #
+    def _load_cumulative(self) -> Dict[str, Tuple[Sample, float]]:
+        try:
+            raw = json.loads(self.cumulative_path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as exc:
+            logger.warning("⚠️ 누적 지표 파일을 읽지 못해 0부터 다시 셉니다 (%s): %s", self.cumulative_path, exc)
+            return {}
+        cumulative = {}
+        for entry in raw.get("samples", []):
+            sample = (entry["name"], tuple((k, v) for k, v in entry["labels"]))
+            cumulative[_sample_key(sample)] = (sample, entry["value"])
+        return cumulative
+
+    def _save_cumulative(self, cumulative: Dict[str, Tuple[Sample, float]]) -> None:
+        payload = {
+            "updated_at": time.time(),
+            "samples": [
+                {"name": name, "labels": [list(label) for label in labels], "value": value}
+                for (name, labels), value in cumulative.values()
+            ],
+        }
+        self._atomic_write(self.cumulative_path, json.dumps(payload, ensure_ascii=False, indent=1))
+
+    def _totals(self, run: Dict[Sample, float]) -> Dict[str, Tuple[Sample, float]]:
+        totals = dict(self.cumulative)
+        for sample, value in run.items():
+            key = _sample_key(sample)
+            totals[key] = (sample, totals.get(key, (sample, 0))[1] + value)
+        return totals
+
+    # ------------------------------------------------------------------ #
+    # 내보내기
+    # ------------------------------------------------------------------ #
+    def snapshot(self) -> Tuple[str, Dict[str, Tuple[Sample, float]]]:
+        run, gauges = collect(self.stats.get_stats())
+        totals = self._totals(run)
+        now = time.time()
+        gauges[("run_running", ())] = 1 if self.running else 0
+        if self.started_at is not None:
+            gauges[("run_start_timestamp_seconds", ())] = round(self.started_at, 3)
+            gauges[("run_elapsed_seconds", ())] = round(now - self.started_at, 3)
+        text = render(run, dict(totals.values()), gauges)
+        return text, totals
+
+    def export(self) -> None:
+        try:
+            self.latest, _ = self.snapshot()
+            self._atomic_write(self.metrics_path, self.latest)
+        except Exception as exc:  # noqa: BLE001 - 지표 실패로 수집이 멈추지 않도록
+            logger.warning("⚠️ 지표 내보내기 실패: %s", exc)
+
+    @staticmethod
+    def _atomic_write(path: Path, text: str) -> None:
+        # 읽는 쪽(node_exporter / 백엔드)이 쓰는 도중의 파일을 보지 않도록
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(text, encoding="utf-8")
+        os.replace(tmp, path)
+
+    # ------------------------------------------------------------------ #
+    # 시그널
+    # ------------------------------------------------------------------ #
+    def spider_opened(self, spider):
+        from twisted.internet import task
+
+        self.started_at = time.time()
+        self.running = True
+        self.export()
+        self.loop = task.LoopingCall(self.export)
+        self.loop.start(max(1.0, self.interval), now=False)
+        if self.http_port:
+            self._listen()
+        spider.logger.info("📈 수집 지표: %s (%.0f초마다)", self.metrics_path, self.interval)
+
+    def spider_closed(self, spider, reason):
+        if self.loop is not None and self.loop.running:
+            self.loop.stop()
+        self.running = False
+        try:
+            text, totals = self.snapshot()
+            # 이번 실행 값을 누적값에 더해 보관 (다음 실행의 scope="total" 시작값)
+            self._save_cumulative(totals)
+            self.cumulative = totals
+            self.latest = text
+            self._atomic_write(self.metrics_path, text)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("⚠️ 최종 지표 저장 실패: %s", exc)
+        if self.listener is not None:
+            return self.listener.stopListening()
+        return None
+
+    def _listen(self) -> None:
+        from twisted.internet import reactor
+        from twisted.web.resource import Resource
+        from twisted.web.server import Site
+
+        ext = self
+
+        class MetricsResource(Resource):
+            isLeaf = True
+
+            def render_GET(self, request):
+                request.setHeader(b"Content-Type", b"text/plain; version=0.0.4; charset=utf-8")
+                # 요청 시점 값 (주기 내보내기를 기다리지 않음)
+                text = ext.snapshot()[0] if ext.running else ext.latest
+                return text.encode("utf-8")
+
+        try:
+            self.listener = reactor.listenTCP(self.http_port, Site(MetricsResource()), interface=self.http_host)
+            logger.info("📈 지표 HTTP: http://%s:%d/metrics", self.http_host, self.http_port)
+        except Exception as exc:  # noqa: BLE001 - 포트 충돌 시 파일 내보내기만 사용
+            logger.warning("⚠️ 지표 HTTP 포트를 열지 못했습니다 (%s:%d): %s", self.http_host, self.http_port, exc)
+
+
+class CallbackTimingMiddleware:
+    """
+    스파이더 콜백별 파싱 시간 (stats: parse/<콜백>/seconds, parse/<콜백>/count)
+
+    콜백 제너레이터 안에서 보낸 시간만 잽니다 (뒤쪽 파이프라인 처리 시간은 제외).
+    다른 스파이더 미들웨어보다 스파이더 가까이(큰 번호)에 둡니다.
+    """
+
+    def __init__(self, stats):
+        self.stats = stats
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        if not crawler.settings.getbool("METRICS_ENABLED", True):
+            raise NotConfigured
+        return cls(crawler.stats)
+
+    @staticmethod
+    def _callback_name(response, spider) -> str:
+        request = getattr(response, "request", None)
+        callback = getattr(request, "callback", None) if request is not None else None
+        return getattr(callback, "__name__", None) or "parse"
+
+    def _record(self, name: str, elapsed: float) -> None:
+        self.stats.inc_value(f"parse/{name}/seconds", elapsed)
+        self.stats.inc_value(f"parse/{name}/count")
+
+    def process_spider_output(self, response, result, spider):
+        name = self._callback_name(response, spider)
+        elapsed = 0.0
+        iterator = iter(result)
+        while True:
+            started = time.perf_counter()
+            try:
+                entry = next(iterator)
+            except StopIteration:
+                elapsed += time.perf_counter() - started
+                break
+            elapsed += time.perf_counter() - started
+            yield entry
+        self._record(name, elapsed)
+
+    async def process_spider_output_async(self, response, result, spider):
+        name = self._callback_name(response, spider)
+        elapsed = 0.0
+        iterator = result.__aiter__()
+        while True:
+            started = time.perf_counter()
+            try:
+                entry = await iterator.__anext__()
+            except StopAsyncIteration:
+                elapsed += time.perf_counter() - started
+                break
+            elapsed += time.perf_counter() - started
+            yield entry
+        self._record(name, elapsed)
@@ -3,11 +3,32 @@
 # See documentation in:
 # https://docs.scrapy.org/en/latest/topics/spider-middleware.html
 
+import logging
+import random
+import time
+from collections import deque
+
 from scrapy import signals
+from scrapy.downloadermiddlewares.retry import get_retry_request
+from scrapy.exceptions import NotConfigured
+from scrapy.utils.httpobj import urlparse_cached
+from twisted.internet import defer
+from twisted.internet.error import (
+    ConnectError,
+    ConnectionDone,
+    ConnectionLost,
+    ConnectionRefusedError,
+    DNSLookupError,
+    TCPTimedOutError,
+    TimeoutError,
+)
+from twisted.web.client import ResponseFailed
 
 # useful for handling different item types with a single interface
 from itemadapter import ItemAdapter
 
+logger = logging.getLogger(__name__)
+
 
 class HomepassScraperSpiderMiddleware:
     # Not all methods need to be defined. If a method is not defined,
@@ -98,3 +119,318 @@ class HomepassScraperDownloaderMiddleware:
 
     def spider_opened(self, spider):
         spider.logger.info("Spider opened: %s" % spider.name)
+
+
+class ConditionalRequestMiddleware:
+    """
+    조건부 요청 (ETag / Last-Modified)
+
+    request.meta["conditional"]이 True인 요청(재수집 상세 페이지)에 If-None-Match / If-Modified-Since를 붙이고,
+    서버가 304를 돌려주면 그대로 콜백에 전달합니다. 콜백은 response.status == 304로 파싱을 건너뜁니다.
+    False인 요청(새 공고)은 조건 없이 받되, 다음 재수집을 위해 응답의 검증자만 저장합니다.
+
+    MySQLAnnouncementsPipeline을 쓰면 200 응답의 검증자는 해당 공고가 DB에 커밋된 뒤
+    (announcements_written 신호) 저장합니다. 먼저 저장하면 쓰기가 실패했을 때 다음 실행에서
+    304를 받아 수정된 내용을 놓치기 때문입니다. (커밋 전까지는 이전 검증자가 그대로 남음)
+    캐시 파일은 new_extractor.py의 PDF 다운로드와 공유합니다 (homepass_scraper/http_cache.py).
+    """
+
+    def __init__(self, cache, stats=None, store_after_write=False):
+        self.cache = cache
+        self.stats = stats
+        self.store_after_write = store_after_write
+        # 공고 번호 → (url, ETag, Last-Modified): DB 커밋을 기다리는 검증자
+        self.unwritten = {}
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        settings = crawler.settings
+        if not settings.getbool("HTTP_COND_CACHE_ENABLED", True):
+            raise NotConfigured
+
+        from homepass_scraper.http_cache import ConditionalHttpCache
+
+        cache = ConditionalHttpCache(
+            cache_dir=settings.get("HTTP_COND_CACHE_DIR") or None,
+            max_entries=settings.getint("HTTP_COND_CACHE_MAX_ENTRIES", 20000),
+            max_bytes=int(settings.getfloat("HTTP_COND_CACHE_MAX_MB", 512) * 1024 * 1024),
+            max_age_seconds=settings.getfloat("HTTP_COND_CACHE_MAX_AGE_DAYS", 30) * 86400,
+        )
+        pipelines = settings.getdict("ITEM_PIPELINES")
+        store_after_write = pipelines.get("homepass_scraper.pipelines.MySQLAnnouncementsPipeline") is not None
+        s = cls(cache, crawler.stats, store_after_write=store_after_write)
+        crawler.signals.connect(s.spider_closed, signal=signals.spider_closed)
+        if store_after_write:
+            from homepass_scraper.crawl_state import announcements_written
+
+            crawler.signals.connect(s.announcements_written, signal=announcements_written)
+        return s
+
+    def process_request(self, request, spider):
+        if not request.meta.get("conditional"):
+            return None
+        for name, value in self.cache.conditional_headers(request.url).items():
+            request.headers.setdefault(name, value)
+        # HttpErrorMiddleware가 304를 걸러내지 않도록
+        allowed = list(request.meta.get("handle_httpstatus_list", []))
+        if 304 not in allowed:
+            request.meta["handle_httpstatus_list"] = allowed + [304]
+        return None
+
+    def process_response(self, request, response, spider):
+        if "conditional" not in request.meta:
+            return response
+        if response.status == 304:
+            self.cache.touch(request.url)
+            self._inc("httpcache/conditional_304")
+        elif response.status == 200:
+            validators = (request.url, self._header(response, b"ETag"), self._header(response, b"Last-Modified"))
+            list_number = request.cb_kwargs.get("list_number")
+            if self.store_after_write and list_number is not None:
+                self.unwritten[list_number] = validators
+            else:
+                self.cache.store(*validators)
+            self._inc("httpcache/conditional_200")
+        return response
+
+    def announcements_written(self, listing_numbers):
+        for number in listing_numbers:
+            validators = self.unwritten.pop(number, None)
+            if validators is not None:
+                self.cache.store(*validators)
+
+    def spider_closed(self, spider):
+        # 커밋되지 않은(쓰기 실패, 필터링) 공고의 검증자는 버림 → 다음 실행에서 다시 200으로 받음
+        self.unwritten.clear()
+        removed = self.cache.prune()
+        if removed:
+            spider.logger.info("🧹 조건부 요청 캐시 정리: %d개 항목 삭제", removed)
+        self.cache.close()
+
+    @staticmethod
+    def _header(response, name):
+        value = response.headers.get(name)
+        return value.decode("latin-1") if value else None
+
+    def _inc(self, key):
+        if self.stats is not None:
+            self.stats.inc_value(key)
+
+
+class _DomainState:
+    """AdaptiveConcurrencyMiddleware가 도메인(다운로드 슬롯)별로 유지하는 상태"""
+
+    __slots__ = ("concurrency", "delay", "latency", "outcomes", "paused_until")
+
+    def __init__(self, concurrency, delay, window):
+        self.concurrency = float(concurrency)
+        self.delay = float(delay)
+        self.latency = None  # 성공 응답 지연시간 EWMA (초)
+        self.outcomes = deque(maxlen=window)  # 최근 응답의 오류 여부
+        self.paused_until = 0.0
+
+    def error_rate(self):
+        return sum(self.outcomes) / len(self.outcomes) if self.outcomes else 0.0
+
+
+class AdaptiveConcurrencyMiddleware:
+    """
+    도메인별 적응형 동시성 / 재시도 (soco.seoul.go.kr를 수동 조정 없이 가능한 한 빠르고 안전하게)
+
+    - 시작값은 CONCURRENT_REQUESTS_PER_DOMAIN / DOWNLOAD_DELAY, 이후 응답마다 슬롯의 동시 요청 수와 지연을 조정
+      · 정상 응답 + 지연시간(EWMA)이 목표 이하: 지연을 줄이고, 최소 지연이면 동시 요청 수를 조금씩 늘림 (가산 증가)
+      · 지연시간이 목표 초과: 동시 요청 수와 지연을 완만하게 되돌림
+      · 5xx / 429 / 408 / 타임아웃·연결 오류: 동시 요청 수 절반 (이미 최소이면 지연 2배)
+    - 같은 오류는 지수 백오프 + 지터 후 재시도 (ADAPTIVE_RETRY_TIMES회까지)
+    - 최근 ADAPTIVE_WINDOW개 응답 중 오류 비율이 ADAPTIVE_PAUSE_ERROR_RATE 이상이면
+      해당 도메인 요청을 ADAPTIVE_PAUSE_SECONDS 동안 멈춤
+
+    RetryMiddleware(550)보다 앞(560)에서 응답/예외를 먼저 처리하므로 기본 재시도와 중복되지 않습니다.
+    (이 미들웨어를 끄면 RetryMiddleware가 기존대로 재시도)
+    """
+
+    RETRY_EXCEPTIONS = (
+        defer.TimeoutError,
+        TimeoutError,
+        DNSLookupError,
+        ConnectionRefusedError,
+        ConnectionDone,
+        ConnectError,
+        ConnectionLost,
+        TCPTimedOutError,
+        ResponseFailed,
+        IOError,
+    )
+    RETRY_HTTP_CODES = [500, 502, 503, 504, 522, 524, 408, 429]
+    # 상태 판단에 쓰는 최소 표본 수 (이보다 적으면 일시 정지하지 않음)
+    MIN_SAMPLES = 10
+    # 지연시간 EWMA 가중치
+    LATENCY_ALPHA = 0.3
+
+    def __init__(self, crawler):
+        settings = crawler.settings
+        self.crawler = crawler
+        self.stats = crawler.stats
+
+        self.start_concurrency = max(1, settings.getint("CONCURRENT_REQUESTS_PER_DOMAIN", 8))
+        self.start_delay = settings.getfloat("DOWNLOAD_DELAY", 0)
+        self.min_concurrency = max(1, settings.getint("ADAPTIVE_MIN_CONCURRENCY", 1))
+        self.max_concurrency = max(self.min_concurrency, settings.getint("ADAPTIVE_MAX_CONCURRENCY", 8))
+        self.min_delay = settings.getfloat("ADAPTIVE_MIN_DELAY", 0.1)
+        self.max_delay = settings.getfloat("ADAPTIVE_MAX_DELAY", 5.0)
+        self.target_latency = settings.getfloat("ADAPTIVE_TARGET_LATENCY", 1.5)
+
+        self.window = max(1, settings.getint("ADAPTIVE_WINDOW", 30))
+        self.pause_error_rate = settings.getfloat("ADAPTIVE_PAUSE_ERROR_RATE", 0.5)
+        self.pause_seconds = settings.getfloat("ADAPTIVE_PAUSE_SECONDS", 60)
+
+        self.max_retry_times = settings.getint("ADAPTIVE_RETRY_TIMES", 4)
+        self.retry_http_codes = {int(code) for code in settings.getlist("ADAPTIVE_RETRY_HTTP_CODES", self.RETRY_HTTP_CODES)}
+        self.backoff_base = settings.getfloat("ADAPTIVE_BACKOFF_BASE", 1.0)
+        self.backoff_max = settings.getfloat("ADAPTIVE_BACKOFF_MAX", 60.0)
+
+        self.domains = {}
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        if not crawler.settings.getbool("ADAPTIVE_CONCURRENCY_ENABLED", True):
+            raise NotConfigured
+        s = cls(crawler)
+        crawler.signals.connect(s.spider_closed, signal=signals.spider_closed)
+        return s
+
+    # ------------------------------------------------------------------ #
+    # 미들웨어 훅
+    # ------------------------------------------------------------------ #
+    def process_request(self, request, spider):
+        state = self._state(self._key(request))
+        wait = max(state.paused_until, request.meta.get("retry_not_before", 0)) - time.time()
+        if wait <= 0:
+            return None
+        # 일시 정지 중이거나 백오프 대기 중: 기다린 뒤 다음 미들웨어로 계속 진행 (None)
+        from twisted.internet import reactor, task
+
+        return task.deferLater(reactor, wait, lambda: None)
+
+    def process_response(self, request, response, spider):
+        key = self._key(request)
+        failed = response.status in self.retry_http_codes
+        self._observe(key, request.meta.get("download_latency"), failed)
+        if failed:
+            retry = self._retry(request, f"HTTP {response.status}", spider)
+            if retry is not None:
+                return retry
+        return response
+
+    def process_exception(self, request, exception, spider):
+        if not isinstance(exception, self.RETRY_EXCEPTIONS):
+            return None
+        self._observe(self._key(request), None, True)
+        return self._retry(request, exception.__class__.__name__, spider)
+
+    def spider_closed(self, spider):
+        for key, state in self.domains.items():
+            spider.logger.info(
+                "📶 %s 최종 동시성=%d, 지연=%.2fs, 평균 응답=%s, 최근 오류율=%.0f%%",
+                key,
+                int(state.concurrency),
+                state.delay,
+                f"{state.latency:.2f}s" if state.latency is not None else "-",
+                state.error_rate() * 100,
+            )
+
+    # ------------------------------------------------------------------ #
+    # 상태 / 조정
+    # ------------------------------------------------------------------ #
+    @staticmethod
+    def _key(request):
+        # Downloader가 정하는 슬롯 키와 같은 값 (첫 요청은 아직 슬롯이 없어 호스트명으로)
+        return request.meta.get("download_slot") or urlparse_cached(request).hostname or ""
+
+    def _state(self, key):
+        state = self.domains.get(key)
+        if state is None:
+            state = _DomainState(
+                min(max(self.start_concurrency, self.min_concurrency), self.max_concurrency),
+                min(max(self.start_delay, self.min_delay), self.max_delay),
+                self.window,
+            )
+            self.domains[key] = state
+        return state
+
+    def _observe(self, key, latency, failed):
+        state = self._state(key)
+        state.outcomes.append(failed)
+        if failed:
+            # 동시 요청 수를 먼저 줄이고, 이미 최소이면 지연을 늘림 (지연은 회복이 느리므로)
+            if state.concurrency > self.min_concurrency:
+                state.concurrency = max(self.min_concurrency, state.concurrency / 2)
+            else:
+                state.delay = min(self.max_delay, max(state.delay, self.min_delay) * 2)
+            self._inc("adaptive/errors")
+            self._maybe_pause(key, state)
+        else:
+            if latency is not None:
+                state.latency = (
+                    latency
+                    if state.latency is None
+                    else (1 - self.LATENCY_ALPHA) * state.latency + self.LATENCY_ALPHA * latency
+                )
+            if state.latency is not None and state.latency > self.target_latency:
+                state.concurrency = max(self.min_concurrency, state.concurrency * 0.75)
+                state.delay = min(self.max_delay, state.delay * 1.25)
+            elif state.error_rate() < 0.1:
+                # 늘어난 지연을 먼저 되돌리고, 그다음 동시 요청 수를 늘림 (동시 요청 수만큼 연속 성공하면 1 증가)
+                if state.delay > self.min_delay:
+                    state.delay = max(self.min_delay, state.delay * 0.75)
+                else:
+                    state.concurrency = min(self.max_concurrency, state.concurrency + 1 / state.concurrency)
+        self._apply(key, state)
+
+    def _maybe_pause(self, key, state):
+        if len(state.outcomes) < min(self.MIN_SAMPLES, self.window):
+            return
+        error_rate = state.error_rate()
+        if error_rate < self.pause_error_rate or time.time() < state.paused_until:
+            return
+        state.paused_until = time.time() + self.pause_seconds
+        state.concurrency = self.min_concurrency
+        # 재개 후에는 새 표본으로 다시 판단
+        state.outcomes.clear()
+        self._inc("adaptive/paused")
+        logger.warning(
+            "⏸️ %s 오류율 %.0f%% → %.0f초 동안 요청 일시 정지 (동시성 %d로 재시작)",
+            key,
+            error_rate * 100,
+            self.pause_seconds,
+            self.min_concurrency,
+        )
+
+    def _apply(self, key, state):
+        engine = getattr(self.crawler, "engine", None)
+        slot = engine.downloader.slots.get(key) if engine is not None else None
+        if slot is not None:
+            slot.concurrency = int(state.concurrency)
+            slot.delay = state.delay
+        if self.stats is not None:
+            self.stats.set_value(f"adaptive/{key}/concurrency", int(state.concurrency))
+            self.stats.set_value(f"adaptive/{key}/delay", round(state.delay, 3))
+
+    def _retry(self, request, reason, spider):
+        retry_times = request.meta.get("retry_times", 0)
+        new_request = get_retry_request(
+            request,
+            spider=spider,
+            reason=reason,
+            max_retry_times=request.meta.get("max_retry_times", self.max_retry_times),
+        )
+        if new_request is None:
+            return None
+        # 지수 백오프 + 지터 (절반은 고정, 절반은 무작위 → 여러 요청이 같은 순간에 몰리지 않도록)
+        backoff = min(self.backoff_max, self.backoff_base * (2 ** retry_times))
+        new_request.meta["retry_not_before"] = time.time() + backoff / 2 + random.uniform(0, backoff / 2)
+        return new_request
+
+    def _inc(self, key):
+        if self.stats is not None:
+            self.stats.inc_value(key)
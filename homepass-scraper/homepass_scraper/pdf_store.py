@@ -0,0 +1,211 @@
+# homepass_scraper/homepass_scraper/pdf_store.py
+"""
+공고 PDF 로컬 저장소 (내용 주소 기반)
+
+- 파일 경로는 내용의 sha256으로 결정: sha256/ab/abcdef....pdf
+  → 같은 PDF가 여러 공고에 붙어 있어도 한 번만 저장되고, 이름 충돌이 없음
+- URL → sha256 색인(index.sqlite3)으로 이미 받은 URL은 다시 다운로드하지 않음
+- 스파이더(HomepassScraperPipeline)가 수집 중에 저장하고, new_extractor.py는 공고의 pdf_sha256으로
+  이 저장소에서 바로 읽음 (추출 단계에서는 네트워크 I/O 없음)
+- 원격 백엔드(storage.py, PDF_STORE_BACKEND)가 있으면 로컬 디렉터리는 캐시가 되고,
+  새 PDF는 제한된 수의 스레드로 백그라운드 업로드 (같은 sha256이 이미 있으면 생략),
+  로컬에 없는 PDF는 원격에서 받아 옴 → 여러 추출 호스트가 SOCO에 다시 요청하지 않고 같은 PDF를 공유
+"""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Dict, Optional, Set, Tuple
+
+from homepass_scraper.storage import StorageBackend, storage_from_env
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STORE_DIR = Path(__file__).resolve().parents[1] / "downloads"
+
+_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS pdf_urls (
+        url TEXT PRIMARY KEY,
+        sha256 TEXT NOT NULL,
+        stored_at REAL NOT NULL
+    )
+"""
+
+
+def sha256_hex(body: bytes) -> str:
+    return hashlib.sha256(body).hexdigest()
+
+
+def sha256_file(path: Path, chunk_size: int = 1024 * 1024) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class PdfStore:
+    def __init__(
+        self,
+        base_dir: Optional[str] = None,
+        remote: Optional[StorageBackend] = None,
+        upload_workers: int = 4,
+    ):
+        self.base_dir = Path(base_dir).expanduser().resolve() if base_dir else DEFAULT_STORE_DIR
+        self.base_dir.mkdir(parents=True, exist_ok=True)
+
+        self.remote = remote
+        self._uploads: Optional[ThreadPoolExecutor] = None
+        if remote is not None:
+            self._uploads = ThreadPoolExecutor(max_workers=max(1, upload_workers), thread_name_prefix="pdf-upload")
+        self._pending: Dict[str, Future] = {}
+        self._synced: Set[str] = set()
+        self.upload_stats = {"uploaded": 0, "skipped": 0, "failed": 0}
+
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(self.base_dir / "index.sqlite3"), check_same_thread=False, timeout=30)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(_SCHEMA)
+        self._db.commit()
+
+    @classmethod
+    def from_env(cls, base_dir: Optional[str] = None) -> "PdfStore":
+        """
+        환경변수 설정으로 생성 (스파이더와 new_extractor.py 공통)
+
+        base_dir를 주지 않으면 PDF_STORE_DIR (스파이더 FILES_STORE와 같은 위치여야 함)
+        """
+        return cls(
+            base_dir or os.getenv("PDF_STORE_DIR") or None,
+            remote=storage_from_env(),
+            upload_workers=int(os.getenv("PDF_STORE_UPLOAD_WORKERS", "4")),
+        )
+
+    # ------------------------------------------------------------------ #
+    # 내용
+    # ------------------------------------------------------------------ #
+    @staticmethod
+    def relative_path(sha256: str) -> str:
+        return f"sha256/{sha256[:2]}/{sha256}.pdf"
+
+    def path(self, sha256: str) -> Path:
+        return self.base_dir / self.relative_path(sha256)
+
+    def has(self, sha256: str) -> bool:
+        return self.path(sha256).is_file()
+
+    def put(self, body: bytes, sha256: Optional[str] = None) -> Tuple[str, str, bool]:
+        """
+        PDF 저장 (같은 내용이 이미 있으면 쓰지 않음)
+
+        Returns:
+            (sha256, 저장소 기준 상대 경로, 새로 저장했는지)
+        """
+        sha256 = sha256 or sha256_hex(body)
+        target = self.path(sha256)
+        if target.is_file():
+            self.sync(sha256)
+            return sha256, self.relative_path(sha256), False
+        target.parent.mkdir(parents=True, exist_ok=True)
+        # 추출기가 쓰는 도중의 파일을 읽지 않도록 임시 파일에 쓴 뒤 교체
+        tmp = target.with_name(f".{target.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_bytes(body)
+        os.replace(tmp, target)
+        self.sync(sha256)
+        return sha256, self.relative_path(sha256), True
+
+    def fetch(self, sha256: str) -> Optional[Path]:
+        """
+        로컬 경로 반환. 로컬에 없으면 원격 백엔드에서 받아 로컬 캐시에 저장 (없으면 None)
+        """
+        target = self.path(sha256)
+        if target.is_file():
+            return target
+        if self.remote is None:
+            return None
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_name(f".{target.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            if not self.remote.download_file(self.relative_path(sha256), tmp):
+                return None
+            # 받은 내용이 키(sha256)와 같은지 확인 (중간에 끊긴 파일 방지)
+            if sha256_file(tmp) != sha256:
+                logger.warning("⚠️ 원격 PDF 내용이 sha256과 다릅니다: %s", sha256)
+                return None
+            os.replace(tmp, target)
+            return target
+        finally:
+            tmp.unlink(missing_ok=True)
+
+    # ------------------------------------------------------------------ #
+    # 원격 업로드 (백그라운드, 동시 업로드 수 제한)
+    # ------------------------------------------------------------------ #
+    def sync(self, sha256: str) -> None:
+        """로컬에 있는 PDF를 원격에 올리도록 예약 (원격에 같은 sha256이 있으면 업로드 생략)"""
+        if self._uploads is None:
+            return
+        with self._lock:
+            if sha256 in self._synced or sha256 in self._pending:
+                return
+            self._pending[sha256] = self._uploads.submit(self._upload, sha256)
+
+    def _upload(self, sha256: str) -> None:
+        key = self.relative_path(sha256)
+        try:
+            if self.remote.exists(key):
+                outcome = "skipped"
+            else:
+                self.remote.upload_file(key, self.path(sha256))
+                outcome = "uploaded"
+        except Exception as exc:  # noqa: BLE001 - 업로드 실패로 수집이 멈추지 않도록 (다음 수집 때 다시 시도)
+            outcome = "failed"
+            logger.warning("⚠️ PDF 업로드 실패 (%s → %s): %s", key, self.remote.describe(), exc)
+        with self._lock:
+            self._pending.pop(sha256, None)
+            self.upload_stats[outcome] += 1
+            if outcome != "failed":
+                self._synced.add(sha256)
+
+    def wait_uploads(self, timeout: Optional[float] = None) -> Dict[str, int]:
+        with self._lock:
+            pending = list(self._pending.values())
+        if pending:
+            wait(pending, timeout=timeout)
+        return dict(self.upload_stats)
+
+    # ------------------------------------------------------------------ #
+    # URL 색인
+    # ------------------------------------------------------------------ #
+    def lookup(self, url: str, max_age_seconds: Optional[float] = None) -> Optional[str]:
+        """이미 받은 URL의 sha256 (파일이 없거나 max_age_seconds보다 오래됐으면 None)"""
+        with self._lock:
+            row = self._db.execute("SELECT sha256, stored_at FROM pdf_urls WHERE url = ?", (url,)).fetchone()
+        if row is None:
+            return None
+        sha256, stored_at = row
+        if max_age_seconds is not None and time.time() - stored_at > max_age_seconds:
+            return None
+        return sha256 if self.has(sha256) else None
+
+    def remember(self, url: str, sha256: str) -> None:
+        with self._lock:
+            self._db.execute(
+                """
+                INSERT INTO pdf_urls (url, sha256, stored_at) VALUES (?, ?, ?)
+                ON CONFLICT(url) DO UPDATE SET sha256 = excluded.sha256, stored_at = excluded.stored_at
+                """,
+                (url, sha256, time.time()),
+            )
+            self._db.commit()
+
+    def close(self) -> None:
+        if self._uploads is not None:
+            self.wait_uploads()
+            self._uploads.shutdown(wait=True)
+        with self._lock:
+            self._db.close()
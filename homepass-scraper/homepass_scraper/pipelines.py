@@ -4,49 +4,118 @@ import scrapy
 from scrapy.pipelines.files import FilesPipeline
 from urllib.parse import unquote, urlparse
 import os
+import hashlib
 import json
 import pymysql
-from typing import Optional, Any, Dict, List
+from typing import Optional, Any, Dict, List, NamedTuple, Tuple
 from datetime import datetime, timezone, timedelta
 import re
+import time
+
+from twisted.internet.threads import deferToThread, deferToThreadPool
+from twisted.python.threadpool import ThreadPool
+
+from homepass_scraper import extraction_queue
+from homepass_scraper.crawl_state import announcements_written
+from homepass_scraper.pdf_store import PdfStore, sha256_hex
+
+
+class _PendingRow(NamedTuple):
+    """DB 쓰기 대기 중인 공고 1건 (upsert 파라미터 + 큐 등록용 식별 정보)"""
+
+    params: tuple
+    listing_number: Optional[int]
+    title: str
+    content_hash: str
 
 
 class HomepassScraperPipeline(FilesPipeline):
+    """
+    공고 PDF를 수집 중에 한 번만 받아 내용 주소 저장소(PdfStore, FILES_STORE)에 저장합니다.
 
-    def get_media_requests(self, item, info):
-        """
-        아이템의 file_urls를 가져와 요청을 생성합니다.
-        원본 파일 이름을 메타(meta) 데이터에 저장합니다.
-        """
-        for file_url in item.get('file_urls', []):
-            try:
-                # 1. 스파이더가 추출한 원본 파일 이름을 가져옵니다.
-                #    (이 작업을 위해 스파이더 코드도 수정해야 합니다.)
-                original_filename = item['attachment_name']
+    - 경로는 내용의 sha256 (sha256/ab/<hash>.pdf) → 여러 공고가 같은 PDF를 공유해도 한 벌만 저장
+    - FILES_EXPIRES일 안에 받은 URL은 색인으로 확인하고 다시 받지 않음
+    - item에 pdf_sha256 / pdf_path를 기록 → MySQLAnnouncementsPipeline이 공고에 저장하고
+      new_extractor.py가 네트워크 없이 디스크에서 읽음
+    """
+
+    PDF_URL_FIELD = "original_pdf_url"
+
+    @property
+    def pdf_store(self) -> PdfStore:
+        # FilesPipeline 생성자 시그니처가 Scrapy 버전마다 달라 지연 생성 (FILES_STORE와 같은 디렉터리)
+        store = getattr(self, "_pdf_store", None)
+        if store is None:
+            # 원격 백엔드(PDF_STORE_BACKEND)가 있으면 새 PDF를 백그라운드로 업로드
+            store = self._pdf_store = PdfStore.from_env(base_dir=self.store.basedir)
+        return store
 
-                # 2. 요청에 원본 파일 이름을 'meta'로 함께 넘깁니다.
-                yield scrapy.Request(file_url, meta={'original_filename': original_filename})
-            except Exception as e:
-                info.spider.logger.warning(f"Failed to get file URL: {e} - item: {item}")
+    def get_media_requests(self, item, info):
+        url = item.get(self.PDF_URL_FIELD)
+        if url:
+            yield scrapy.Request(url)
+
+    def media_to_download(self, request, info, *, item=None):
+        """이미 받은 URL이면 다운로드 생략 (None이면 다운로드)"""
+        sha256 = self.pdf_store.lookup(request.url, max_age_seconds=self.expires * 86400)
+        if sha256 is None:
+            return None
+        # 원격 백엔드를 나중에 켰거나 지난 업로드가 실패한 경우를 위해 (원격에 있으면 생략)
+        self.pdf_store.sync(sha256)
+        self._inc_stat(info, "file_status_count/uptodate")
+        return {
+            "url": request.url,
+            "path": self.pdf_store.relative_path(sha256),
+            "checksum": sha256,
+            "status": "uptodate",
+        }
 
     def file_path(self, request, response=None, info=None, *, item=None):
-        """
-        다운로드된 파일의 저장 경로와 '원본 파일 이름'을 반환합니다.
-        """
-        try:
-            # 3. get_media_requests의 meta에서 원본 파일 이름을 가져옵니다.
-            original_filename = request.meta.get('original_filename')
+        if response is None:
+            # 내용을 받기 전에는 경로를 알 수 없음 (media_to_download에서 색인으로 확인)
+            return super().file_path(request, response, info, item=item)
+        sha256 = request.meta.get("pdf_sha256")
+        if sha256 is None:
+            sha256 = request.meta["pdf_sha256"] = sha256_hex(response.body)
+        return self.pdf_store.relative_path(sha256)
+
+    def file_downloaded(self, response, request, info, *, item=None):
+        sha256 = request.meta.get("pdf_sha256") or sha256_hex(response.body)
+        _, _, created = self.pdf_store.put(response.body, sha256)
+        if not created:
+            # 다른 URL(다른 공고)로 이미 받은 같은 PDF
+            self._inc_stat(info, "pdf_store/deduplicated")
+        self.pdf_store.remember(request.url, sha256)
+        return sha256
 
-            if original_filename:
-                # 4. 'full/' 폴더 대신 원본 파일 이름으로 바로 저장하도록 반환
-                #    (필요하다면 'full/' + original_filename 으로 해도 됩니다)
-                return original_filename
+    def close_spider(self, spider):
+        store = getattr(self, "_pdf_store", None)
+        if store is None:
+            return None
+        # 남은 업로드를 reactor 밖에서 기다린 뒤 닫음
+        deferred = deferToThread(store.close)
+        deferred.addCallback(lambda _: self._log_upload_stats(spider, store))
+        return deferred
 
-        except Exception as e:
-            info.spider.logger.warning(f"Failed to set file path: {e}")
+    @staticmethod
+    def _log_upload_stats(spider, store):
+        if store.remote is None:
+            return
+        for outcome, count in store.upload_stats.items():
+            spider.crawler.stats.set_value(f"pdf_store/{outcome}", count)
+        spider.logger.info(f"PDF upload to {store.remote.describe()}: {store.upload_stats}")
 
-        # 5. 실패 시 Scrapy 기본 방식(해시)을 따릅니다.
-        return super().file_path(request, response, info, item=item)
+    @staticmethod
+    def _inc_stat(info, key):
+        # inc_stats()는 Scrapy 버전마다 시그니처가 달라 직접 기록
+        info.spider.crawler.stats.inc_value(key)
+
+    def item_completed(self, results, item, info):
+        for ok, result in results:
+            if ok and result.get("url") == item.get(self.PDF_URL_FIELD):
+                item["pdf_sha256"] = result["checksum"]
+                item["pdf_path"] = result["path"]
+        return item
 
 
 class MySQLAnnouncementsPipeline:
@@ -55,7 +124,7 @@ class MySQLAnnouncementsPipeline:
     환경변수 기본값은 사용자가 제공한 RDS 정보를 따릅니다.
     """
 
-    def __init__(self):
+    def __init__(self, batch_size: int = 50, flush_interval: float = 2.0):
         self.host = os.environ.get("DB_HOST", "century20-rds.clqcgo84gd3x.us-west-2.rds.amazonaws.com")
         self.port = int(os.environ.get("DB_PORT", "3306"))
         self.user = os.environ.get("DB_USER", "admin")
@@ -68,6 +137,23 @@ class MySQLAnnouncementsPipeline:
         if database_url:
             self._apply_database_url(database_url)
 
+        # 배치 쓰기: batch_size개가 모이거나 flush_interval초가 지나면 한 번에 기록
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = max(0.1, flush_interval)
+        self.buffer: List[_PendingRow] = []
+        self.upsert_sql = ""
+        self.reactor = None
+        self.pool: Optional[ThreadPool] = None
+        self.shutdown_trigger = None
+        self.flush_loop = None
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        return cls(
+            batch_size=crawler.settings.getint("MYSQL_BATCH_SIZE", 50),
+            flush_interval=crawler.settings.getfloat("MYSQL_FLUSH_INTERVAL", 2.0),
+        )
+
     @staticmethod
     def _safe_first(seq, default=None):
         if not seq:
@@ -213,9 +299,46 @@ class MySQLAnnouncementsPipeline:
             autocommit=False,
         )
         self.cur = self.conn.cursor()
+        extraction_queue.ensure_table(self.cur)
+        self._ensure_content_hash_columns()
+        self.conn.commit()
+        self.upsert_sql = self._upsert_sql()
         spider.logger.info(f"MySQL connected host={self.host} db={self.database} table={self.table}")
 
+        # reactor는 Scrapy가 설치한 뒤에 import해야 함
+        from twisted.internet import reactor, task
+
+        self.reactor = reactor
+        # DB 연결은 하나이므로 쓰기 스레드도 하나 (배치 간 순서 보장)
+        self.pool = ThreadPool(minthreads=1, maxthreads=1, name="mysql-writer")
+        self.pool.start()
+        # 쓰기 스레드는 daemon이 아니므로 close_spider 없이 reactor가 멈춰도(강제 종료) 스레드를 정리
+        self.shutdown_trigger = reactor.addSystemEventTrigger("during", "shutdown", self._on_reactor_shutdown)
+        self.flush_loop = task.LoopingCall(self._flush, spider)
+        self.flush_loop.start(self.flush_interval, now=False)
+
     def close_spider(self, spider):
+        if self.flush_loop is not None and self.flush_loop.running:
+            self.flush_loop.stop()
+        # 남은 버퍼를 쓰고 (앞선 배치가 끝난 뒤 실행됨) 연결 종료
+        self._flush(spider)
+        deferred = deferToThreadPool(self.reactor, self.pool, self._close_connection)
+        deferred.addBoth(lambda _: self._stop_pool())
+        return deferred
+
+    def _on_reactor_shutdown(self) -> None:
+        self.shutdown_trigger = None  # 이미 실행된 트리거는 제거할 수 없음
+        self._stop_pool()
+
+    def _stop_pool(self) -> None:
+        if self.shutdown_trigger is not None:
+            self.reactor.removeSystemEventTrigger(self.shutdown_trigger)
+            self.shutdown_trigger = None
+        # close_spider와 reactor 종료 트리거 중 먼저 온 쪽만 정지 (두 번 stop하면 예외)
+        if self.pool is not None and self.pool.started and not self.pool.joined:
+            self.pool.stop()
+
+    def _close_connection(self) -> None:
         try:
             if self.conn:
                 self.conn.commit()
@@ -225,15 +348,115 @@ class MySQLAnnouncementsPipeline:
             if self.conn:
                 self.conn.close()
 
+    @staticmethod
+    def _content_hash(values: tuple) -> str:
+        payload = json.dumps(values, ensure_ascii=False, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _ensure_content_hash_columns(self) -> None:
+        """content_hash / content_changed_at / pdf_* 컬럼이 없으면 추가 (마이그레이션 도구 없이 운영 중인 테이블)"""
+        self.cur.execute(
+            "SELECT COLUMN_NAME FROM information_schema.COLUMNS WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s",
+            (self.database, self.table),
+        )
+        columns = {row["COLUMN_NAME"] for row in self.cur.fetchall()}
+        if "content_hash" not in columns:
+            self.cur.execute(f"ALTER TABLE {self.table} ADD COLUMN content_hash CHAR(64) NULL")
+        if "content_changed_at" not in columns:
+            self.cur.execute(f"ALTER TABLE {self.table} ADD COLUMN content_changed_at DATETIME NULL")
+        if "pdf_sha256" not in columns:
+            self.cur.execute(f"ALTER TABLE {self.table} ADD COLUMN pdf_sha256 CHAR(64) NULL")
+        if "pdf_path" not in columns:
+            self.cur.execute(f"ALTER TABLE {self.table} ADD COLUMN pdf_path VARCHAR(512) NULL")
+
+    def _upsert_sql(self) -> str:
+        return f"""
+            INSERT INTO {self.table}
+            (
+                title,
+                source_organization,
+                source_url,
+                housing_type,
+                region,
+                address_detail,
+                post_date,
+                application_end_date,
+                application_link,
+                homepage_link,
+                parsed_content,
+                original_pdf_url,
+                min_deposit,
+                max_deposit,
+                monthly_rent,
+                total_households,
+                eligibility,
+                commute_base_address,
+                commute_time,
+                is_customized,
+                image_urls,
+                schedules,
+                listing_number,
+                pdf_sha256,
+                pdf_path,
+                content_hash,
+                content_changed_at
+            )
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+            ON DUPLICATE KEY UPDATE
+                announcement_id = LAST_INSERT_ID(announcement_id),
+                source_organization = VALUES(source_organization),
+                source_url = VALUES(source_url),
+                housing_type = "청년안심주택",
+                region = VALUES(region),
+                address_detail = VALUES(address_detail),
+                post_date = VALUES(post_date),
+                application_end_date = VALUES(application_end_date),
+                application_link = VALUES(application_link),
+                homepage_link = VALUES(homepage_link),
+                parsed_content = VALUES(parsed_content),
+                original_pdf_url = VALUES(original_pdf_url),
+                min_deposit = VALUES(min_deposit),
+                max_deposit = VALUES(max_deposit),
+                monthly_rent = VALUES(monthly_rent),
+                total_households = VALUES(total_households),
+                eligibility = VALUES(eligibility),
+                commute_base_address = VALUES(commute_base_address),
+                commute_time = VALUES(commute_time),
+                is_customized = VALUES(is_customized),
+                image_urls = VALUES(image_urls),
+                schedules = VALUES(schedules),
+                listing_number = VALUES(listing_number),
+                pdf_sha256 = VALUES(pdf_sha256),
+                pdf_path = VALUES(pdf_path),
+                content_hash = VALUES(content_hash),
+                content_changed_at = VALUES(content_changed_at)
+        """
+
+    def _resolve_announcement_id(
+        self, listing_number: Optional[int], title: str, lastrowid: Optional[int] = None
+    ) -> Optional[int]:
+        """
+        방금 upsert한 공고의 announcement_id
+        (단건 upsert는 ON DUPLICATE KEY UPDATE의 LAST_INSERT_ID(announcement_id)로 lastrowid에 담김)
+        """
+        if lastrowid:
+            return lastrowid
+        if listing_number is not None:
+            self.cur.execute(
+                f"SELECT announcement_id FROM {self.table} WHERE listing_number = %s ORDER BY announcement_id DESC LIMIT 1",
+                (listing_number,),
+            )
+        else:
+            self.cur.execute(
+                f"SELECT announcement_id FROM {self.table} WHERE title = %s ORDER BY announcement_id DESC LIMIT 1",
+                (title,),
+            )
+        row = self.cur.fetchone()
+        return row["announcement_id"] if row else None
+
     def process_item(self, item: Dict[str, Any], spider):
-        # 타이틀 필터: 특정 키워드가 없으면 건너뜀
+        # 제목 필터는 상세 요청 전에 SocoBoardSpider.parse_list에서 적용 (SOCO_TITLE_KEYWORDS)
         title = (item.get("title") or "").strip()
-        allowed_keywords = ("공고", "청년안심주택")
-        if not any(keyword in title for keyword in allowed_keywords):
-            spider.logger.info(
-                f"Skip DB insert: title does not contain {allowed_keywords} | title='{title}'"
-            )
-            return item
 
         parsed_payload = self._as_dict(item.get("parsed_content"))
 
@@ -314,58 +537,6 @@ class MySQLAnnouncementsPipeline:
         schedules_json = self._json_or_none(schedules)
         is_customized_db = int(is_customized_flag) if isinstance(is_customized_flag, bool) else None
 
-        sql = f"""
-            INSERT INTO {self.table}
-            (
-                title,
-                source_organization,
-                source_url,
-                housing_type,
-                region,
-                address_detail,
-                post_date,
-                application_end_date,
-                application_link,
-                homepage_link,
-                parsed_content,
-                original_pdf_url,
-                min_deposit,
-                max_deposit,
-                monthly_rent,
-                total_households,
-                eligibility,
-                commute_base_address,
-                commute_time,
-                is_customized,
-                image_urls,
-                schedules,
-                listing_number
-            )
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            ON DUPLICATE KEY UPDATE
-                source_organization = VALUES(source_organization),
-                source_url = VALUES(source_url),
-                housing_type = "청년안심주택",
-                region = VALUES(region),
-                address_detail = VALUES(address_detail),
-                post_date = VALUES(post_date),
-                application_end_date = VALUES(application_end_date),
-                application_link = VALUES(application_link),
-                homepage_link = VALUES(homepage_link),
-                parsed_content = VALUES(parsed_content),
-                original_pdf_url = VALUES(original_pdf_url),
-                min_deposit = VALUES(min_deposit),
-                max_deposit = VALUES(max_deposit),
-                monthly_rent = VALUES(monthly_rent),
-                total_households = VALUES(total_households),
-                eligibility = VALUES(eligibility),
-                commute_base_address = VALUES(commute_base_address),
-                commute_time = VALUES(commute_time),
-                is_customized = VALUES(is_customized),
-                image_urls = VALUES(image_urls),
-                schedules = VALUES(schedules),
-                listing_number = VALUES(listing_number)
-        """
         params = (
             title,
             source_organization,
@@ -390,14 +561,143 @@ class MySQLAnnouncementsPipeline:
             image_urls_json,
             schedules_json,
             listing_number,
+            # HomepassScraperPipeline이 저장한 PDF (지문에 포함 → 같은 URL의 PDF가 바뀌어도 변경으로 감지)
+            self._sanitize_str(item.get("pdf_sha256")),
+            self._sanitize_str(item.get("pdf_path")),
+        )
+        # 내용 지문: parsed_content는 dict 상태로 키 정렬해 해시 (직렬화 순서에 영향받지 않도록)
+        content_hash = self._content_hash(params[:10] + (parsed_payload,) + params[11:])
+        params += (content_hash, datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S"))
+
+        # DB 쓰기는 모아서 별도 스레드에서 (reactor 스레드가 RDS 왕복을 기다리지 않도록)
+        self.buffer.append(
+            _PendingRow(params=params, listing_number=listing_number, title=title, content_hash=content_hash)
         )
+        if len(self.buffer) >= self.batch_size:
+            self._flush(spider)
+        return item
+
+    # ------------------------------------------------------------------ #
+    # 배치 쓰기 (DB 전용 스레드에서 실행)
+    # ------------------------------------------------------------------ #
+    def _flush(self, spider):
+        """버퍼를 비워 DB 스레드에 넘김. 스레드가 하나뿐이라 배치는 순서대로 실행됨"""
+        if not self.buffer:
+            return None
+        rows, self.buffer = self.buffer, []
+        deferred = deferToThreadPool(self.reactor, self.pool, self._write_batch, rows, spider)
+        deferred.addErrback(lambda failure: spider.logger.error(f"MySQL batch write crashed: {failure.value}"))
+        return deferred
 
+    def _write_batch(self, rows: List["_PendingRow"], spider) -> None:
+        try:
+            changed = self._drop_unchanged(rows, spider)
+            # 내용이 같아 쓰지 않은 공고도 DB에는 이미 있음
+            self._notify_written(spider, [row for row in rows if row not in changed])
+            rows = changed
+            if not rows:
+                return
+        except Exception as e:
+            # 지문 조회 실패 시에는 전부 쓰기 (변경 누락보다 중복 쓰기가 안전)
+            self.conn.rollback()
+            spider.logger.warning(f"MySQL content_hash lookup failed, writing all rows: {e}")
+        started = time.perf_counter()
         try:
-            affected = self.cur.execute(sql, params)
+            self.cur.executemany(self.upsert_sql, [row.params for row in rows])
+            self._enqueue_rows(rows)
             self.conn.commit()
-            spider.logger.info(f"MySQL upsert ok (affected={affected}) title='{title}' post_date='{post_date}'")
+            spider.logger.info(f"MySQL batch upsert ok (rows={len(rows)})")
+            self._notify_written(spider, rows)
         except Exception as e:
-            spider.logger.error(f"MySQL insert failed: {e} | item={item}")
             self.conn.rollback()
-            # 데이터 손실을 막기 위해 예외를 다시 던지지 않고 통과
-        return item
+            spider.logger.warning(f"MySQL batch upsert failed, retrying per item: {e} | rows={len(rows)}")
+            self._notify_written(spider, [row for row in rows if self._write_one(row, spider)])
+        finally:
+            # 지표 (homepass_scraper/metrics.py): 배치 크기 / upsert 소요 시간 (건별 재시도 포함)
+            stats = spider.crawler.stats
+            stats.inc_value("mysql/upsert_seconds", time.perf_counter() - started)
+            stats.inc_value("mysql/upsert_batches")
+            stats.inc_value("mysql/batch_rows", len(rows))
+            stats.max_value("mysql/batch_rows_max", len(rows))
+
+    def _drop_unchanged(self, rows: List["_PendingRow"], spider) -> List["_PendingRow"]:
+        """
+        저장된 content_hash와 같은 공고는 쓰지 않음 (upsert / 추출 큐 / content_changed_at 갱신 모두 생략)
+        """
+        existing: Dict[Any, Optional[str]] = {}
+        listing_numbers = sorted({row.listing_number for row in rows if row.listing_number is not None})
+        if listing_numbers:
+            placeholders = ", ".join(["%s"] * len(listing_numbers))
+            self.cur.execute(
+                f"SELECT listing_number, content_hash FROM {self.table} WHERE listing_number IN ({placeholders})",
+                listing_numbers,
+            )
+            existing.update((r["listing_number"], r["content_hash"]) for r in self.cur.fetchall())
+        titles = sorted({row.title for row in rows if row.listing_number is None})
+        if titles:
+            placeholders = ", ".join(["%s"] * len(titles))
+            self.cur.execute(
+                f"SELECT title, content_hash FROM {self.table} WHERE listing_number IS NULL AND title IN ({placeholders})",
+                titles,
+            )
+            existing.update((("title", r["title"]), r["content_hash"]) for r in self.cur.fetchall())
+        self.conn.commit()
+
+        changed = [
+            row
+            for row in rows
+            if existing.get(row.listing_number if row.listing_number is not None else ("title", row.title))
+            != row.content_hash
+        ]
+        unchanged = len(rows) - len(changed)
+        if unchanged:
+            spider.crawler.stats.inc_value("mysql/unchanged_skipped", unchanged)
+            spider.logger.info(f"MySQL skip unchanged rows={unchanged} (content_hash match)")
+        spider.crawler.stats.inc_value("mysql/changed_written", len(changed))
+        return changed
+
+    def _write_one(self, row: "_PendingRow", spider) -> bool:
+        try:
+            affected = self.cur.execute(self.upsert_sql, row.params)
+            # affected: 1=신규, 2=변경, 0=변경 없음 → 신규/변경 공고만 추출 큐에 등록 (같은 트랜잭션)
+            if affected:
+                announcement_id = self._resolve_announcement_id(row.listing_number, row.title, self.cur.lastrowid)
+                if announcement_id is not None:
+                    extraction_queue.enqueue(self.cur, announcement_id, row.listing_number)
+            self.conn.commit()
+            spider.logger.info(f"MySQL upsert ok (affected={affected}) title='{row.title}'")
+            return True
+        except Exception as e:
+            spider.logger.error(f"MySQL insert failed: {e} | title='{row.title}' listing_number={row.listing_number}")
+            self.conn.rollback()
+            # 데이터 손실을 막기 위해 예외를 다시 던지지 않고 통과 (스파이더는 이 번호를 다음 실행에서 다시 수집)
+            return False
+
+    def _notify_written(self, spider, rows: List["_PendingRow"]) -> None:
+        """커밋된 공고 번호를 reactor 스레드에서 알림 (SocoBoardSpider가 체크포인트 전진에 사용)"""
+        listing_numbers = [row.listing_number for row in rows if row.listing_number is not None]
+        if listing_numbers:
+            self.reactor.callFromThread(
+                spider.crawler.signals.send_catch_log,
+                signal=announcements_written,
+                listing_numbers=listing_numbers,
+            )
+
+    def _enqueue_rows(self, rows: List["_PendingRow"]) -> None:
+        """배치로 upsert한 공고의 announcement_id를 모아 추출 큐에 등록 (같은 트랜잭션)"""
+        listing_numbers = sorted({row.listing_number for row in rows if row.listing_number is not None})
+        targets: List[Tuple[int, Optional[int]]] = []
+        if listing_numbers:
+            placeholders = ", ".join(["%s"] * len(listing_numbers))
+            self.cur.execute(
+                f"SELECT MAX(announcement_id) AS announcement_id, listing_number FROM {self.table} "
+                f"WHERE listing_number IN ({placeholders}) GROUP BY listing_number",
+                listing_numbers,
+            )
+            targets.extend((r["announcement_id"], r["listing_number"]) for r in self.cur.fetchall())
+        for row in rows:
+            if row.listing_number is None:
+                announcement_id = self._resolve_announcement_id(None, row.title)
+                if announcement_id is not None:
+                    targets.append((announcement_id, None))
+        extraction_queue.enqueue_many(self.cur, targets)
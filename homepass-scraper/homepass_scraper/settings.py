@@ -7,6 +7,8 @@
 #     https://docs.scrapy.org/en/latest/topics/downloader-middleware.html
 #     https://docs.scrapy.org/en/latest/topics/spider-middleware.html
 
+from pathlib import Path
+
 BOT_NAME = "homepass_scraper"
 
 SPIDER_MODULES = ["homepass_scraper.spiders"]
@@ -88,15 +90,6 @@ AUTOTHROTTLE_ENABLED = False
 # Set settings whose default value is deprecated to a future-proof value
 FEED_EXPORT_ENCODING = "utf-8"
 
-# 1. 파일 파이프라인 활성화
-# ITEM_PIPELINES = {
-#    'scrapy.pipelines.files.FilesPipeline': 1,
-# }
-
-# 2. 파일 다운로드 폴더 지정 (예: 'downloads')
-#FILES_STORE = 'downloads'
-
-
 
 # (중요) Scrapy가 본인을 봇(bot)으로 밝히면 차단하는 사이트가 많습니다.
 # 일반 브라우저처럼 보이도록 User-Agent를 설정하는 것이 좋습니다.
@@ -104,7 +97,81 @@ USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTM
 
 # homepass_scraper/homepass_scraper/settings.py
 
+# MySQLAnnouncementsPipeline 배치 쓰기 (개수 또는 시간 조건 중 먼저 도달 시 기록)
+MYSQL_BATCH_SIZE = 50
+MYSQL_FLUSH_INTERVAL = 2.0  # 초
+
+# SOCO 목록 API 페이지 크기 (recordCountPerPage). 클수록 목록 요청 수가 줄어듦
+SOCO_LIST_PAGE_SIZE = 100
+
+# 수정 공고 재수집 범위: 체크포인트 이하 공고 중 최근 N건 또는 최근 D일 (0이면 해당 조건 사용 안 함)
+# 변경 없는 공고는 조건부 요청(304) / content_hash로 건너뛰고, 바뀐 공고만 추출 큐에 다시 등록
+SOCO_RECRAWL_LAST_N = 20
+SOCO_RECRAWL_DAYS = 14
+
+# 이어받기 상태 (homepass_scraper/crawl_state.py): 체크포인트는 연속으로 끝난 번호까지만 전진하고,
+# 중단된 실행에서 끝나지 않은 상세 요청은 다음 실행 시작 시 바로 재개
+SOCO_STATE_DIR = None  # None이면 JOBDIR, 그것도 없으면 homepass-scraper/.crawlstate
+SOCO_RESUME_MAX_ATTEMPTS = 3  # 이 횟수만큼 실행해도 끝나지 않는 공고는 포기하고 체크포인트 전진
+
+# 목록 제목(nttSj)에 아래 키워드 중 하나라도 있어야 상세 페이지를 요청 (빈 리스트면 필터 사용 안 함)
+SOCO_TITLE_KEYWORDS = ["공고", "청년안심주택"]
+
+# 조건부 요청 캐시 (ETag / Last-Modified, 상세 페이지 + new_extractor.py PDF 공유)
+# new_extractor.py는 같은 이름의 환경변수를 읽습니다.
+HTTP_COND_CACHE_ENABLED = True
+HTTP_COND_CACHE_DIR = None  # None이면 homepass-scraper/.httpcache
+HTTP_COND_CACHE_MAX_ENTRIES = 20000
+HTTP_COND_CACHE_MAX_MB = 512
+HTTP_COND_CACHE_MAX_AGE_DAYS = 30
+
+# 도메인별 적응형 동시성 / 재시도 (AdaptiveConcurrencyMiddleware)
+# CONCURRENT_REQUESTS_PER_DOMAIN / DOWNLOAD_DELAY는 시작값이고, 응답 지연시간과 오류율에 따라 아래 범위 안에서 자동 조정
+ADAPTIVE_CONCURRENCY_ENABLED = True
+ADAPTIVE_MIN_CONCURRENCY = 1
+ADAPTIVE_MAX_CONCURRENCY = 8
+ADAPTIVE_MIN_DELAY = 0.1  # 초
+ADAPTIVE_MAX_DELAY = 5.0
+ADAPTIVE_TARGET_LATENCY = 1.5  # 초. 평균 응답 시간이 이보다 길면 속도를 낮춤
+# 재시도: 5xx / 429 / 408 / 타임아웃·연결 오류를 지수 백오프(BASE × 2^n, 최대 MAX초) + 지터 후 재시도
+ADAPTIVE_RETRY_TIMES = 4
+ADAPTIVE_RETRY_HTTP_CODES = [500, 502, 503, 504, 522, 524, 408, 429]
+ADAPTIVE_BACKOFF_BASE = 1.0
+ADAPTIVE_BACKOFF_MAX = 60.0
+# 최근 WINDOW개 응답 중 오류 비율이 PAUSE_ERROR_RATE 이상이면 PAUSE_SECONDS 동안 해당 도메인 요청 중지
+ADAPTIVE_WINDOW = 30
+ADAPTIVE_PAUSE_ERROR_RATE = 0.5
+ADAPTIVE_PAUSE_SECONDS = 60
+
+DOWNLOADER_MIDDLEWARES = {
+   'homepass_scraper.middlewares.ConditionalRequestMiddleware': 543,
+   # RetryMiddleware(550)보다 먼저 응답을 받아 재시도 (끄면 RetryMiddleware가 기존대로 재시도)
+   'homepass_scraper.middlewares.AdaptiveConcurrencyMiddleware': 560,
+}
+
+# 수집 지표 (Prometheus 텍스트 형식, homepass_scraper/metrics.py)
+# METRICS_DIR/homepass_crawl.prom 파일을 주기적으로 갱신 → 백엔드 GET /announcements/scrape/metrics 가 그대로 전달
+METRICS_ENABLED = True
+METRICS_DIR = None  # None이면 homepass-scraper/.metrics
+METRICS_INTERVAL = 15.0  # 초
+METRICS_HTTP_HOST = "127.0.0.1"
+METRICS_HTTP_PORT = 0  # 0이 아니면 http://HOST:PORT/metrics 로도 제공 (스크래퍼가 다른 호스트에서 실행될 때)
+
+EXTENSIONS = {
+   'homepass_scraper.metrics.CrawlMetrics': 500,
+}
+
+SPIDER_MIDDLEWARES = {
+   # 콜백별 파싱 시간: 스파이더에 가장 가깝게 (기본 미들웨어 중 가장 큰 번호는 DepthMiddleware 900)
+   'homepass_scraper.metrics.CallbackTimingMiddleware': 950,
+}
+
+# 공고 PDF를 수집 중에 받아 내용 주소(sha256) 저장소에 보관 (new_extractor.py는 PDF_STORE_DIR로 같은 위치를 읽음)
+FILES_STORE = str(Path(__file__).resolve().parents[1] / "downloads")
+FILES_EXPIRES = 7  # 일. 이 기간 안에 받은 PDF URL은 다시 받지 않음
+
 ITEM_PIPELINES = {
+   'homepass_scraper.pipelines.HomepassScraperPipeline': 300,
    'homepass_scraper.pipelines.MySQLAnnouncementsPipeline': 500,
 }
 
@@ -3,24 +3,129 @@ from __future__ import annotations
 import os
 import json
 import re
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Iterable, List, Optional
 
 import pymysql
+from lxml import etree
 
 import scrapy
-from scrapy import FormRequest, Request
+from scrapy import FormRequest, Request, signals
 from scrapy.spiders import Spider
 
+from homepass_scraper.crawl_state import DEFAULT_STATE_DIR, CrawlState, announcements_written
+
+
+def _has_class(name: str) -> str:
+    return f'contains(concat(" ", normalize-space(@class), " "), " {name} ")'
+
+
+# 상세 페이지 파싱용 XPath / 정규식 (모듈 로드 시 한 번만 컴파일)
+_XP_BOARD_CONT = etree.XPath(f"//div[{_has_class('board_cont')}]")
+_XP_VIEW_DATA = etree.XPath(f"//ul[{_has_class('view_data')}]")
+_XP_PDF_HREF = etree.XPath(f'.//span[{_has_class("file")}]//a[contains(@href, "fileDown.do")]/@href')
+_XP_TH = etree.XPath("//th")
+_XP_TH_VALUE = etree.XPath("following-sibling::td[1]//text()")
+_XP_LINK_PARAGRAPHS = etree.XPath("//p[.//a[@href]]")
+_XP_FIRST_HREF = etree.XPath(".//a/@href")
+_XP_OG_TITLE = etree.XPath('//meta[@property="og:title"]/@content')
+_XP_TITLE = etree.XPath("//title/text()")
+_XP_BODY_TEXT = etree.XPath("//body//*/text()")
+_XP_STRING = etree.XPath("string()")
+_XP_TEXT_NODES = etree.XPath(".//text()")
+
+_RE_SPACES = re.compile(r"\s+")
+_RE_DEPARTMENT = re.compile(r"(담당부서|담당자)\s*[:：]\s*([^\s]+)")
+
+
+class DetailPage:
+    """
+    SOCO 상세 페이지 한 번 훑기
+
+    본문(div.board_cont), 첨부(ul.view_data), 표(th → td), 링크 문단만 한 번씩 읽어 두고,
+    목록 행에 값이 없을 때만 쓰는 fallback(제목, 담당부서)은 호출될 때 계산합니다.
+    """
+
+    def __init__(self, response: scrapy.http.Response):
+        self.response = response
+        self.root = response.selector.root
+
+        board = _XP_BOARD_CONT(self.root)
+        self.board = board[0] if board else None
+        board_text = _XP_STRING(self.board) if self.board is not None else None
+        self.board_content_text = (_RE_SPACES.sub(" ", board_text).strip() or None) if board_text else None
+
+        self.pdf_link: Optional[str] = None
+        self.view_data = _XP_VIEW_DATA(self.root)
+        for view_data in self.view_data:
+            if self.pdf_link is None:
+                hrefs = _XP_PDF_HREF(view_data)
+                if hrefs:
+                    self.pdf_link = response.urljoin(hrefs[0])
+
+        # (th 텍스트, td 텍스트) 문서 순서대로
+        self.table: List[tuple] = []
+        for th in _XP_TH(self.root):
+            label = _RE_SPACES.sub(" ", _XP_STRING(th)).strip()
+            value = " ".join(t.strip() for t in _XP_TH_VALUE(th) if t.strip())
+            self.table.append((label, value))
+
+        self.link_paragraphs = [(_XP_STRING(p), p) for p in _XP_LINK_PARAGRAPHS(self.root)]
+
+    def table_value(self, label: str) -> Optional[str]:
+        for th_text, value in self.table:
+            if label in th_text:
+                return value or None
+        return None
+
+    def link_after(self, label: str) -> Optional[str]:
+        """label 문구가 있는 문단의 첫 링크 (예: "청약신청 페이지")"""
+        for text, paragraph in self.link_paragraphs:
+            if label in text:
+                hrefs = _XP_FIRST_HREF(paragraph)
+                return self.response.urljoin(hrefs[0]) if hrefs else None
+        return None
+
+    # -------------------------------------------------------------- #
+    # Fallbacks (목록 행에 값이 없을 때만)
+    # -------------------------------------------------------------- #
+    def title(self) -> str:
+        for title in _XP_OG_TITLE(self.root) or _XP_TITLE(self.root):
+            if title.strip():
+                return title.strip()
+        return self.response.url
+
+    def _scoped_text(self) -> str:
+        # string()은 인접한 텍스트 노드를 구분자 없이 붙이므로 (<span>주택정책과</span><span>02-...</span>)
+        # 정규식 검색용 텍스트는 텍스트 노드를 공백으로 이어 붙임
+        nodes = ([self.board] if self.board is not None else []) + list(self.view_data)
+        texts = [text for node in nodes for text in _XP_TEXT_NODES(node)]
+        return " ".join(texts + [f"{label} {value}" for label, value in self.table])
+
+    def department(self) -> Optional[str]:
+        # 본문 / 첨부 / 표에서 먼저 찾고, 없을 때만 페이지 전체 텍스트
+        match = _RE_DEPARTMENT.search(self._scoped_text())
+        if not match:
+            match = _RE_DEPARTMENT.search(" ".join(_XP_BODY_TEXT(self.root)))
+        return match.group(2).strip() if match else None
+
 
 class SocoBoardSpider(Spider):
     """
     Scrapes the SOCO 청년안심주택 모집공고 게시판.
 
     - Fetches list pages (same JSON API as the website)
+      page 1 first, then every page down to the checkpoint concurrently
     - Extracts the visible "번호" (td) value
-    - Stops when the number is less than or equal to the saved checkpoint
+    - Skips posts whose list title (nttSj) has none of SOCO_TITLE_KEYWORDS before the detail request
+    - Stops when the number is less than or equal to the saved checkpoint,
+      after re-visiting the re-crawl window (last N posts / last D days) to pick up edits.
+      Re-crawled detail pages are conditional requests; unchanged posts are skipped
+      by a 304 here or by the content hash in MySQLAnnouncementsPipeline.
+    - Resumable: the checkpoint only advances past a contiguous run of completed numbers
+      (homepass_scraper/crawl_state.py). Detail requests left unfinished by an interrupted run
+      are re-issued at start, and numbers already completed are not fetched again.
     """
 
     name = "soco_board_spider"
@@ -29,11 +134,22 @@ class SocoBoardSpider(Spider):
     # 이 스파이더는 무조건 청년안심주택 공고만 수집
     HOUSING_TYPE = "청년안심주택"
 
+    # 시작값. 이후 AdaptiveConcurrencyMiddleware가 응답 지연시간 / 오류율에 따라 조정 (ADAPTIVE_* 설정)
     custom_settings = {
         "DOWNLOAD_DELAY": 0.4,
-        "CONCURRENT_REQUESTS": 2,
+        "CONCURRENT_REQUESTS_PER_DOMAIN": 2,
     }
 
+    # 목록 API가 허용하는 최대 페이지 크기 (recordCountPerPage). SOCO_LIST_PAGE_SIZE 또는 -a page_size=로 변경
+    DEFAULT_LIST_PAGE_SIZE = 100
+    # 체크포인트 이하 공고 중 다시 확인할 범위 (최근 N건 또는 최근 D일). SOCO_RECRAWL_LAST_N / SOCO_RECRAWL_DAYS
+    DEFAULT_RECRAWL_LAST_N = 20
+    DEFAULT_RECRAWL_DAYS = 14
+    # 목록 제목(nttSj)에 이 중 하나가 있어야 상세 페이지 요청. SOCO_TITLE_KEYWORDS 또는 -a title_keywords=공고,청년안심주택
+    DEFAULT_TITLE_KEYWORDS = ("공고", "청년안심주택")
+    # 끝나지 않은 상세 요청을 다시 시도할 실행 횟수 (넘으면 포기하고 체크포인트 전진). SOCO_RESUME_MAX_ATTEMPTS
+    DEFAULT_RESUME_MAX_ATTEMPTS = 3
+
     list_url = "https://soco.seoul.go.kr/youth/pgm/home/yohome/bbsListJson.json"
     detail_url = "https://soco.seoul.go.kr/youth/bbs/BMSR00015/view.do?menuNo=400008&boardId={board_id}"
 
@@ -45,6 +161,10 @@ class SocoBoardSpider(Spider):
         db_user: str | None = None,
         db_password: str | None = None,
         db_name: str | None = None,
+        page_size: int | str | None = None,
+        recrawl_last: int | str | None = None,
+        recrawl_days: int | str | None = None,
+        title_keywords: str | None = None,
         *args,
         **kwargs,
     ):
@@ -60,6 +180,18 @@ class SocoBoardSpider(Spider):
         self.db_password = db_password or os.environ.get("DB_PASSWORD", "century20!")
         self.db_name = db_name or os.environ.get("DB_NAME", "century20")
 
+        self.page_size = int(page_size) if page_size else None
+        self.recrawl_last = int(recrawl_last) if recrawl_last not in (None, "") else None
+        self.recrawl_days = int(recrawl_days) if recrawl_days not in (None, "") else None
+        self.recrawl_since: datetime | None = None
+        self.title_keywords: List[str] | None = (
+            [k.strip() for k in title_keywords.split(",") if k.strip()] if title_keywords is not None else None
+        )
+        self.last_list_page = 1
+        self.state: CrawlState | None = None
+        # 이번 실행에서 이미 상세 요청을 보낸 번호 (이어받은 요청과 목록에서 찾은 요청 중복 방지)
+        self.scheduled_numbers: set[int] = set()
+
         self.last_scraped_no = self._load_checkpoint()
         self.current_max_no = self.last_scraped_no
         self.logger.info("Loaded last scraped number: %s", self.last_scraped_no)
@@ -67,6 +199,17 @@ class SocoBoardSpider(Spider):
     # ------------------------------------------------------------------ #
     # Lifecycle
     # ------------------------------------------------------------------ #
+    @classmethod
+    def from_crawler(cls, crawler, *args, **kwargs):
+        spider = super().from_crawler(crawler, *args, **kwargs)
+        pipelines = crawler.settings.getdict("ITEM_PIPELINES")
+        if pipelines.get("homepass_scraper.pipelines.MySQLAnnouncementsPipeline") is not None:
+            # DB에 커밋된 뒤에 완료 처리 (배치 버퍼에 있던 공고가 중단으로 사라지지 않도록)
+            crawler.signals.connect(spider._announcements_written, signal=announcements_written)
+        else:
+            crawler.signals.connect(spider._item_scraped, signal=signals.item_scraped)
+        return spider
+
     def _load_checkpoint(self) -> int:
         db_value = self._fetch_latest_listing_number()
         if db_value is not None:
@@ -107,12 +250,73 @@ class SocoBoardSpider(Spider):
         return None
 
     def start_requests(self) -> Iterable[FormRequest]:
+        self._apply_settings()
+        self._open_state()
+        yield from self._resume_pending()
         yield self._build_list_request(page=1)
 
+    def _open_state(self) -> None:
+        """
+        이어받기 상태 열기 (SOCO_STATE_DIR 또는 JOBDIR, 기본 homepass-scraper/.crawlstate)
+
+        상태에 연속 체크포인트가 있으면 그 값이 기준 (DB의 최대 listing_number는 중간 번호가 빠져 있어도 앞서 있을 수 있음)
+        """
+        state_dir = self.settings.get("SOCO_STATE_DIR") or self.settings.get("JOBDIR")
+        state_path = (Path(state_dir) if state_dir else DEFAULT_STATE_DIR) / f"{self.name}.sqlite3"
+        self.state = CrawlState(
+            state_path,
+            max_attempts=self.settings.getint("SOCO_RESUME_MAX_ATTEMPTS", self.DEFAULT_RESUME_MAX_ATTEMPTS),
+        )
+        if self.state.checkpoint is None:
+            self.state.initialize(self.last_scraped_no)
+        elif self.state.checkpoint != self.last_scraped_no:
+            self.logger.info(
+                "Using contiguous checkpoint %s from %s (latest stored: %s)",
+                self.state.checkpoint,
+                state_path,
+                self.last_scraped_no,
+            )
+            self.last_scraped_no = self.current_max_no = self.state.checkpoint
+        self.crawler.stats.set_value("soco/checkpoint_start", self.last_scraped_no)
+        self.crawler.stats.set_value("soco/current_max_no", self.current_max_no)
+        self.crawler.stats.set_value("soco/checkpoint_contiguous", self.state.checkpoint)
+
+    def _resume_pending(self) -> Iterable[Request]:
+        """중단된 이전 실행에서 끝나지 않은 상세 요청을 목록을 다시 받지 않고 재개"""
+        pending = self.state.pending()
+        if pending:
+            self.logger.info("Resuming %s unfinished detail requests from the previous run", len(pending))
+        for number, board_id, row, _ in pending:
+            request = self._detail_request(number, board_id, row, recrawl=False)
+            if request is not None:
+                self.crawler.stats.inc_value("soco/detail_resumed")
+                yield request
+
+    def _apply_settings(self) -> None:
+        """스파이더 인자(-a)가 없으면 프로젝트 설정값 사용"""
+        if self.page_size is None:
+            self.page_size = self.settings.getint("SOCO_LIST_PAGE_SIZE", self.DEFAULT_LIST_PAGE_SIZE)
+        if self.recrawl_last is None:
+            self.recrawl_last = self.settings.getint("SOCO_RECRAWL_LAST_N", self.DEFAULT_RECRAWL_LAST_N)
+        if self.recrawl_days is None:
+            self.recrawl_days = self.settings.getint("SOCO_RECRAWL_DAYS", self.DEFAULT_RECRAWL_DAYS)
+        if self.title_keywords is None:
+            self.title_keywords = self.settings.getlist("SOCO_TITLE_KEYWORDS", list(self.DEFAULT_TITLE_KEYWORDS))
+        if self.recrawl_days > 0:
+            today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+            self.recrawl_since = today - timedelta(days=self.recrawl_days)
+        self.logger.info(
+            "Re-crawl window: last %s posts or last %s days (since %s)",
+            self.recrawl_last,
+            self.recrawl_days,
+            self.recrawl_since.date() if self.recrawl_since else None,
+        )
+
     def _build_list_request(self, page: int) -> FormRequest:
         formdata = {
             "bbsId": "BMSR00015",
             "pageIndex": str(page),
+            "recordCountPerPage": str(self.page_size),
             "searchAdresGu": "",
             "searchCondition": "",
             "searchKeyword": "",
@@ -142,69 +346,179 @@ class SocoBoardSpider(Spider):
             number = tot_row - row_start - idx
             board_id = row.get("boardId")
 
-            if number <= self.last_scraped_no:
+            recrawl = number <= self.last_scraped_no
+            if recrawl and not self._in_recrawl_window(number, row):
                 self.logger.info(
-                    "Reached previously scraped number (current: %s, checkpoint: %s). Stopping.",
+                    "Reached end of re-crawl window (current: %s, checkpoint: %s). Stopping.",
                     number,
                     self.last_scraped_no,
                 )
                 stop_crawling = True
                 break
 
-            self.current_max_no = max(self.current_max_no, number)
-            detail_url = self.detail_url.format(board_id=board_id)
-
-            yield Request(
-                url=detail_url,
-                callback=self.parse_detail,
-                cb_kwargs={
-                    "board_id": board_id,
-                    "list_number": number,
-                    "row": row,
-                },
-            )
+            if not recrawl:
+                self.current_max_no = max(self.current_max_no, number)
+                self.crawler.stats.max_value("soco/current_max_no", number)
+                if number in self.scheduled_numbers or self.state.is_done(number):
+                    # 이어받은 요청으로 이미 보냈거나, 중단된 이전 실행에서 이미 끝난 번호
+                    self.crawler.stats.inc_value("soco/detail_already_done")
+                    continue
+
+            title = (row.get("nttSj") or "").strip()
+            if not self._title_allowed(title):
+                self.crawler.stats.inc_value("soco/list_filtered")
+                self.logger.debug("Skip detail request: title has none of %s | title='%s'", self.title_keywords, title)
+                # 걸러낸 글도 완료 처리 (체크포인트가 이 번호에서 멈추지 않도록)
+                self._complete(number)
+                continue
 
-        if not stop_crawling:
-            page_index = int(paging.get("pageIndex", page))
-            tot_page = int(paging.get("totPage", page))
-            if page_index < tot_page:
-                yield self._build_list_request(page=page_index + 1)
+            request = self._detail_request(number, board_id, row, recrawl)
+            if request is not None:
+                self.crawler.stats.inc_value("soco/list_fetched")
+                self.crawler.stats.inc_value("soco/detail_recrawl" if recrawl else "soco/detail_new")
+                yield request
 
-    # ------------------------------------------------------------------ #
-    # Detail parsing helpers
-    # ------------------------------------------------------------------ #
-    def _extract_title(self, response: scrapy.http.Response) -> str:
-        title = response.css('meta[property="og:title"]::attr(content)').get()
-        if title:
-            return title.strip()
-        title = response.css("title::text").get()
-        return title.strip() if title else response.url
-
-    def _extract_department(self, response: scrapy.http.Response) -> str | None:
-        text = " ".join(response.css("body *::text").getall())
-        match = re.search(r"(담당부서|담당자)\s*[:：]\s*([^\s]+)", text)
-        return match.group(2).strip() if match else None
+        if page == 1 and not stop_crawling:
+            yield from self._schedule_remaining_pages(paging, len(result_list))
+        if not stop_crawling and page == self.last_list_page:
+            # 날짜 기준 재수집 범위가 예상한 페이지보다 길거나, 수집 중 새 글이 올라와 번호가 밀린 경우
+            tot_page = int(paging.get("totPage", page))
+            if page < tot_page:
+                self.last_list_page = page + 1
+                yield self._build_list_request(page=page + 1)
+
+    def _detail_request(self, number: int, board_id, row: dict, recrawl: bool) -> Request | None:
+        """
+        상세 요청. 새 공고는 끝날 때까지 이어받기 상태에 기록 (완료: DB 커밋 / 304 / 상세 필터)
+        """
+        if not recrawl:
+            attempts = self.state.add_pending(number, board_id, row)
+            if attempts > self.state.max_attempts:
+                self.logger.warning(
+                    "Giving up on listing %s (boardId=%s) after %s runs; advancing the checkpoint past it",
+                    number,
+                    board_id,
+                    attempts - 1,
+                )
+                self.crawler.stats.inc_value("soco/detail_given_up")
+                self._complete(number)
+                return None
+        self.scheduled_numbers.add(number)
+        return Request(
+            url=self.detail_url.format(board_id=board_id),
+            callback=self.parse_detail,
+            errback=self._detail_failed,
+            # 재수집만 조건부 요청 (새 공고는 이전 실행에서 저장에 실패했을 수 있으므로 항상 파싱)
+            meta={"conditional": recrawl},
+            cb_kwargs={
+                "board_id": board_id,
+                "list_number": number,
+                "row": row,
+            },
+        )
 
-    def _extract_date(self, response: scrapy.http.Response) -> datetime | None:
-        text = response.text
-        match = re.search(r"(\d{4})[.\-](\d{2})[.\-](\d{2})", text)
-        if not match:
-            return None
-        year, month, day = map(int, match.groups())
+    def _detail_failed(self, failure):
+        # 재시도까지 실패: 상태에 남겨 두고 다음 실행에서 재개 (체크포인트는 이 번호 앞에서 멈춤)
+        self.crawler.stats.inc_value("soco/detail_failed")
+        self.logger.warning("Detail request failed, will resume next run: %s (%s)", failure.request.url, failure.value)
+
+    def _complete(self, number: int | None) -> None:
+        if number is None or self.state is None:
+            return
+        if self.state.complete(number):
+            self.crawler.stats.set_value("soco/checkpoint_contiguous", self.state.checkpoint)
+
+    def _announcements_written(self, listing_numbers):
+        for number in listing_numbers:
+            self._complete(number)
+
+    def _item_scraped(self, item, response, spider):
+        self._complete(item.get("listing_number"))
+
+    def _title_allowed(self, title: str) -> bool:
+        # 키워드를 비워 두면 필터 사용 안 함. 목록에 제목이 없으면 상세 페이지에서 확인해야 하므로 통과
+        if not self.title_keywords or not title:
+            return True
+        return any(keyword in title for keyword in self.title_keywords)
+
+    def _in_recrawl_window(self, number: int, row: dict) -> bool:
+        if number > self.last_scraped_no - (self.recrawl_last or 0):
+            return True
+        if self.recrawl_since is None:
+            return False
+        posted = self._clean_date(row.get("ntceBgnde"))
         try:
-            return datetime(year, month, day)
+            return posted is not None and datetime.strptime(posted, "%Y-%m-%d") >= self.recrawl_since
         except ValueError:
-            return None
+            return False
 
+    def _schedule_remaining_pages(self, paging: dict, first_page_rows: int):
+        """
+        1페이지 응답의 pagingInfo로 체크포인트까지 필요한 페이지 수를 계산해 한 번에 요청
+        (이전 페이지 파싱을 기다리지 않으므로 목록 응답 지연이 겹쳐짐)
+        """
+        tot_row = int(paging.get("totRow", 0))
+        tot_page = int(paging.get("totPage", 1))
+        # 서버가 요청한 크기를 무시하고 더 작은 페이지를 줄 수 있으므로 응답 기준으로 계산
+        per_page = int(paging.get("recordCountPerPage") or first_page_rows or self.page_size)
+        if per_page <= 0:
+            return
+
+        # 번호 lowest(체크포인트 - 재수집 건수, 수집 종료 지점)가 들어 있는 페이지까지
+        # 날짜 기준 범위는 미리 알 수 없으므로 마지막 페이지에서 이어서 요청 (parse_list)
+        lowest = max(0, self.last_scraped_no - (self.recrawl_last or 0))
+        needed = -(-(tot_row - lowest + 1) // per_page)
+        last_page = min(tot_page, max(1, needed))
+        self.last_list_page = last_page
+        self.crawler.stats.set_value("soco/list_pages", last_page)
+        if last_page > 1:
+            self.logger.info(
+                "Scheduling list pages 2..%s concurrently (%s rows per page, checkpoint: %s, re-crawl from: %s)",
+                last_page,
+                per_page,
+                self.last_scraped_no,
+                lowest,
+            )
+        for next_page in range(2, last_page + 1):
+            yield self._build_list_request(page=next_page)
+
+    # ------------------------------------------------------------------ #
+    # Detail parsing
+    # ------------------------------------------------------------------ #
     def parse_detail(self, response: scrapy.http.Response, board_id: int, list_number: int, row: dict):
-        title = row.get("nttSj") or self._extract_title(response)
-        department = row.get("optn3") or self._extract_department(response)
+        if response.status == 304:
+            # 지난 수집 이후 변경 없음 (ConditionalRequestMiddleware) → 파싱/저장 생략
+            self.crawler.stats.inc_value("soco/detail_not_modified")
+            self._complete(list_number)
+            return
+
+        item = self._build_item(response, board_id, list_number, row)
+        if item is None:
+            # 목록에 제목이 없던 글은 상세 페이지 제목으로 다시 확인
+            self.crawler.stats.inc_value("soco/detail_filtered")
+            self._complete(list_number)
+            return
+        yield item
+
+    def _build_item(self, response: scrapy.http.Response, board_id: int, list_number: int, row: dict) -> dict | None:
+        """
+        상세 페이지 → item
 
-        post_date_text = row.get("ntceBgnde") or self._extract_table_value(response, "공고게시일")
-        apply_date_text = row.get("optn4") or self._extract_table_value(response, "청약신청일")
+        페이지는 DetailPage로 한 번만 훑고, 목록 행(row)에 이미 있는 값의 fallback
+        (제목 / 담당부서 / 날짜 / 카테고리)은 값이 없을 때만 계산합니다.
+        """
+        page = DetailPage(response)
+
+        title = row.get("nttSj") or page.title()
+        if not row.get("nttSj") and not self._title_allowed(title.strip()):
+            return None
+        department = row.get("optn3") or page.department()
 
-        category_text = self._build_category_label(row) or self._extract_table_value(response, "카테고리")
-        board_content_text = self._extract_board_content_text(response)
+        post_date_text = row.get("ntceBgnde") or page.table_value("공고게시일")
+        apply_date_text = row.get("optn4") or page.table_value("청약신청일")
+
+        category_text = self._build_category_label(row) or page.table_value("카테고리")
+        board_content_text = page.board_content_text
 
         item = {
             "title": title,
@@ -214,9 +528,9 @@ class SocoBoardSpider(Spider):
             "location": "",
             "post_date": self._clean_date(post_date_text),
             "apply_date": self._clean_date(apply_date_text),
-            "application_link": self._extract_application_link(response),
-            "homepage_link": self._extract_homepage_link(response),
-            "original_pdf_url": self._extract_pdf_link(response),
+            "application_link": page.link_after("청약신청 페이지"),
+            "homepage_link": page.link_after("단지 홈페이지"),
+            "original_pdf_url": page.pdf_link,
             "intro_text": None,
             "complex_name": None,
             "supply_info": None,
@@ -227,7 +541,7 @@ class SocoBoardSpider(Spider):
         }
         if board_content_text:
             item["parsed_content"] = {"board_content_text": board_content_text}
-        yield item
+        return item
 
     def _clean_date(self, value: Optional[str]) -> Optional[str]:
         if not value:
@@ -240,12 +554,6 @@ class SocoBoardSpider(Spider):
                 continue
         return value
 
-    def _extract_table_value(self, response: scrapy.http.Response, label: str) -> Optional[str]:
-        xpath = f'//th[contains(normalize-space(), "{label}")]/following-sibling::td[1]//text()'
-        texts = response.xpath(xpath).getall()
-        cleaned = " ".join(t.strip() for t in texts if t.strip())
-        return cleaned or None
-
     def _build_category_label(self, row: dict) -> Optional[str]:
         labels: List[str] = []
         type_map = {"1": "공공", "2": "민간"}
@@ -260,35 +568,28 @@ class SocoBoardSpider(Spider):
             labels.append(row.get("optn2Nm"))
         return " ".join(labels) if labels else None
 
-    def _extract_application_link(self, response: scrapy.http.Response) -> Optional[str]:
-        link = response.xpath('//p[contains(., "청약신청 페이지")]//a/@href').get()
-        return response.urljoin(link) if link else None
-
-    def _extract_homepage_link(self, response: scrapy.http.Response) -> Optional[str]:
-        link = response.xpath('//p[contains(., "단지 홈페이지")]//a/@href').get()
-        return response.urljoin(link) if link else None
-
-    def _extract_pdf_link(self, response: scrapy.http.Response) -> Optional[str]:
-        href = response.css('ul.view_data span.file a[href*="fileDown.do"]::attr(href)').get()
-        return response.urljoin(href) if href else None
-
-    def _extract_board_content_text(self, response: scrapy.http.Response) -> Optional[str]:
-        node = response.css("div.board_cont")
-        if not node:
-            return None
-        text = node.xpath("string()").get()
-        if not text:
-            return None
-        cleaned = re.sub(r"\s+", " ", text).strip()
-        return cleaned or None
-
     # ------------------------------------------------------------------ #
     # Shutdown
     # ------------------------------------------------------------------ #
     def closed(self, reason: str):
+        if self.state is None:
+            return
+        # 연속으로 끝난 번호까지만 저장 (중간에 끊긴 수집이 앞 번호를 건너뛰지 않도록)
+        checkpoint = self.state.checkpoint
+        pending = len(self.state.pending())
+        self.state.close()
+        if pending:
+            self.logger.warning(
+                "%s detail requests unfinished (reason: %s); checkpoint held at %s (highest seen: %s)",
+                pending,
+                reason,
+                checkpoint,
+                self.current_max_no,
+            )
         try:
-            self.checkpoint_path.write_text(str(self.current_max_no))
-            self.logger.info("Saved checkpoint %s to %s", self.current_max_no, self.checkpoint_path)
+            self.checkpoint_path.write_text(str(checkpoint))
+            self.crawler.stats.set_value("soco/checkpoint_saved", checkpoint)
+            self.logger.info("Saved checkpoint %s to %s", checkpoint, self.checkpoint_path)
         except OSError as exc:
             self.logger.error("Failed to save checkpoint: %s", exc)
 
@@ -0,0 +1,166 @@
+# homepass_scraper/homepass_scraper/storage.py
+"""
+PDF 원격 저장소 백엔드 (PdfStore가 사용)
+
+스파이더와 new_extractor.py가 같은 PDF 모음을 공유하기 위한 저장소입니다.
+PdfStore의 로컬 디렉터리는 캐시이고, 여기의 백엔드가 여러 호스트가 함께 보는 원본입니다.
+
+- LocalStorage: 공유 디렉터리 (NFS 등 마운트 경로)
+- S3Storage: S3 호환 저장소 (AWS S3, MinIO 등. S3_ENDPOINT_URL로 지정)
+  업로드/다운로드는 파일 단위 스트리밍 + 멀티파트 (메모리에 전체 본문을 올리지 않음)
+
+환경변수:
+    PDF_STORE_BACKEND        none(기본) | local | s3
+    PDF_STORE_SHARED_DIR     local 백엔드 경로
+    S3_BUCKET / S3_PREFIX / S3_ENDPOINT_URL / AWS_REGION
+    PDF_STORE_MULTIPART_MB   멀티파트 조각 크기 (기본 8MB)
+    PDF_STORE_PART_CONCURRENCY  파일 하나의 조각 동시 전송 수 (기본 4)
+"""
+
+import os
+import shutil
+from pathlib import Path
+from typing import Optional
+
+
+class StorageBackend:
+    """키(예: sha256/ab/<hash>.pdf) 단위로 파일을 올리고 받는 최소 인터페이스"""
+
+    name = "base"
+
+    def exists(self, key: str) -> bool:
+        raise NotImplementedError
+
+    def upload_file(self, key: str, path: Path) -> None:
+        raise NotImplementedError
+
+    def download_file(self, key: str, dest: Path) -> bool:
+        """dest에 저장. 키가 없으면 False"""
+        raise NotImplementedError
+
+    def describe(self) -> str:
+        return self.name
+
+
+class LocalStorage(StorageBackend):
+    name = "local"
+
+    def __init__(self, root: str):
+        self.root = Path(root).expanduser().resolve()
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        return self.root.joinpath(*key.split("/"))
+
+    def exists(self, key: str) -> bool:
+        return self._path(key).is_file()
+
+    def upload_file(self, key: str, path: Path) -> None:
+        target = self._path(key)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+        shutil.copyfile(path, tmp)
+        os.replace(tmp, target)
+
+    def download_file(self, key: str, dest: Path) -> bool:
+        source = self._path(key)
+        if not source.is_file():
+            return False
+        shutil.copyfile(source, dest)
+        return True
+
+    def describe(self) -> str:
+        return f"local:{self.root}"
+
+
+class S3Storage(StorageBackend):
+    name = "s3"
+
+    def __init__(
+        self,
+        bucket: str,
+        prefix: str = "pdfs/",
+        endpoint_url: Optional[str] = None,
+        region: Optional[str] = None,
+        multipart_chunk_bytes: int = 8 * 1024 * 1024,
+        part_concurrency: int = 4,
+    ):
+        # boto3는 S3 백엔드를 쓸 때만 필요
+        import boto3
+        from boto3.s3.transfer import TransferConfig
+        from botocore.config import Config
+
+        self.bucket = bucket
+        self.prefix = prefix if not prefix or prefix.endswith("/") else prefix + "/"
+        self.endpoint_url = endpoint_url
+        self.client = boto3.client(
+            "s3",
+            endpoint_url=endpoint_url or None,
+            region_name=region or None,
+            # 업로드 스레드(PdfStore) × 조각 동시 전송 수만큼 연결이 필요
+            config=Config(max_pool_connections=max(10, part_concurrency * 4)),
+        )
+        self.transfer_config = TransferConfig(
+            multipart_threshold=multipart_chunk_bytes,
+            multipart_chunksize=multipart_chunk_bytes,
+            max_concurrency=max(1, part_concurrency),
+            use_threads=part_concurrency > 1,
+        )
+
+    def _key(self, key: str) -> str:
+        return f"{self.prefix}{key}"
+
+    def exists(self, key: str) -> bool:
+        from botocore.exceptions import ClientError
+
+        try:
+            self.client.head_object(Bucket=self.bucket, Key=self._key(key))
+            return True
+        except ClientError as exc:
+            if exc.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+                return False
+            raise
+
+    def upload_file(self, key: str, path: Path) -> None:
+        self.client.upload_file(
+            str(path),
+            self.bucket,
+            self._key(key),
+            ExtraArgs={"ContentType": "application/pdf"},
+            Config=self.transfer_config,
+        )
+
+    def download_file(self, key: str, dest: Path) -> bool:
+        if not self.exists(key):
+            return False
+        self.client.download_file(self.bucket, self._key(key), str(dest), Config=self.transfer_config)
+        return True
+
+    def describe(self) -> str:
+        endpoint = f" ({self.endpoint_url})" if self.endpoint_url else ""
+        return f"s3://{self.bucket}/{self.prefix}{endpoint}"
+
+
+def storage_from_env() -> Optional[StorageBackend]:
+    """PDF_STORE_BACKEND 환경변수로 원격 백엔드 생성 (none이면 None → 로컬 디렉터리만 사용)"""
+    backend = (os.getenv("PDF_STORE_BACKEND") or "none").strip().lower()
+    if backend in ("", "none"):
+        return None
+    if backend == "local":
+        shared_dir = os.getenv("PDF_STORE_SHARED_DIR")
+        if not shared_dir:
+            raise ValueError("PDF_STORE_BACKEND=local 에는 PDF_STORE_SHARED_DIR가 필요합니다.")
+        return LocalStorage(shared_dir)
+    if backend == "s3":
+        bucket = os.getenv("S3_BUCKET")
+        if not bucket:
+            raise ValueError("PDF_STORE_BACKEND=s3 에는 S3_BUCKET이 필요합니다.")
+        return S3Storage(
+            bucket=bucket,
+            prefix=os.getenv("S3_PREFIX", "pdfs/"),
+            endpoint_url=os.getenv("S3_ENDPOINT_URL") or None,
+            region=os.getenv("AWS_REGION") or None,
+            multipart_chunk_bytes=int(float(os.getenv("PDF_STORE_MULTIPART_MB", "8")) * 1024 * 1024),
+            part_concurrency=int(os.getenv("PDF_STORE_PART_CONCURRENCY", "4")),
+        )
+    raise ValueError(f"알 수 없는 PDF_STORE_BACKEND: {backend}")
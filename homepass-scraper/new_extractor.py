@@ -1,3 +1,4 @@
+import argparse
 import json
 import pdfplumber
 import pandas as pd
@@ -7,8 +8,44 @@ import pymysql
 import requests
 import sys
 import os
+import socket
+import threading
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from predictor import preprocess_and_predict_group, load_model_assets
+from homepass_scraper import extraction_queue
+from homepass_scraper.http_cache import ConditionalHttpCache
+from homepass_scraper.pdf_store import PdfStore
+
+
+PDF_DOWNLOAD_TIMEOUT = float(os.getenv("PDF_DOWNLOAD_TIMEOUT", "60"))
+
+_http_cache = None
+_http_cache_lock = threading.Lock()
+
+
+def get_http_cache():
+    """PDF 조건부 요청 캐시 (스파이더와 같은 캐시 파일, 워커 스레드 공유)"""
+    global _http_cache
+    with _http_cache_lock:
+        if _http_cache is None:
+            _http_cache = ConditionalHttpCache.from_env()
+        return _http_cache
+
+
+_pdf_store = None
+_pdf_store_lock = threading.Lock()
+
+
+def get_pdf_store():
+    """스파이더가 수집 중에 저장한 PDF 저장소 (PDF_STORE_DIR / PDF_STORE_BACKEND, 스파이더와 같은 설정)"""
+    global _pdf_store
+    with _pdf_store_lock:
+        if _pdf_store is None:
+            _pdf_store = PdfStore.from_env()
+        return _pdf_store
 
 
 def log(message, level="INFO"):
@@ -27,6 +64,7 @@ class AnsimJutaekParser:
 
     def update_row(self, row, cursor):
         self.all_data = []
+        self.error_logs = []
         self.qualifications = {}
 
         parsed_content_raw = row["parsed_content"]
@@ -50,7 +88,7 @@ class AnsimJutaekParser:
 
         if pdf_url:
             try:
-                self.parse_file(pdf_url, row["title"], cursor)
+                self.parse_file(self._pdf_source(row), row["title"], cursor)
             except Exception as e:
                 print(f"파싱 중 에러 발생: {e}")
                 self.error_logs.append(f"[{pdf_url}] 파싱 실패: {e}")
@@ -215,10 +253,20 @@ class AnsimJutaekParser:
         """단일 PDF 파일에서 임대료 표를 찾아 파싱합니다."""
         print(f"--- {title} 처리 중 ---")
 
+        cache_url = None
         if file_path_or_url.startswith("http"):
-            response = requests.get(file_path_or_url)
-            response.raise_for_status()
-            file_path = io.BytesIO(response.content)
+            content, cached_meta = self._download_pdf(file_path_or_url, title)
+            if cached_meta is not None:
+                # 304 + 같은 공고의 이전 파싱 결과 → PDF 파싱 생략
+                print("PDF 변경 없음 (304): 이전 파싱 결과를 사용합니다.")
+                self.all_data = cached_meta.get("all_data") or []
+                if "추가" not in title:
+                    self.qualifications = cached_meta.get("qualifications") or {}
+                else:
+                    self._apply_original_qualifications(title, cursor)
+                return
+            file_path = io.BytesIO(content)
+            cache_url = file_path_or_url
         else:
             file_path = file_path_or_url
 
@@ -248,14 +296,71 @@ class AnsimJutaekParser:
                 qualifications = self._extract_qualifications(pdf)
                 self.qualifications = qualifications  # 클래스 변수에 저장
             else:
-                original_qual = None
-                if cursor:
-                    original_qual = self._get_original_eligibility(title, cursor)
+                self._apply_original_qualifications(title, cursor)
+
+        if cache_url:
+            get_http_cache().save_meta(
+                cache_url,
+                {
+                    "title": title,
+                    "all_data": self.all_data,
+                    # 추가 모집 공고는 원 공고 자격요건을 매번 DB에서 조회
+                    "qualifications": self.qualifications if "추가" not in title else None,
+                },
+            )
 
-                if original_qual:
-                    self.qualifications = original_qual
-                else:
-                    self.qualifications = {}
+    def _pdf_source(self, row):
+        """스파이더가 받아 둔 PDF(내용 주소 저장소, 원격 백엔드 포함)가 있으면 로컬 경로, 없으면 URL"""
+        sha256 = row.get("pdf_sha256")
+        if sha256:
+            local_path = get_pdf_store().fetch(sha256)
+            if local_path is not None:
+                return str(local_path)
+            log(f"⚠️ 저장소에 PDF가 없어 URL에서 받습니다: {sha256}", "WARN")
+        return row["original_pdf_url"]
+
+    def _apply_original_qualifications(self, title, cursor):
+        original_qual = None
+        if cursor:
+            original_qual = self._get_original_eligibility(title, cursor)
+
+        if original_qual:
+            self.qualifications = original_qual
+        else:
+            self.qualifications = {}
+
+    def _download_pdf(self, url, title):
+        """
+        조건부 요청으로 PDF 다운로드
+
+        Returns:
+            (본문, None) 또는 304이고 이전 파싱 결과가 있으면 (None, 파싱 결과)
+        """
+        cache = get_http_cache()
+        response = requests.get(
+            url,
+            headers=cache.conditional_headers(url, require_body=True),
+            timeout=PDF_DOWNLOAD_TIMEOUT,
+        )
+        if response.status_code == 304:
+            cache.touch(url)
+            meta = cache.load_meta(url)
+            if meta and meta.get("title") == title and meta.get("all_data"):
+                return None, meta
+            body = cache.load_body(url)
+            if body is not None:
+                return body, None
+            # 캐시 본문이 사라진 경우 조건 없이 다시 받음
+            response = requests.get(url, timeout=PDF_DOWNLOAD_TIMEOUT)
+
+        response.raise_for_status()
+        cache.store(
+            url,
+            response.headers.get("ETag"),
+            response.headers.get("Last-Modified"),
+            body=response.content,
+        )
+        return response.content, None
 
     def _parse_parsed_content(self, parsed_content, pdf_url) -> dict:
         data = {}
@@ -937,105 +1042,354 @@ DB_CONFIG = {
     "user": os.getenv("DB_USER"),
     "password": os.getenv("DB_PASSWORD"),
     "db": os.getenv("DB_NAME"),
-    "port": int(os.getenv("DB_PORT")),
+    "port": int(os.getenv("DB_PORT", "3306")),
     "charset": "utf8mb4",
     "cursorclass": pymysql.cursors.DictCursor,
 }
 
 
-def main():
+class ExtractionService:
+    """
+    PDF 추출 + 가격 예측 서비스 (다른 프로세스에서 import해서 사용 가능)
+
+    모델은 한 번만 로드하고, 파서 / DB 연결은 스레드마다 하나씩 재사용합니다.
+    python new_extractor.py --serve 로 띄우면 백엔드 ScraperRunner가 실행마다 깨워 쓰는
+    상주 워커가 됩니다 (실행마다 pdfplumber / pandas import, 모델 로드 비용이 들지 않음).
+    """
+
+    def __init__(self, db_config=None, model=None):
+        self.db_config = db_config or DB_CONFIG
+        self._model = model
+        self._model_lock = threading.Lock()
+        self._local = threading.local()
+        self.lock = threading.Lock()
+        self.success = 0
+        self.fail = 0
+
+    @property
+    def model(self):
+        if self._model is None:
+            with self._model_lock:
+                if self._model is None:
+                    log("🤖 ML 모델 로딩 중...", "INFO")
+                    self._model = load_model_assets()
+                    log("✅ ML 모델 로딩 완료", "INFO")
+        return self._model
+
+    def _parser(self):
+        parser = getattr(self._local, "parser", None)
+        if parser is None:
+            parser = self._local.parser = AnsimJutaekParser()
+        return parser
+
+    def _connection(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            try:
+                conn.ping(reconnect=True)
+                return conn
+            except pymysql.MySQLError:
+                conn = None
+        conn = self._local.conn = pymysql.connect(**self.db_config)
+        return conn
+
+    def close(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def _count(self, ok):
+        with self.lock:
+            if ok:
+                self.success += 1
+            else:
+                self.fail += 1
+
+    def process(self, announcement_id):
+        """
+        공고 1건 처리: PDF 파싱 → 가격 예측 → DB 업데이트 → 큐 완료 표시 (한 트랜잭션)
+
+        Returns:
+            처리 여부 (공고가 삭제된 경우 False)
+        """
+        conn = self._connection()
+        with conn.cursor() as cursor:
+            cursor.execute("SELECT * FROM Announcements WHERE announcement_id = %s", (announcement_id,))
+            row = cursor.fetchone()
+            if row is None:
+                log(f"   ⚠️ ID {announcement_id} 공고가 없어 건너뜁니다.", "WARN")
+                extraction_queue.mark_done(cursor, announcement_id)
+                conn.commit()
+                return False
+
+            title = row.get("title") or "제목 없음"
+            log(f"   📌 ID: {announcement_id} | Listing Number: {row.get('listing_number', 'N/A')}", "INFO")
+            log(f"   📌 제목: {title[:50]}{'...' if len(title) > 50 else ''}", "INFO")
+
+            # 1. 파서 실행
+            log(f"   [1/3] PDF 파싱 시작...", "DEBUG")
+            self._parser().update_row(row, cursor)
+            log(f"   [1/3] ✅ PDF 파싱 완료", "DEBUG")
+
+            # 2. 가격 예측 (방금 파싱한 price 기준 - 같은 트랜잭션에서 다시 조회)
+            log(f"   [2/3] 가격 예측 시작...", "DEBUG")
+            cursor.execute("SELECT * FROM Announcements WHERE announcement_id = %s", (announcement_id,))
+            row = cursor.fetchone() or row
+            updated_price_list = preprocess_and_predict_group(row, self.model)
+
+            if updated_price_list:
+                log(f"   [2/3] ✅ 가격 예측 완료: {len(updated_price_list)}개 항목", "DEBUG")
+
+                # 3. DB 업데이트
+                log(f"   [3/3] DB 업데이트 시작...", "DEBUG")
+                new_json_str = json.dumps(updated_price_list, ensure_ascii=False)
+                update_sql = "UPDATE Announcements SET price = %s WHERE announcement_id = %s"
+                cursor.execute(update_sql, (new_json_str, announcement_id))
+                log(f"   [3/3] ✅ DB 업데이트 완료", "DEBUG")
+            else:
+                log(f"   [2/3] ⚠️ 가격 예측 결과 없음", "WARN")
+
+            extraction_queue.mark_done(cursor, announcement_id)
+        conn.commit()
+        return True
+
+    def process_batch(self, announcement_ids, max_attempts=3):
+        """
+        공고 ID 묶음 처리 (실패한 공고는 큐에 실패 기록 후 다음 공고 계속)
+
+        Returns:
+            (성공 수, 실패 수)
+        """
+        success = fail = 0
+        for announcement_id in announcement_ids:
+            log(f"[{threading.current_thread().name}] 처리 시작 (ID: {announcement_id})", "INFO")
+            try:
+                if self.process(announcement_id):
+                    success += 1
+                    self._count(True)
+                    log(f"   ✅ 공고 처리 성공", "INFO")
+            except Exception as e:
+                fail += 1
+                self._count(False)
+                log(f"   ❌ 공고 처리 실패: {str(e)}", "ERROR")
+                log(f"   상세 에러:\n{traceback.format_exc()}", "ERROR")
+                conn = self._connection()
+                conn.rollback()
+                with conn.cursor() as cursor:
+                    extraction_queue.mark_failed(cursor, announcement_id, str(e), max_attempts)
+                conn.commit()
+            log("-" * 80, "INFO")
+        return success, fail
+
+    def claim(self, worker_id, limit):
+        return extraction_queue.claim(self._connection(), worker_id, limit)
+
+    def remaining(self):
+        conn = self._connection()
+        with conn.cursor() as cursor:
+            remaining = extraction_queue.pending_count(cursor)
+        conn.commit()
+        return remaining
+
+
+class QueueControl:
+    """
+    큐 소비 모드
+
+    - follow: 큐가 비어도 poll_interval마다 다시 확인 (스파이더 실행 중)
+    - drain: 큐를 비우면 idle로 전환
+    - idle: 다음 명령까지 대기 (DB 폴링 없음)
+    - stop: 프로세스 종료
+    """
+
+    def __init__(self, mode):
+        self.mode = mode
+        self.changed = threading.Condition()
+
+    def set(self, mode):
+        with self.changed:
+            self.mode = mode
+            self.changed.notify_all()
+
+    def transition(self, current, mode):
+        """현재 모드가 current일 때만 전환 (그 사이 들어온 명령을 덮어쓰지 않도록)"""
+        with self.changed:
+            if self.mode != current:
+                return False
+            self.mode = mode
+            self.changed.notify_all()
+            return True
+
+    def wait(self, timeout=None):
+        with self.changed:
+            self.changed.wait(timeout)
+
+
+def should_stop(args, service):
+    """
+    1회 실행 모드 종료 조건: (follow 모드가 아니거나 스파이더가 종료 파일을 만든 뒤) 큐가 비었을 때
+    """
+    if args.follow and not (args.stop_file and os.path.exists(args.stop_file)):
+        return False
+    return service.remaining() == 0
+
+
+def worker_loop(worker_no, args, service, control=None):
+    """
+    큐 소비 워커
+
+    control이 없으면 1회 실행 (종료 조건은 should_stop), 있으면 상주 모드 (명령에 따라 대기/소비)
+    """
+    worker_id = f"{socket.gethostname()}:{os.getpid()}:{worker_no}"
+    try:
+        while True:
+            if control is not None:
+                if control.mode == "stop":
+                    return
+                if control.mode == "idle":
+                    control.wait()
+                    continue
+
+            ids = service.claim(worker_id, args.batch_size)
+            if ids:
+                service.process_batch(ids, args.max_attempts)
+                continue
+
+            if control is None:
+                if should_stop(args, service):
+                    return
+                time.sleep(args.poll_interval)
+            elif control.mode == "drain" and service.remaining() == 0:
+                if control.transition("drain", "idle"):
+                    log("💤 큐 처리 완료 - 다음 실행까지 대기", "INFO")
+            else:
+                control.wait(args.poll_interval)
+    finally:
+        service.close()
+
+
+def read_commands(control):
+    """
+    상주 모드 명령 수신 (표준 입력 한 줄에 하나: follow | drain | idle | stop)
+    표준 입력이 닫히면(백엔드 종료) 워커도 종료합니다.
+    """
+    for line in sys.stdin:
+        command = line.strip().lower()
+        if command in ("follow", "drain", "idle", "stop"):
+            log(f"📨 명령 수신: {command}", "INFO")
+            control.set(command)
+            if command == "stop":
+                return
+    control.set("stop")
+
+
+def parse_args(argv=None):
+    arg_parser = argparse.ArgumentParser(description="공고 PDF 추출 / 가격 예측 (extraction_queue 소비)")
+    arg_parser.add_argument("--follow", action="store_true",
+                            help="큐가 비어도 종료하지 않고 대기 (--stop-file이 생기고 큐가 비면 종료)")
+    arg_parser.add_argument("--stop-file", default=None,
+                            help="스파이더 종료 후 생성되는 파일 경로 (follow 모드 종료 신호)")
+    arg_parser.add_argument("--serve", action="store_true",
+                            help="상주 워커 모드: 모델을 한 번 로드하고 표준 입력 명령에 따라 큐를 소비")
+    arg_parser.add_argument("--workers", type=int, default=int(os.getenv("EXTRACTOR_WORKERS", "2")))
+    arg_parser.add_argument("--batch-size", type=int, default=1, help="워커가 한 번에 가져올 작업 수")
+    arg_parser.add_argument("--poll-interval", type=float, default=2.0, help="큐가 비었을 때 대기 시간(초)")
+    arg_parser.add_argument("--max-attempts", type=int, default=3, help="실패 시 재시도 횟수")
+    arg_parser.add_argument("--stale-minutes", type=int, default=30,
+                            help="이 시간 이상 processing 상태인 작업은 다시 pending으로")
+    arg_parser.add_argument("--backfill", type=int, default=50,
+                            help="가격 정보가 없는 기존 공고를 최신순으로 최대 N건 큐에 등록 (0이면 사용 안 함)")
+    return arg_parser.parse_args(argv)
+
+
+def prepare_queue(args):
+    conn = pymysql.connect(**DB_CONFIG)
+    try:
+        with conn.cursor() as cursor:
+            extraction_queue.ensure_table(cursor)
+            released = extraction_queue.release_stale(cursor, args.stale_minutes)
+            if released:
+                log(f"♻️ 중단된 작업 {released}건을 다시 대기 상태로 전환", "WARN")
+            if args.backfill > 0:
+                added = extraction_queue.backfill(cursor, args.backfill)
+                if added:
+                    log(f"📥 가격 정보가 없는 기존 공고 {added}건을 큐에 등록", "INFO")
+            pending = extraction_queue.pending_count(cursor)
+        conn.commit()
+        return pending
+    finally:
+        conn.close()
+
+
+def serve(args):
+    """상주 워커: 모델을 먼저 로드해 두고, 시작 시 남은 큐를 비운 뒤 명령을 기다림"""
+    service = ExtractionService()
+    service.model  # noqa: B018 - 첫 실행 전에 미리 로드
+    control = QueueControl("drain")
+    threading.Thread(target=read_commands, args=(control,), daemon=True).start()
+
+    workers = max(1, args.workers)
+    log(f"🟢 상주 추출 워커 준비 완료 (워커: {workers})", "INFO")
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="extractor") as executor:
+        futures = [executor.submit(worker_loop, n, args, service, control) for n in range(1, workers + 1)]
+        for future in futures:
+            future.result()
+    log(f"🔌 상주 추출 워커 종료 (성공 {service.success}건 / 실패 {service.fail}건)", "INFO")
+
+
+def main(argv=None):
+    args = parse_args(argv)
     start_time = datetime.now()
     log("=" * 80, "INFO")
     log(f"🚀 New Extractor 시작", "INFO")
     log(f"   시작 시간: {start_time.strftime('%Y-%m-%d %H:%M:%S')}", "INFO")
+    if args.serve:
+        mode = "상주 워커"
+    elif args.follow:
+        mode = "follow (스파이더와 동시 실행)"
+    else:
+        mode = "큐 비우기"
+    log(f"   모드: {mode} | 워커: {args.workers}", "INFO")
     log("=" * 80, "INFO")
-    
-    parser = AnsimJutaekParser()
-    conn = None
 
     try:
         log("📊 DB 연결 시도 중...", "INFO")
         log(f"   호스트: {DB_CONFIG['host']}", "DEBUG")
-        log(f"   데이터베이스: {DB_CONFIG['database']}", "DEBUG")
-        
-        conn = pymysql.connect(**DB_CONFIG)
-        log("✅ DB 연결 성공", "INFO")
+        log(f"   데이터베이스: {DB_CONFIG['db']}", "DEBUG")
 
-        cursor = conn.cursor()
+        pending = prepare_queue(args)
+        log(f"📋 큐 대기 작업 {pending}건", "INFO")
 
-        select_sql = "SELECT * FROM Announcements WHERE listing_number is not null order by listing_number desc limit 5"
-        log(f"🔍 쿼리 실행: {select_sql}", "DEBUG")
+        removed = get_http_cache().prune()
+        if removed:
+            log(f"🧹 PDF 조건부 요청 캐시 정리: {removed}개 항목 삭제", "INFO")
 
-        cursor.execute(select_sql)
-        rows = cursor.fetchall()
-        log(f"📋 총 {len(rows)}개의 처리 대상 발견", "INFO")
-        
-        if len(rows) == 0:
-            log("⚠️ 처리할 공고가 없습니다.", "WARN")
+        if args.serve:
+            serve(args)
             return
 
-        success_count = 0
-        fail_count = 0
+        if pending == 0 and not args.follow:
+            log("⚠️ 처리할 공고가 없습니다.", "WARN")
+            return
 
-        log("🤖 ML 모델 로딩 중...", "INFO")
-        model = load_model_assets()
-        log("✅ ML 모델 로딩 완료", "INFO")
+        service = ExtractionService()
+        service.model  # noqa: B018
         log("-" * 80, "INFO")
 
-        for idx, row in enumerate(rows, 1):
-            announcement_id = row["announcement_id"]
-            title = row.get("title", "제목 없음")
-            listing_number = row.get("listing_number", "N/A")
-            
-            log(f"[{idx}/{len(rows)}] 처리 시작", "INFO")
-            log(f"   📌 ID: {announcement_id}", "INFO")
-            log(f"   📌 Listing Number: {listing_number}", "INFO")
-            log(f"   📌 제목: {title[:50]}{'...' if len(title) > 50 else ''}", "INFO")
-            
-            try:
-                # 1. 파서 실행
-                log(f"   [1/3] PDF 파싱 시작...", "DEBUG")
-                parser.update_row(row, cursor)
-                log(f"   [1/3] ✅ PDF 파싱 완료", "DEBUG")
-                
-                # 2. 가격 예측
-                log(f"   [2/3] 가격 예측 시작...", "DEBUG")
-                updated_price_list = preprocess_and_predict_group(row, model)
-                
-                if updated_price_list:
-                    log(f"   [2/3] ✅ 가격 예측 완료: {len(updated_price_list)}개 항목", "DEBUG")
-                    
-                    # 3. DB 업데이트
-                    log(f"   [3/3] DB 업데이트 시작...", "DEBUG")
-                    new_json_str = json.dumps(updated_price_list, ensure_ascii=False)
-                    update_sql = "UPDATE Announcements SET price = %s WHERE announcement_id = %s"
-                    cursor.execute(update_sql, (new_json_str, announcement_id))
-                    log(f"   [3/3] ✅ DB 업데이트 완료", "DEBUG")
-                else:
-                    log(f"   [2/3] ⚠️ 가격 예측 결과 없음", "WARN")
-                
-                success_count += 1
-                log(f"   ✅ 공고 처리 성공", "INFO")
-                
-            except Exception as e:
-                fail_count += 1
-                log(f"   ❌ 공고 처리 실패: {str(e)}", "ERROR")
-                import traceback
-                log(f"   상세 에러:\n{traceback.format_exc()}", "ERROR")
-            
-            log("-" * 80, "INFO")
+        workers = max(1, args.workers)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="extractor") as executor:
+            futures = [executor.submit(worker_loop, n, args, service) for n in range(1, workers + 1)]
+            for future in futures:
+                future.result()
 
-        log("💾 DB 커밋 시작...", "INFO")
-        conn.commit()
-        log("✅ DB 커밋 완료", "INFO")
-        
         end_time = datetime.now()
         elapsed = (end_time - start_time).total_seconds()
-        
+
         log("=" * 80, "INFO")
         log("🎉 처리 완료!", "INFO")
-        log(f"   ✅ 성공: {success_count}건", "INFO")
-        log(f"   ❌ 실패: {fail_count}건", "INFO")
+        log(f"   ✅ 성공: {service.success}건", "INFO")
+        log(f"   ❌ 실패: {service.fail}건", "INFO")
         log(f"   ⏱️  소요 시간: {elapsed:.2f}초", "INFO")
         log(f"   🕐 종료 시간: {end_time.strftime('%Y-%m-%d %H:%M:%S')}", "INFO")
         log("=" * 80, "INFO")
@@ -1043,23 +1397,11 @@ def main():
     except Exception as e:
         log("=" * 80, "ERROR")
         log(f"💥 치명적 에러 발생: {str(e)}", "ERROR")
-        import traceback
         log(f"상세 에러:\n{traceback.format_exc()}", "ERROR")
         log("=" * 80, "ERROR")
-        
-        if conn:
-            log("⏪ 트랜잭션 롤백 시도...", "WARN")
-            try:
-                conn.rollback()
-                log("✅ 롤백 완료", "INFO")
-            except Exception as rollback_err:
-                log(f"❌ 롤백 실패: {rollback_err}", "ERROR")
-
-    finally:
-        if conn:
-            log("🔌 DB 연결 종료 중...", "INFO")
-            conn.close()
-            log("✅ DB 연결 종료 완료", "INFO")
+        if args.serve:
+            # 상주 워커는 비정상 종료 코드로 알려 ScraperRunner가 다음 실행에서 다시 띄우도록
+            sys.exit(1)
 
 
 if __name__ == "__main__":
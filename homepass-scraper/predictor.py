@@ -27,7 +27,7 @@ DB_CONFIG = {
     "user": os.getenv("DB_USER"),
     "password": os.getenv("DB_PASSWORD"),
     "db": os.getenv("DB_NAME"),
-    "port": int(os.getenv("DB_PORT")),
+    "port": int(os.getenv("DB_PORT", "3306")),
     "charset": "utf8mb4",
     "cursorclass": pymysql.cursors.DictCursor,
 }
@@ -37,15 +37,18 @@ def get_db_connection():
     return pymysql.connect(**DB_CONFIG)
 
 
-def load_model_assets():
-    """모델과 전처리기 로드"""
+MODEL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "catboost_model_except_top_brand.pkl")
+
+
+def load_model_assets(path=MODEL_PATH):
+    """모델과 전처리기 로드 (실행 위치와 무관하게 이 파일 옆의 모델 사용)"""
     try:
-        model = joblib.load("catboost_model_except_top_brand.pkl")
+        model = joblib.load(path)
         print("✅ 모델 및 전처리기 로드 완료")
         return model
     except Exception as e:
         print(f"❌ 모델 로드 실패: {e}")
-        exit()
+        raise
 
 
 def preprocess_and_predict_group(row, model):
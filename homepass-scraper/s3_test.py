@@ -1,29 +1,106 @@
-import os, io, requests, boto3
+"""
+PDF 저장소(S3 백엔드) 점검 스크립트
 
-BUCKET = os.environ.get("BUCKET", "inha-capstone-10-s3") 
-REGION = os.environ.get("AWS_REGION", "us-west-2")
+    # 로컬 MinIO
+    S3_ENDPOINT_URL=http://localhost:9000 AWS_ACCESS_KEY_ID=minioadmin AWS_SECRET_ACCESS_KEY=minioadmin \
+        python s3_test.py
 
-s3 = boto3.client("s3", region_name=REGION)
+    # S3_ENDPOINT_URL이 없으면 moto 서버를 띄워 사용 (pip install -r requirements-dev.txt)
+    python s3_test.py
 
-def download_pdf(url: str) -> bytes:
-    r = requests.get(url, timeout=30)
-    r.raise_for_status()
-    return r.content
+실제 AWS 버킷 대신 S3 호환 대체 서버에서 다음을 확인합니다.
+- 멀티파트 조각 크기보다 큰 PDF가 스트리밍 업로드되는지
+- 같은 sha256이 이미 있으면 업로드를 생략하는지 (다른 호스트 = 다른 로컬 캐시)
+- 로컬 캐시가 빈 호스트가 원격에서 받아 같은 내용을 얻는지
+"""
 
-def upload_pdf(key: str, data: bytes):
-    s3.upload_fileobj(io.BytesIO(data), BUCKET, key, ExtraArgs={"ContentType": "application/pdf"})
+import os
+import shutil
+import tempfile
 
-def get_pdf(key: str) -> bytes:
-    obj = s3.get_object(Bucket=BUCKET, Key=key)
-    return obj["Body"].read()
+from homepass_scraper.pdf_store import PdfStore, sha256_file
+from homepass_scraper.storage import S3Storage
 
-if __name__ == "__main__":
-    url = "https://www.w3.org/WAI/ER/tests/xhtml/testfiles/resources/pdf/dummy.pdf"
-    key = "raw/sample.pdf"
+BUCKET = os.environ.get("S3_BUCKET", "homepass-pdf-test")
+MULTIPART_BYTES = 5 * 1024 * 1024  # S3 멀티파트 최소 조각 크기
+
+
+def start_stand_in():
+    """S3_ENDPOINT_URL이 없으면 moto 서버를 띄워 그 주소를 반환"""
+    endpoint = os.environ.get("S3_ENDPOINT_URL")
+    if endpoint:
+        return endpoint, None
+    from moto.server import ThreadedMotoServer
+
+    server = ThreadedMotoServer(ip_address="127.0.0.1", port=0)
+    server.start()
+    host, port = server.get_host_and_port()
+    os.environ.setdefault("AWS_ACCESS_KEY_ID", "testing")
+    os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "testing")
+    return f"http://{host}:{port}", server
+
+
+def make_storage(endpoint):
+    return S3Storage(
+        bucket=BUCKET,
+        prefix="pdfs/",
+        endpoint_url=endpoint,
+        region=os.environ.get("AWS_REGION", "us-east-1"),
+        multipart_chunk_bytes=MULTIPART_BYTES,
+        part_concurrency=4,
+    )
+
+
+def fake_pdf(seed: int, size: int) -> bytes:
+    header = f"%PDF-1.4\n% homepass s3_test {seed}\n".encode()
+    return header + os.urandom(size - len(header))
 
-    blob = download_pdf(url)
-    upload_pdf(key, blob)
-    print(f"uploaded s3://{BUCKET}/{key}")
 
-    data = get_pdf(key)
-    print(f"downloaded bytes {len(data)}")
+def main():
+    endpoint, server = start_stand_in()
+    workdir = tempfile.mkdtemp(prefix="pdfstore-")
+    try:
+        storage = make_storage(endpoint)
+        try:
+            storage.client.create_bucket(Bucket=BUCKET)
+        except storage.client.exceptions.BucketAlreadyOwnedByYou:
+            pass
+        print(f"endpoint: {endpoint} | bucket: {BUCKET}")
+
+        # 1) 크롤러 호스트 A: 큰 PDF(멀티파트) + 작은 PDF + 중복 PDF를 병렬 업로드
+        bodies = [fake_pdf(1, 12 * 1024 * 1024), fake_pdf(2, 200 * 1024), fake_pdf(3, 6 * 1024 * 1024)]
+        host_a = PdfStore(os.path.join(workdir, "a"), remote=storage, upload_workers=2)
+        hashes = [host_a.put(body)[0] for body in bodies]
+        host_a.put(bodies[0])  # 같은 내용 → 로컬/원격 모두 한 번만
+        stats_a = host_a.wait_uploads()
+        host_a.close()
+        print(f"host A upload: {stats_a}")
+        assert stats_a == {"uploaded": 3, "skipped": 0, "failed": 0}, stats_a
+
+        # 2) 크롤러 호스트 B: 같은 PDF를 받아도 원격에 이미 있으므로 업로드 생략
+        host_b = PdfStore(os.path.join(workdir, "b"), remote=make_storage(endpoint), upload_workers=2)
+        for body in bodies:
+            host_b.put(body)
+        stats_b = host_b.wait_uploads()
+        host_b.close()
+        print(f"host B upload: {stats_b}")
+        assert stats_b == {"uploaded": 0, "skipped": 3, "failed": 0}, stats_b
+
+        # 3) 추출 호스트 C: 로컬 캐시가 비어 있어도 원격에서 스트리밍으로 받아 사용
+        host_c = PdfStore(os.path.join(workdir, "c"), remote=make_storage(endpoint))
+        for sha256 in hashes:
+            path = host_c.fetch(sha256)
+            assert path is not None and sha256_file(path) == sha256, sha256
+            print(f"host C fetch: {sha256[:12]}… {path.stat().st_size:,} bytes")
+        assert host_c.fetch("0" * 64) is None
+        host_c.close()
+
+        print("✅ S3 PDF 저장소 점검 완료")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+        if server is not None:
+            server.stop()
+
+
+if __name__ == "__main__":
+    main()
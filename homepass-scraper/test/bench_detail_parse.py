@@ -0,0 +1,170 @@
+# bench_detail_parse.py
+"""
+SOCO 상세 페이지 파싱 벤치마크
+
+    python test/bench_detail_parse.py --number 200
+    python test/bench_detail_parse.py --fixtures path/to/saved_pages
+
+저장해 둔 상세 페이지(test/fixtures/*.html)로 기존 방식(항목마다 CSS/XPath 재평가,
+body 전체 텍스트 / response.text 전체 정규식 검색)과 DetailPage 한 번 훑기를 비교합니다.
+목록 행에 값이 있는 경우(일반적인 수집)와 없는 경우(fallback 전부 계산)를 나눠 측정하고,
+두 방식의 결과가 같은지도 확인합니다.
+"""
+
+import argparse
+import re
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from scrapy.http import HtmlResponse  # noqa: E402
+
+from homepass_scraper.spiders.soco_board_spider import SocoBoardSpider  # noqa: E402
+
+FIXTURE_DIR = Path(__file__).resolve().parent / "fixtures"
+
+LIST_ROW = {
+    "nttSj": "[민간] 청년안심주택 모집공고",
+    "optn3": "주택정책과",
+    "ntceBgnde": "2025-09-01",
+    "optn4": "2025-10-01",
+    "optn2": "2",
+    "optn5": "1",
+}
+
+
+# ---------------------------------------------------------------------- #
+# 기존 방식 (변경 전 SocoBoardSpider 상세 파싱)
+# ---------------------------------------------------------------------- #
+def legacy_title(response):
+    title = response.css('meta[property="og:title"]::attr(content)').get()
+    if title:
+        return title.strip()
+    title = response.css("title::text").get()
+    return title.strip() if title else response.url
+
+
+def legacy_department(response):
+    text = " ".join(response.css("body *::text").getall())
+    match = re.search(r"(담당부서|담당자)\s*[:：]\s*([^\s]+)", text)
+    return match.group(2).strip() if match else None
+
+
+def legacy_table_value(response, label):
+    xpath = f'//th[contains(normalize-space(), "{label}")]/following-sibling::td[1]//text()'
+    texts = response.xpath(xpath).getall()
+    cleaned = " ".join(t.strip() for t in texts if t.strip())
+    return cleaned or None
+
+
+def legacy_link(response, label):
+    link = response.xpath(f'//p[contains(., "{label}")]//a/@href').get()
+    return response.urljoin(link) if link else None
+
+
+def legacy_pdf_link(response):
+    href = response.css('ul.view_data span.file a[href*="fileDown.do"]::attr(href)').get()
+    return response.urljoin(href) if href else None
+
+
+def legacy_board_content_text(response):
+    node = response.css("div.board_cont")
+    if not node:
+        return None
+    text = node.xpath("string()").get()
+    if not text:
+        return None
+    return re.sub(r"\s+", " ", text).strip() or None
+
+
+def legacy_fields(response, row):
+    # 변경 전 parse_detail과 같은 순서 / 같은 단락 평가
+    return {
+        "title": row.get("nttSj") or legacy_title(response),
+        "department": row.get("optn3") or legacy_department(response),
+        "post_date": row.get("ntceBgnde") or legacy_table_value(response, "공고게시일"),
+        "apply_date": row.get("optn4") or legacy_table_value(response, "청약신청일"),
+        "category": row.get("optn2") or legacy_table_value(response, "카테고리"),
+        "application_link": legacy_link(response, "청약신청 페이지"),
+        "homepage_link": legacy_link(response, "단지 홈페이지"),
+        "original_pdf_url": legacy_pdf_link(response),
+        "board_content_text": legacy_board_content_text(response),
+    }
+
+
+# ---------------------------------------------------------------------- #
+# 현재 방식
+# ---------------------------------------------------------------------- #
+def current_item(spider, response, row):
+    return spider._build_item(response, 1, 1, row)
+
+
+def load_responses(fixture_dir):
+    responses = []
+    for path in sorted(Path(fixture_dir).glob("*.html")):
+        url = f"https://soco.seoul.go.kr/youth/bbs/BMSR00015/view.do?menuNo=400008&boardId={path.stem}"
+        responses.append(HtmlResponse(url=url, body=path.read_bytes(), encoding="utf-8"))
+    return responses
+
+
+def fresh(response):
+    # Response.selector가 캐시되므로 매 반복 새 응답으로 (실제 수집처럼 HTML 파싱 비용 포함)
+    return response.replace(body=response.body)
+
+
+def check_same(spider, response):
+    """DB에 들어가는 값이 기존 방식과 같은지 확인 (목록 행이 없는 경우 = fallback 전부)"""
+    legacy = legacy_fields(response, {})
+    item = current_item(spider, response, {})
+    board_text = (item.get("parsed_content") or {}).get("board_content_text")
+    pairs = [
+        ("title", legacy["title"], item["title"]),
+        ("department", legacy["department"], item["department"]),
+        ("post_date", spider._clean_date(legacy["post_date"]), item["post_date"]),
+        ("apply_date", spider._clean_date(legacy["apply_date"]), item["apply_date"]),
+        ("category", legacy["category"], item["category"]),
+        ("application_link", legacy["application_link"], item["application_link"]),
+        ("homepage_link", legacy["homepage_link"], item["homepage_link"]),
+        ("original_pdf_url", legacy["original_pdf_url"], item["original_pdf_url"]),
+        ("board_content_text", legacy["board_content_text"], board_text),
+    ]
+    mismatches = [(name, a, b) for name, a, b in pairs if a != b]
+    for name, a, b in mismatches:
+        print(f"  ⚠️ {name}: legacy={a!r} current={b!r}")
+    return not mismatches
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--number", type=int, default=200, help="페이지당 반복 횟수")
+    parser.add_argument("--fixtures", default=str(FIXTURE_DIR), help="저장한 상세 페이지 HTML 디렉터리")
+    args = parser.parse_args()
+
+    responses = load_responses(args.fixtures)
+    if not responses:
+        print(f"{args.fixtures}에 *.html 파일이 없습니다.")
+        return
+
+    # __init__은 DB에서 체크포인트를 읽으므로 건너뜀 (상세 파싱은 인스턴스 상태를 쓰지 않음)
+    spider = SocoBoardSpider.__new__(SocoBoardSpider)
+    spider.title_keywords = []
+
+    print(f"fixtures: {len(responses)}개, 페이지당 {args.number}회\n")
+    for response in responses:
+        name = response.url.rsplit("=", 1)[-1]
+        same = check_same(spider, response)
+        print(f"[{name}] 결과 일치: {'✅' if same else '❌'} ({len(response.body) / 1024:.1f} KB)")
+        for label, row in (("목록 값 있음", LIST_ROW), ("fallback 전부", {})):
+            legacy_t = timeit.timeit(lambda: legacy_fields(fresh(response), row), number=args.number)
+            current_t = timeit.timeit(lambda: current_item(spider, fresh(response), row), number=args.number)
+            print(
+                f"  {label:<10} legacy {legacy_t / args.number * 1000:7.3f} ms"
+                f" | current {current_t / args.number * 1000:7.3f} ms"
+                f" | x{legacy_t / current_t:5.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()